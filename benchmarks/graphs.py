@@ -0,0 +1,204 @@
+"""Generators of synthetic graph data for benchmarks.
+
+Graphs are generated as the data stored in .ndz files, using only app
+defined nodes (no node packs are needed):
+
+- a single data node provides the value from which the graph starts;
+- nodes with a single input are nodes of the abs() builtin;
+- nodes with two inputs are operator nodes performing an addition.
+
+The value provided is 0.0, so executing graphs of any size and shape
+always produces the same small outputs.
+
+Shapes available:
+
+chain
+    each node feeds the next one.
+fanout
+    the data node feeds all other nodes, which don't depend on each
+    other, forming a single wide generation.
+diamonds
+    each node feeds the next two ones, so each node has two parents.
+random
+    each node gets one or two parents chosen randomly among the nodes
+    created before it, forming a random directed acyclic graph.
+"""
+
+### standard library import
+from random import Random
+
+
+### constants
+
+## nodes per row of the grid in which nodes are placed
+ROW_LENGTH = 50
+
+NODE_SPACING = 200
+
+DATA_NODE_TITLE = 'value'
+
+
+### node data
+
+def get_data_node_data(node_id):
+    """Return data for node holding a float in a widget."""
+    return {
+        'id': node_id,
+        'commented_out': False,
+        'midtop': get_node_midtop(node_id),
+        'title': DATA_NODE_TITLE,
+        'widget_data': {
+            'widget_name': 'int_float_entry',
+            'widget_kwargs': {
+                'value': 0.0,
+                'numeric_classes_hint': 'int_float',
+            },
+        },
+    }
+
+
+def get_builtin_node_data(node_id):
+    """Return data for node of the abs() builtin."""
+    return {
+        'id': node_id,
+        'commented_out': False,
+        'midtop': get_node_midtop(node_id),
+        'mode': 'expanded_signature',
+        'builtin_id': 'abs',
+        'param_widget_value_map': {},
+        'subparam_keyword_map': {},
+        'subparam_map': {},
+        'subparam_unpacking_map': {},
+        'subparam_widget_map': {},
+    }
+
+
+def get_operator_node_data(node_id):
+    """Return data for node performing an addition."""
+    return {
+        'id': node_id,
+        'commented_out': False,
+        'midtop': get_node_midtop(node_id),
+        'mode': 'expanded_signature',
+        'operation_id': 'a + b',
+    }
+
+
+def get_node_midtop(node_id):
+    """Return position of node in grid."""
+    return (
+        float((node_id % ROW_LENGTH) * NODE_SPACING),
+        float((node_id // ROW_LENGTH) * NODE_SPACING),
+    )
+
+
+### parents of each node, per shape
+###
+### each function returns a list whose items are tuples with the ids of
+### the parents of the node with the same index; the first node is the
+### data node, so it has no parents
+
+def get_chain_parents(size, rng):
+    """Return parents where each node feeds the next one."""
+    return [()] + [(node_id - 1,) for node_id in range(1, size)]
+
+
+def get_fanout_parents(size, rng):
+    """Return parents where the first node feeds all the others."""
+    return [()] + [(0,) for _ in range(1, size)]
+
+
+def get_diamond_parents(size, rng):
+    """Return parents where each node feeds the next two ones."""
+    return (
+        [(), (0,)]
+        + [(node_id - 2, node_id - 1) for node_id in range(2, size)]
+    )[:size]
+
+
+def get_random_parents(size, rng):
+    """Return parents forming random directed acyclic graph."""
+    return [()] + [
+        tuple(rng.sample(range(node_id), min(node_id, rng.randint(1, 2))))
+        for node_id in range(1, size)
+    ]
+
+
+SHAPE_TO_PARENTS_GETTER = {
+    'chain': get_chain_parents,
+    'fanout': get_fanout_parents,
+    'diamonds': get_diamond_parents,
+    'random': get_random_parents,
+}
+
+SHAPES = tuple(SHAPE_TO_PARENTS_GETTER)
+
+
+### main function
+
+def generate_graph_data(shape, size, seed=0):
+    """Return data of .ndz file with graph of given shape and size.
+
+    Parameters
+    ==========
+
+    shape (string)
+        name of the shape of the graph; one of the keys of the
+        SHAPE_TO_PARENTS_GETTER map.
+    size (int)
+        number of nodes in the graph (at least 1).
+    seed (int)
+        seed for the random choices made when generating the graph,
+        so the same graph is generated each time.
+    """
+    parents_list = SHAPE_TO_PARENTS_GETTER[shape](size, Random(seed))
+
+    nodes = {}
+    children_map = {}
+
+    for node_id, parent_ids in enumerate(parents_list):
+
+        ## define node data based on the number of parents
+
+        if not parent_ids:
+            nodes[node_id] = get_data_node_data(node_id)
+
+        elif len(parent_ids) == 1:
+            nodes[node_id] = get_builtin_node_data(node_id)
+
+        else:
+            nodes[node_id] = get_operator_node_data(node_id)
+
+        ## list the input sockets of the node as children of the
+        ## output sockets of its parents
+
+        param_names = ('x',) if len(parent_ids) == 1 else ('a', 'b')
+
+        for parent_id, param_name in zip(parent_ids, param_names):
+
+            children_map.setdefault(parent_id, []).append(
+                {'class_name': 'InputSocket', 'id': (node_id, param_name)}
+            )
+
+    return {
+        'node_packs': [],
+        'installed_node_packs': [],
+        'nodes': nodes,
+        'parent_sockets': [
+            {
+                'class_name': 'OutputSocket',
+                'id': (
+                    parent_id,
+                    DATA_NODE_TITLE if parent_id == 0 else 'output',
+                ),
+                'children': children,
+            }
+            for parent_id, children in children_map.items()
+        ],
+        'text_blocks': [],
+    }
+
+
+def count_edges(data):
+    """Return number of connections in graph data."""
+    return sum(len(item['children']) for item in data['parent_sockets'])
@@ -0,0 +1,256 @@
+"""Benchmark of the memory used to execute graphs with large outputs.
+
+Measures the peak memory allocated while executing graphs whose nodes
+produce large outputs, to check that outputs are released as soon as
+the nodes consuming them are finished.
+
+Graphs are generated using only app defined nodes: a data node holds
+the size of the outputs in bytes and nodes of the bytearray() builtin
+produce the outputs (each copying the output received).
+
+Shapes available:
+
+chain
+    each node feeds the next one; ideally, only the output of a node
+    and the output of the node feeding it are alive at any moment.
+fanout
+    a node feeds all other ones, which don't depend on each other.
+
+Each graph is executed:
+
+- one node at a time;
+- with worker threads;
+- storing the outputs of nodes which aren't consumed by other nodes
+  (like when executing graphs from the command line).
+
+The peak memory is measured with the tracemalloc module, so only memory
+allocated by Python is considered. The peak is also given in number of
+outputs (peak memory divided by the size of each output).
+
+Run from the root of the repository:
+
+    python benchmarks/memory.py [--nodes NODES] [--output-size MEGABYTES]
+"""
+
+### standard library imports
+
+from os import environ
+
+from sys import path
+
+from argparse import ArgumentParser
+
+from pathlib import Path
+
+from gc import collect
+
+import tracemalloc
+
+
+### constants
+
+REPOSITORY_DIR = Path(__file__).resolve().parents[1]
+
+DATA_NODE_TITLE = 'size'
+
+BYTES_PER_MEGABYTE = 1024 ** 2
+
+## names of the execution modes, along with the user preferences and
+## whether outputs are stored
+
+EXECUTION_MODES = (
+    ('sequential', {'EXECUTION_WORKERS': 1}, False),
+    ('threads', {'EXECUTION_WORKERS': 4}, False),
+    ('storing outputs', {'EXECUTION_WORKERS': 1}, True),
+)
+
+
+### graph data
+
+def generate_graph_data(shape, size, output_size):
+    """Return data of .ndz file with graph of given shape and size.
+
+    Parameters
+    ==========
+
+    shape (string)
+        either 'chain' or 'fanout'.
+    size (int)
+        number of nodes in the graph, besides the data node.
+    output_size (int)
+        size of the outputs in bytes.
+    """
+    nodes = {
+        0: {
+            'id': 0,
+            'commented_out': False,
+            'midtop': (0.0, 0.0),
+            'title': DATA_NODE_TITLE,
+            'widget_data': {
+                'widget_name': 'int_float_entry',
+                'widget_kwargs': {
+                    'value': output_size,
+                    'numeric_classes_hint': 'int',
+                },
+            },
+        },
+    }
+
+    children_map = {}
+
+    for node_id in range(1, size + 1):
+
+        nodes[node_id] = {
+            'id': node_id,
+            'commented_out': False,
+            'midtop': (node_id * 200.0, 0.0),
+            'mode': 'expanded_signature',
+            'builtin_id': 'bytearray(source)',
+            'param_widget_value_map': {},
+            'subparam_keyword_map': {},
+            'subparam_map': {},
+            'subparam_unpacking_map': {},
+            'subparam_widget_map': {},
+        }
+
+        ## the first node receives the size from the data node; in a
+        ## chain, the other nodes receive the output of the previous
+        ## one, while in a fan-out they receive the output of the first
+
+        parent_id = (
+            node_id - 1
+            if shape == 'chain' or node_id == 1
+            else 1
+        )
+
+        children_map.setdefault(parent_id, []).append(
+            {'class_name': 'InputSocket', 'id': (node_id, 'source')}
+        )
+
+    return {
+        'node_packs': [],
+        'installed_node_packs': [],
+        'nodes': nodes,
+        'parent_sockets': [
+            {
+                'class_name': 'OutputSocket',
+                'id': (
+                    parent_id,
+                    DATA_NODE_TITLE if parent_id == 0 else 'bytearray_obj',
+                ),
+                'children': children,
+            }
+            for parent_id, children in children_map.items()
+        ],
+        'text_blocks': [],
+    }
+
+
+### measurement
+
+def measure(size, output_size):
+    """Print peak memory of executing graphs in each execution mode."""
+
+    ### prevent a window from being created and the pygame banner from
+    ### being printed
+
+    environ['SDL_VIDEODRIVER'] = 'dummy'
+    environ['SDL_AUDIODRIVER'] = 'dummy'
+    environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+    ### local imports
+
+    path.insert(0, str(REPOSITORY_DIR))
+
+    from nodezator.config import APP_REFS
+
+    from nodezator.userprefsman.main import USER_PREFS
+
+    ## dialogs are printed instead of displayed
+    APP_REFS.headless = True
+
+    ## instantiating the window manager also instantiates the graph
+    ## manager
+    from nodezator.winman import main as _
+
+    gm = APP_REFS.gm
+
+    ### don't reuse outputs, so measurements don't depend on the user
+    ### preferences
+
+    USER_PREFS.update(
+        INCREMENTAL_EXECUTION=False,
+        PROFILE_EXECUTION=False,
+        BACKGROUND_EXECUTION=False,
+        EXECUTION_TIMEOUT=0,
+    )
+
+    print(
+        f"{'shape':>7} {'nodes':>6} {'mode':>16}"
+        f" {'peak (MB)':>10} {'peak (outputs)':>15}"
+    )
+
+    for shape in ('chain', 'fanout'):
+
+        APP_REFS.data = generate_graph_data(shape, size, output_size)
+        gm.prepare_for_new_session()
+
+        for mode_name, prefs, stores_outputs in EXECUTION_MODES:
+
+            USER_PREFS.update(prefs)
+
+            gm.output_map = {} if stores_outputs else None
+
+            collect()
+            tracemalloc.start()
+
+            try:
+
+                if not gm.execute_graph():
+                    raise RuntimeError("graph execution failed")
+
+                peak = tracemalloc.get_traced_memory()[1]
+
+            finally:
+
+                tracemalloc.stop()
+                gm.output_map = None
+
+            print(
+                f"{shape:>7} {size:>6} {mode_name:>16}"
+                f" {peak / BYTES_PER_MEGABYTE:>10.1f}"
+                f" {peak / output_size:>15.1f}",
+                flush=True,
+            )
+
+
+### main function
+
+def main():
+    """Run benchmark with arguments from the command line."""
+
+    parser = ArgumentParser(
+        description="Benchmark of memory used to execute graphs"
+    )
+
+    parser.add_argument(
+        '--nodes',
+        type=int,
+        default=10,
+        help="number of nodes producing outputs; defaults to 10.",
+    )
+
+    parser.add_argument(
+        '--output-size',
+        type=int,
+        default=50,
+        help="size of each output in megabytes; defaults to 50.",
+    )
+
+    args = parser.parse_args()
+
+    measure(args.nodes, args.output_size * BYTES_PER_MEGABYTE)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark for exporting graphs as Python code.
+
+Generates graphs in different shapes and sizes (see the graphs.py
+module) and measures the time taken by the graph manager's python_repr()
+method, which produces the Python code of the graph. The ratio between
+the time and the number of nodes should remain roughly constant as the
+graphs grow, since the export is meant to take linear time.
+
+Run from the root of the repository (no window is displayed):
+
+    python benchmarks/python_repr.py [NUMBER_OF_NODES ...]
+"""
+
+### standard library imports
+
+from os import environ
+
+from sys import argv, path
+
+from time import perf_counter
+
+from pathlib import Path
+
+
+### make the package importable and prevent a window from being displayed
+
+path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+environ['SDL_VIDEODRIVER'] = 'dummy'
+environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+### local imports
+
+from nodezator.config import APP_REFS
+
+## instantiating the window manager also instantiates the graph manager
+from nodezator.winman import main as _
+
+from graphs import generate_graph_data
+
+
+
+### constants
+
+DEFAULT_SIZES = (1000, 2000, 4000, 8000, 16000)
+
+SHAPES = ('chain', 'diamonds')
+
+
+### graph loading
+
+def load_graph(shape, size):
+    """Load graph with given shape and number of nodes."""
+    APP_REFS.source_path = Path('benchmark.ndz')
+    APP_REFS.data = generate_graph_data(shape, size)
+
+    APP_REFS.gm.prepare_for_new_session()
+
+
+### main function
+
+def main(sizes):
+    """Print time taken to export graphs of given sizes."""
+
+    print(f"{'shape':>10}  {'nodes':>7}  {'seconds':>9}  {'usecs/node':>10}")
+
+    for shape in SHAPES:
+
+        for size in sizes:
+
+            load_graph(shape, size)
+
+            start = perf_counter()
+            APP_REFS.gm.python_repr()
+            elapsed = perf_counter() - start
+
+            print(
+                f"{shape:>10}  {size:>7}  {elapsed:>9.3f}"
+                f"  {elapsed / size * 1e6:>10.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in argv[1:]] or DEFAULT_SIZES)
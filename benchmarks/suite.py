@@ -0,0 +1,449 @@
+"""Benchmark suite for the graph engine.
+
+Generates synthetic graphs of different shapes and sizes (see the
+graphs.py module) and measures, for each of them:
+
+load
+    seconds taken to load the data from the .ndz file.
+instantiation
+    seconds taken by the graph manager to instantiate the nodes and
+    connect their sockets.
+sorting
+    seconds taken to sort the nodes for execution (_sort_nodes()).
+dispatch
+    microseconds taken, on average, to execute each node, including
+    the overhead of dispatching its callable and sending its outputs;
+    since the callables used are trivial, this is mostly overhead.
+python_repr
+    seconds taken to export the graph as Python code.
+peak memory
+    maximum resident set size of the process, in megabytes.
+
+Each graph is measured in a separate process, so measurements aren't
+affected by previous ones and the peak memory is specific to each graph.
+No window is created, so the suite runs on servers as well (Linux only,
+since the peak memory is read from the resource module).
+
+The results are printed and saved in a .json file, along with the app
+version and information about the platform, so results obtained with
+different versions can be compared to track regressions:
+
+    python benchmarks/suite.py --output new.json --compare old.json
+
+Run from the root of the repository:
+
+    python benchmarks/suite.py [--shapes SHAPE ...] [--sizes SIZE ...]
+
+Graphs with 100k nodes take about a minute and several gigabytes of
+memory to be instantiated, so they must be requested explicitly.
+"""
+
+### standard library imports
+
+from os import environ
+
+from sys import executable, path, stderr
+
+from argparse import ArgumentParser, SUPPRESS
+
+from json import dumps, loads
+
+from subprocess import run
+
+from pathlib import Path
+
+from platform import platform, python_version
+
+from datetime import datetime
+
+from time import perf_counter
+
+from tempfile import TemporaryDirectory
+
+
+### local import
+from graphs import SHAPES, generate_graph_data, count_edges
+
+
+
+### constants
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+DEFAULT_OUTPUT_PATH = 'benchmark_results.json'
+
+REPOSITORY_DIR = Path(__file__).resolve().parents[1]
+
+## names of measurements, along with the heading and format used to
+## print them
+
+MEASUREMENTS = (
+    ('load_seconds', 'load (s)', '.3f'),
+    ('instantiation_seconds', 'instant. (s)', '.3f'),
+    ('sorting_seconds', 'sorting (s)', '.4f'),
+    ('dispatch_usecs_per_node', 'dispatch (us/node)', '.1f'),
+    ('python_repr_seconds', 'python_repr (s)', '.3f'),
+    ('peak_memory_mb', 'peak mem. (MB)', '.1f'),
+)
+
+
+### measurement of a single graph (executed in a child process)
+
+def measure_graph(shape, size, seed):
+    """Return dict with measurements for graph of given shape and size."""
+
+    ### prevent a window from being created and the pygame banner from
+    ### being printed
+
+    environ['SDL_VIDEODRIVER'] = 'dummy'
+    environ['SDL_AUDIODRIVER'] = 'dummy'
+    environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+    ### local imports
+
+    path.insert(0, str(REPOSITORY_DIR))
+
+    from resource import getrusage, RUSAGE_SELF
+
+    from nodezator.config import APP_REFS
+
+    from nodezator.userprefsman.main import USER_PREFS
+
+    from nodezator.ourstdlibs.pyl import load_pyl, save_pyl
+
+    ## dialogs are printed instead of displayed
+    APP_REFS.headless = True
+
+    ## instantiating the window manager also instantiates the graph
+    ## manager
+    from nodezator.winman import main as _
+
+    gm = APP_REFS.gm
+
+    ### execute nodes one at a time, without reusing outputs, so
+    ### measurements don't depend on the user preferences
+
+    USER_PREFS.update(
+        INCREMENTAL_EXECUTION=False,
+        PROFILE_EXECUTION=False,
+        EXECUTION_WORKERS=1,
+        EXECUTION_TIMEOUT=0,
+    )
+
+    ### generate graph and save it in a file
+
+    data = generate_graph_data(shape, size, seed)
+
+    measurements = {
+        'shape': shape,
+        'nodes': size,
+        'edges': count_edges(data),
+    }
+
+    with TemporaryDirectory() as dirpath:
+
+        filepath = Path(dirpath) / 'benchmark.ndz'
+        save_pyl(data, filepath)
+
+        ### load
+
+        start = perf_counter()
+        data = load_pyl(filepath)
+        measurements['load_seconds'] = perf_counter() - start
+
+    ### instantiation
+
+    APP_REFS.source_path = filepath
+    APP_REFS.data = data
+
+    start = perf_counter()
+    gm.prepare_for_new_session()
+    measurements['instantiation_seconds'] = perf_counter() - start
+
+    ### execution, timing the sorting and the execution of each
+    ### generation of nodes separately, by wrapping the respective
+    ### methods
+
+    timing_map = {'sorting': 0.0, 'dispatch': 0.0}
+
+    def get_timed(method, key):
+
+        def timed(*args, **kwargs):
+
+            start = perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+
+            finally:
+                timing_map[key] += perf_counter() - start
+
+        return timed
+
+    gm._sort_nodes = get_timed(gm._sort_nodes, 'sorting')
+
+    gm._execute_node_generation = get_timed(
+        gm._execute_node_generation,
+        'dispatch',
+    )
+
+    if not gm.execute_graph():
+        raise RuntimeError("graph execution failed")
+
+    measurements['sorting_seconds'] = timing_map['sorting']
+
+    measurements['dispatch_usecs_per_node'] = (
+        timing_map['dispatch'] / gm.nodes_to_execute_count * 1e6
+    )
+
+    ### export as Python
+
+    start = perf_counter()
+    gm.python_repr()
+    measurements['python_repr_seconds'] = perf_counter() - start
+
+    ### peak memory (on Linux, the maximum resident set size is given
+    ### in kilobytes)
+
+    measurements['peak_memory_mb'] = (
+        getrusage(RUSAGE_SELF).ru_maxrss / 1024
+    )
+
+    return measurements
+
+
+### suite
+
+def run_suite(shapes, sizes, seed=0, repeat=1):
+    """Return list with measurements of graphs of given shapes and sizes.
+
+    Each graph is measured in a separate process. When measurements are
+    repeated, the lowest times and the highest peak memory are kept.
+    """
+    results = []
+
+    for shape in shapes:
+
+        for size in sizes:
+
+            runs = []
+
+            for _ in range(repeat):
+
+                completed_process = run(
+                    [
+                        executable,
+                        __file__,
+                        '--case',
+                        shape,
+                        str(size),
+                        '--seed',
+                        str(seed),
+                    ],
+                    capture_output=True,
+                    text=True,
+                )
+
+                if completed_process.returncode:
+
+                    print(completed_process.stderr, file=stderr)
+
+                    raise RuntimeError(
+                        f"measuring {shape} graph with {size} nodes failed"
+                    )
+
+                runs.append(
+                    loads(completed_process.stdout.strip().splitlines()[-1])
+                )
+
+            result = dict(runs[0])
+
+            for key, *_ in MEASUREMENTS:
+
+                result[key] = (
+                    max if key == 'peak_memory_mb' else min
+                )(item[key] for item in runs)
+
+            print_row(result)
+            results.append(result)
+
+    return results
+
+
+def get_metadata(seed, repeat):
+    """Return dict with information about the benchmark run."""
+
+    path.insert(0, str(REPOSITORY_DIR))
+
+    from nodezator.appinfo import APP_VERSION
+
+    return {
+        'app_version': (
+            '.'.join(map(str, APP_VERSION[:3])) + '-' + APP_VERSION[3]
+        ),
+        'python_version': python_version(),
+        'platform': platform(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'seed': seed,
+        'repeat': repeat,
+    }
+
+
+### printing
+
+def print_header():
+    """Print headings of the columns with measurements."""
+    print(
+        f"{'shape':>9} {'nodes':>7} {'edges':>7} "
+        + " ".join(heading for _, heading, _ in MEASUREMENTS)
+    )
+
+
+def print_row(result, format_spec=None):
+    """Print measurements of a graph.
+
+    If a format spec is given, it is used for all measurements.
+    """
+    print(
+        f"{result['shape']:>9} {result['nodes']:>7} {result['edges']:>7} "
+        + " ".join(
+            format(result[key], format_spec or spec).rjust(len(heading))
+            for key, heading, spec in MEASUREMENTS
+        ),
+        flush=True,
+    )
+
+
+def print_comparison(results, previous_results):
+    """Print ratios between results and previous ones (new/old).
+
+    Ratios above 1 mean the new measurement is higher (worse).
+    """
+    previous_map = {
+        (item['shape'], item['nodes']): item
+        for item in previous_results
+    }
+
+    print("\nratios (new/old):")
+    print_header()
+
+    for result in results:
+
+        try:
+            previous = previous_map[result['shape'], result['nodes']]
+
+        except KeyError:
+            continue
+
+        print_row(
+            {
+                **result,
+                **{
+                    key: result[key] / previous[key] if previous[key] else 0.0
+                    for key, *_ in MEASUREMENTS
+                },
+            },
+            '.2f',
+        )
+
+
+### main function
+
+def main():
+    """Run suite with arguments from the command line."""
+
+    parser = ArgumentParser(description="Benchmark suite for the graph engine")
+
+    parser.add_argument(
+        '--shapes',
+        nargs='+',
+        choices=SHAPES,
+        default=SHAPES,
+        help="shapes of the graphs to measure; defaults to all shapes.",
+    )
+
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=DEFAULT_SIZES,
+        help=(
+            "numbers of nodes of the graphs to measure; defaults to"
+            f" {' '.join(map(str, DEFAULT_SIZES))}."
+        ),
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help="seed for the generation of random graphs; defaults to 0.",
+    )
+
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=1,
+        help="number of times each graph is measured; defaults to 1.",
+    )
+
+    parser.add_argument(
+        '--output',
+        default=DEFAULT_OUTPUT_PATH,
+        help=(
+            "path of .json file to save results; defaults to"
+            f" {DEFAULT_OUTPUT_PATH}."
+        ),
+    )
+
+    parser.add_argument(
+        '--compare',
+        metavar='PREVIOUS.json',
+        default=None,
+        help="path of .json file with previous results to compare with.",
+    )
+
+    ## used internally to measure a single graph in a child process
+    parser.add_argument('--case', nargs=2, help=SUPPRESS)
+
+    args = parser.parse_args()
+
+    ### if requested, measure single graph, printing the measurements
+    ### as json
+
+    if args.case:
+
+        shape, size = args.case
+        print(dumps(measure_graph(shape, int(size), args.seed)))
+
+        return
+
+    ### otherwise run the whole suite and save the results
+
+    print_header()
+
+    results = run_suite(args.shapes, args.sizes, args.seed, args.repeat)
+
+    Path(args.output).write_text(
+        dumps(
+            {
+                'metadata': get_metadata(args.seed, args.repeat),
+                'results': results,
+            },
+            indent=2,
+        ),
+        encoding='utf-8',
+    )
+
+    print(f"\nresults saved in {args.output}")
+
+    if args.compare:
+
+        print_comparison(
+            results,
+            loads(Path(args.compare).read_text(encoding='utf-8'))['results'],
+        )
+
+
+if __name__ == '__main__':
+    main()
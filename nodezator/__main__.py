@@ -12,6 +12,10 @@
 
 ### standard library imports
 
+from os import environ
+
+from sys import exit
+
 from pathlib import Path
 
 
@@ -130,6 +134,193 @@ def parse_args_and_execute_main():
     main(parsed_args.filepath)
 
 
+def run_headless(
+    filepath,
+    overrides=(),
+    output_dir=None,
+    node_ids=(),
+    timeout=None,
+    table_path=None,
+    jobs=1,
+):
+    """Execute graph from file without a window, returning exit status.
+
+    If the path of a table of values is given, the graph is executed
+    once for each of its rows.
+
+    Parameters
+    ==========
+
+    See the run_graph() and run_sweep() functions in the batchrun.py
+    module.
+    """
+    ### use dummy video and audio drivers, so no window is
+    ### created and no audio device is needed
+
+    environ['SDL_VIDEODRIVER'] = 'dummy'
+    environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    ### prevent the message printed by pygame-ce when imported from
+    ### appearing in the worker processes (which inherit the environment
+    ### variables), so only the results are written to stdout
+    environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+    ### indicate the app is running without a window, so dialogs
+    ### are printed instead of displayed
+    APP_REFS.headless = True
+
+    ### load function that executes the graph
+
+    logger.info("Loading batch runner.")
+
+    try:
+        from .batchrun import run_graph, run_sweep
+
+    ## catch unexpected exceptions so we can log them
+    ## before reraising
+
+    except Exception as err:
+
+        logger.exception(
+            "Unexpected exception while loading batch runner. Reraising now."
+        )
+
+        raise err
+
+    ### finally, execute the graph
+
+    logger.info(f"Executing graph from {filepath} without a window.")
+
+    if table_path is not None:
+
+        return run_sweep(
+            filepath,
+            table_path,
+            overrides,
+            output_dir,
+            node_ids,
+            timeout,
+            jobs,
+        )
+
+    return run_graph(filepath, overrides, output_dir, node_ids, timeout)
+
+
+def parse_args_and_run_headless():
+    """Execute run_headless() with custom-parsed arguments.
+
+    This function is used by the command-line batch runner
+    installed along with the package.
+    """
+    ### standard library import
+    from argparse import ArgumentParser
+
+    ### instantiate and configure parser
+
+    parser = ArgumentParser(
+        description=f"{TITLE} - execute graph without a window"
+    )
+
+    parser.add_argument(
+        "filepath",
+        type=str,
+        help=f"path of {NATIVE_FILE_EXTENSION} file to be executed.",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--set",
+        dest="overrides",
+        metavar="NODE_ID[.PARAM]=VALUE",
+        action="append",
+        default=[],
+        help=(
+            "override value of data node widget (or of widget of node"
+            " parameter); value is evaluated as a Python literal or used"
+            " as a string; may be given multiple times."
+        ),
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=None,
+        help="directory to save outputs; if omitted, outputs are printed.",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--node",
+        dest="node_ids",
+        metavar="NODE_ID",
+        type=int,
+        action="append",
+        default=[],
+        help=(
+            "id of node whose output must be printed/saved; if omitted,"
+            " outputs of nodes not connected to other nodes are used;"
+            " may be given multiple times."
+        ),
+    )
+
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        metavar="SECONDS",
+        type=int,
+        default=None,
+        help=(
+            "maximum number of seconds each node callable may take;"
+            " nodes exceeding it are stopped and the execution fails;"
+            " if omitted, the timeout from the user preferences is used"
+            " (0 means no timeout)."
+        ),
+    )
+
+    parser.add_argument(
+        "--sweep",
+        dest="table_path",
+        metavar="TABLE.csv",
+        default=None,
+        help=(
+            "execute graph once for each row of .csv table whose header"
+            " holds NODE_ID[.PARAM] items and whose rows hold values"
+            " for them; outputs are collected in a results table printed"
+            " or saved as sweep_results.csv in the output directory."
+        ),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "number of worker processes among which the rows of the"
+            " sweep are split (outputs are only reused within each"
+            " worker); defaults to 1."
+        ),
+    )
+
+    ### parse arguments
+    parsed_args = parser.parse_args()
+
+    ### call the function with the arguments, exiting with the
+    ### returned status
+
+    exit(
+        run_headless(
+            parsed_args.filepath,
+            parsed_args.overrides,
+            parsed_args.output_dir,
+            parsed_args.node_ids,
+            parsed_args.timeout,
+            parsed_args.table_path,
+            parsed_args.jobs,
+        )
+    )
+
+
 ### when file is run as script...
 
 if __name__ == "__main__":
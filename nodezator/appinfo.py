@@ -108,6 +108,27 @@
 )
 
 
+## name of variable used by node scripts to opt in to have their main
+## callable executed in a separate process (the variable must hold True)
+USE_PROCESS_POOL_VAR_NAME = "use_process_pool"
+
+## name of variable used by node scripts to declare their main callable
+## deterministic (the variable must hold True), that is, it always returns
+## the same output for the same inputs, so its outputs can be cached on disk
+DETERMINISTIC_VAR_NAME = "deterministic"
+
+## name of variable used by node scripts to mark their main callable as
+## item-wise (the variable must hold True), that is, it is called for each
+## item of the iterable received in its first parameter, streaming the
+## outputs to downstream nodes
+ITEM_WISE_VAR_NAME = "item_wise"
+
+## name of variable used by node scripts to define the maximum number of
+## seconds their main callable may take to execute (overrides the timeout
+## defined in the user preferences; 0 means there's no timeout)
+EXECUTION_TIMEOUT_VAR_NAME = "execution_timeout"
+
+
 NODE_DEF_VAR_NAMES = (
 
     MAIN_CALLABLE_VAR_NAME,
@@ -116,6 +137,10 @@
     "call_format",
     "stlib_import_text",
     "third_party_import_text",
+    USE_PROCESS_POOL_VAR_NAME,
+    DETERMINISTIC_VAR_NAME,
+    ITEM_WISE_VAR_NAME,
+    EXECUTION_TIMEOUT_VAR_NAME,
     *VIEWER_NODE_RELATED_VAR_NAMES,
 )
 
@@ -0,0 +1,724 @@
+"""Facility for executing graphs from the command line.
+
+Graphs are loaded from .ndz files and executed without a window
+(that is, without user interaction), so they can be executed on
+servers, scheduled tasks, etc.
+
+The values of widgets in the graph can be overridden, so the same
+graph can be executed with different inputs. The outputs of the
+nodes are printed on stdout or saved in a directory.
+
+The graph can also be executed once for each row of a table of
+values (a parameter sweep), collecting the outputs in a results
+table.
+"""
+
+### standard library imports
+
+from sys import stderr, stdout
+
+from pathlib import Path
+
+from ast import literal_eval
+
+from pprint import pformat
+
+from string import ascii_letters, digits
+
+from math import ceil
+
+from csv import reader, DictWriter
+
+from multiprocessing import get_context
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+### third-party imports
+
+from pygame import Surface
+
+from pygame.image import save as save_image
+
+
+### local imports
+
+from .config import APP_REFS
+
+from .appinfo import NATIVE_FILE_EXTENSION
+
+from .userprefsman.main import USER_PREFS
+
+from .logman.main import get_new_logger
+
+from .ourstdlibs.pyl import load_pyl
+
+from .graphman.nodepacksissues import (
+    get_formatted_local_node_packs,
+    get_formatted_installed_node_packs,
+    check_local_node_packs,
+    check_installed_node_packs,
+)
+
+from .graphman.exception import NODE_PACK_ERRORS
+
+## instantiating the window manager also instantiates the
+## graph manager, which we use to load and execute the graph
+from .winman import main as _
+
+
+
+### create logger for module
+logger = get_new_logger(__name__)
+
+
+### constants
+
+## characters allowed in names of output files as-is
+FILENAME_CHARS = frozenset(ascii_letters + digits + '-_')
+
+
+### main functions
+
+def run_graph(
+    filepath,
+    overrides=(),
+    output_dir=None,
+    node_ids=(),
+    timeout=None,
+):
+    """Execute graph from file, returning exit status.
+
+    Parameters
+    ==========
+
+    filepath (string or pathlib.Path)
+        path of the .ndz file containing the graph.
+    overrides (iterable of strings)
+        each string has the form 'NODE_ID=VALUE' to override the
+        value of the widget of a data node or 'NODE_ID.PARAM=VALUE'
+        to override the value of the widget of a parameter of a
+        node; the value is evaluated as a Python literal or, if
+        that fails, used as a string.
+    output_dir (string, pathlib.Path or None)
+        directory in which to save the outputs; if None, the
+        outputs are printed on stdout instead.
+    node_ids (iterable of integers)
+        ids of nodes whose outputs must be printed/saved; if empty,
+        the outputs of nodes whose outputs aren't sent to other
+        nodes are used.
+    timeout (int or None)
+        maximum number of seconds each node callable may take (0 means
+        there's no timeout); if None, the timeout from the user
+        preferences is used; node scripts may define their own timeouts,
+        though, which take precedence; callables with a timeout are
+        executed in separate processes, so their outputs must be
+        picklable.
+    """
+    ### load graph
+
+    if not _load_graph(filepath, overrides):
+        return 1
+
+    ### execute graph, storing the outputs of the nodes
+
+    gm = APP_REFS.gm
+
+    if timeout is not None:
+        USER_PREFS['EXECUTION_TIMEOUT'] = timeout
+
+    ### outputs of nodes consumed by other nodes are released during
+    ### the execution, except the ones requested
+
+    output_map = gm.output_map = {}
+    gm.output_ids_to_keep = set(node_ids)
+
+    try:
+        succeeded = gm.execute_graph()
+
+    finally:
+
+        gm.output_map = None
+        gm.output_ids_to_keep = ()
+        gm.shutdown_process_pool()
+
+    if APP_REFS.status_message:
+        _report(APP_REFS.status_message, 'info')
+
+    if not succeeded:
+        return 1
+
+    ### print/save outputs
+
+    node_ids = _get_output_node_ids(node_ids, output_map)
+
+    if node_ids is None:
+        return 1
+
+    for node_id in node_ids:
+
+        node = gm.node_map[node_id]
+        output = output_map[node_id]
+
+        if output_dir is None:
+            print(f"#{node_id} {node.title_text}: {pformat(output)}")
+
+        else:
+            _save_output(node, output, Path(output_dir))
+
+    return 0
+
+
+def run_sweep(
+    filepath,
+    table_path,
+    overrides=(),
+    output_dir=None,
+    node_ids=(),
+    timeout=None,
+    jobs=1,
+):
+    """Execute graph once for each row of a table, returning exit status.
+
+    The table is a .csv file. The header holds the widgets whose values
+    are swept, in the same form used in the overrides, but without the
+    values (that is, 'NODE_ID' or 'NODE_ID.PARAM'). Each of the other
+    rows holds the values to be used in one execution (the values are
+    evaluated just like in the overrides).
+
+    The rows are executed in order, using incremental execution, so the
+    outputs of nodes not affected by the values that changed between
+    rows are reused.
+
+    The outputs of the rows are collected in a results table, which
+    is printed on stdout or saved as 'sweep_results.csv' in the output
+    directory. It contains the values of each row, the representation
+    of the output of each designated node and an error column, which
+    is filled for rows whose execution failed.
+
+    Parameters
+    ==========
+
+    table_path (string or pathlib.Path)
+        path of the .csv file containing the table of values.
+    jobs (int)
+        number of worker processes in which to execute the rows; the
+        rows are split into contiguous chunks, one for each worker,
+        and each worker loads the graph and executes its chunk; since
+        outputs are only reused within a chunk, it pays off when the
+        rows are slow and numerous.
+
+    See run_graph() for the other parameters.
+    """
+    ### load table
+
+    try:
+        columns, rows = _load_table(Path(table_path))
+
+    except (OSError, ValueError) as err:
+
+        _report(f"couldn't load table from {table_path}: {err}")
+        return 1
+
+    ### split the rows into chunks, one for each worker
+
+    jobs = max(1, min(jobs, len(rows)))
+    chunk_size = ceil(len(rows) / jobs)
+
+    chunks = [
+        rows[index:index + chunk_size]
+        for index in range(0, len(rows), chunk_size)
+    ]
+
+    chunk_args = [
+        (
+            filepath,
+            overrides,
+            columns,
+            chunk,
+            index * chunk_size,
+            node_ids,
+            timeout,
+        )
+        for index, chunk in enumerate(chunks)
+    ]
+
+    ### execute the chunks, in worker processes if there's more than one
+    ###
+    ### the 'spawn' start method is used for the worker processes, which
+    ### inherit the environment variables setting the dummy video/audio
+    ### drivers of the app and hiding the message printed by pygame-ce
+    ### when imported (check run_headless() in the __main__.py module)
+
+    if len(chunks) == 1:
+        chunk_results = [_run_sweep_chunk(*chunk_args[0])]
+
+    else:
+
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            mp_context=get_context('spawn'),
+        ) as executor:
+
+            chunk_results = list(
+                executor.map(_run_sweep_chunk, *zip(*chunk_args))
+            )
+
+    ### if the graph couldn't be loaded, there's no results to report
+
+    if None in chunk_results:
+        return 1
+
+    ### gather the result rows and the names of the output columns (in
+    ### the order they appear)
+
+    result_rows = [
+        result_row
+        for chunk_result in chunk_results
+        for result_row in chunk_result
+    ]
+
+    fieldnames = ['row', *columns]
+
+    for result_row in result_rows:
+
+        for fieldname in result_row:
+
+            if fieldname not in fieldnames and fieldname != 'error':
+                fieldnames.append(fieldname)
+
+    fieldnames.append('error')
+
+    ### write results table
+
+    if output_dir is None:
+        _write_table(stdout, fieldnames, result_rows)
+
+    else:
+
+        output_dir = Path(output_dir)
+
+        if not output_dir.exists():
+            output_dir.mkdir(parents=True)
+
+        results_path = output_dir / 'sweep_results.csv'
+
+        with open(results_path, mode='w', encoding='utf-8', newline='') as f:
+            _write_table(f, fieldnames, result_rows)
+
+        _report(f"saved sweep results in {results_path}", 'info')
+
+    ### the exit status indicates whether all rows succeeded
+
+    failed_count = sum(1 for result_row in result_rows if result_row['error'])
+
+    if failed_count:
+
+        _report(f"{failed_count} of {len(result_rows)} rows failed")
+        return 1
+
+    return 0
+
+
+### support functions
+
+def _load_graph(filepath, overrides):
+    """Load graph from file, returning whether it succeeded.
+
+    Errors are reported on stderr.
+    """
+    filepath = Path(filepath)
+
+    ### load data from file
+
+    if filepath.suffix.lower() != NATIVE_FILE_EXTENSION:
+
+        _report(f"file must have the {NATIVE_FILE_EXTENSION} extension")
+        return False
+
+    try:
+        data = load_pyl(filepath)
+
+    except Exception as err:
+
+        logger.exception(f"Couldn't load {filepath}.")
+
+        _report(f"couldn't load {filepath} ({err.__cause__ or err})")
+        return False
+
+    ### apply overrides
+
+    try:
+
+        for override in overrides:
+            _apply_override(data, override)
+
+    except ValueError as err:
+
+        _report(str(err))
+        return False
+
+    ### store data and path for access throughout the system, like
+    ### it is done when opening files in the app
+
+    APP_REFS.source_path = filepath
+    APP_REFS.data = data
+
+    ### check node packs
+
+    try:
+
+        check_local_node_packs(get_formatted_local_node_packs(filepath))
+        check_installed_node_packs(get_formatted_installed_node_packs(filepath))
+
+    except NODE_PACK_ERRORS as err:
+
+        _report(f"node pack issue: {err}")
+        return False
+
+    ### load node scripts and instantiate graph objects
+
+    try:
+        APP_REFS.gm.prepare_for_new_session()
+
+    except Exception as err:
+
+        logger.exception(f"Couldn't load graph from {filepath}.")
+
+        _report(f"couldn't load graph from {filepath}: {err}")
+        return False
+
+    return True
+
+
+def _get_output_node_ids(node_ids, output_map):
+    """Return ids of nodes whose outputs must be printed/saved.
+
+    If node ids are given, they are returned, unless some of them have
+    no outputs, in which case the issue is reported and None is
+    returned. Otherwise, the ids of nodes whose outputs aren't sent to
+    other nodes are returned.
+    """
+    if node_ids:
+
+        missing_ids = [
+            node_id
+            for node_id in node_ids
+            if node_id not in output_map
+        ]
+
+        if missing_ids:
+
+            _report(
+                "there are no outputs from the nodes with the following"
+                " ids (they either don't exist or weren't executed): "
+                + ", ".join(map(str, missing_ids))
+            )
+
+            return None
+
+        return node_ids
+
+    ### use nodes whose outputs aren't sent to other nodes
+
+    source_node_ids = {
+        parent_id[0]
+        for parent_id in APP_REFS.gm.parent_data_map
+    }
+
+    return sorted(output_map.keys() - source_node_ids)
+
+
+def _run_sweep_chunk(
+    filepath,
+    overrides,
+    columns,
+    rows,
+    first_row_index,
+    node_ids,
+    timeout,
+):
+    """Load graph and execute it for each row, returning result rows.
+
+    Returns None if the graph can't be loaded. May be executed in a
+    worker process, so the returned rows only contain strings.
+    """
+    ### make sure dialogs are printed instead of displayed (needed
+    ### when executed in a worker process)
+    APP_REFS.headless = True
+
+    ### load graph
+
+    if not _load_graph(filepath, overrides):
+        return None
+
+    gm = APP_REFS.gm
+
+    if timeout is not None:
+        USER_PREFS['EXECUTION_TIMEOUT'] = timeout
+
+    ### execute the graph for each row
+
+    result_rows = []
+
+    try:
+
+        for row_index, row in enumerate(rows, first_row_index):
+
+            result_row = {'row': str(row_index), **dict(zip(columns, row))}
+            result_rows.append(result_row)
+
+            ## set the values of the row in the widgets
+
+            try:
+
+                for key, value_text in zip(columns, row):
+                    _set_widget_value(key, _evaluate_value(value_text))
+
+            except ValueError as err:
+
+                result_row['error'] = str(err)
+                continue
+
+            ## execute the graph, reusing outputs from the previous rows
+            ## where possible
+
+            output_map = gm.output_map = {}
+            gm.output_ids_to_keep = set(node_ids)
+
+            try:
+                succeeded = gm.execute_graph(incremental=True)
+
+            finally:
+
+                gm.output_map = None
+                gm.output_ids_to_keep = ()
+
+            if not succeeded:
+
+                result_row['error'] = (
+                    "graph execution failed (see messages on stderr)"
+                )
+
+                _report(f"execution of row {row_index} failed")
+                continue
+
+            ## store representations of the outputs
+
+            output_node_ids = _get_output_node_ids(node_ids, output_map)
+
+            if output_node_ids is None:
+
+                result_row['error'] = "designated nodes had no outputs"
+                continue
+
+            for node_id in output_node_ids:
+
+                fieldname = f"#{node_id} {gm.node_map[node_id].title_text}"
+                result_row[fieldname] = repr(output_map[node_id])
+
+            result_row['error'] = ''
+
+    finally:
+        gm.shutdown_process_pool()
+
+    return result_rows
+
+
+def _load_table(table_path):
+    """Return columns and rows of table of values from .csv file.
+
+    Raises ValueError if the table is invalid.
+    """
+    if table_path.suffix.lower() != '.csv':
+        raise ValueError("the table must be a .csv file")
+
+    with open(table_path, mode='r', encoding='utf-8', newline='') as f:
+        lines = list(reader(f))
+
+    ### the first line must be the header, with the columns
+
+    if not lines or not lines[0]:
+        raise ValueError("the table has no header in its first line")
+
+    columns, *rows = lines
+
+    ### ignore empty rows
+
+    rows = [row for row in rows if row]
+
+    if not rows:
+        raise ValueError("the table has no rows with values")
+
+    for row_number, row in enumerate(rows, 2):
+
+        if len(row) != len(columns):
+
+            raise ValueError(
+                f"line {row_number} has {len(row)} values, but the header"
+                f" has {len(columns)} columns"
+            )
+
+    return columns, rows
+
+
+def _set_widget_value(key, value):
+    """Set value on widget of node in the loaded graph.
+
+    Works like _apply_override(), but on the live widgets, so the
+    nodes whose inputs didn't change can have their outputs reused.
+
+    Raises ValueError if the key isn't valid.
+    """
+    node_id_text, _, param_name = key.partition('.')
+
+    ### retrieve widget
+
+    try:
+
+        node = APP_REFS.gm.node_map[int(node_id_text)]
+
+        widget = (
+            node.widget_live_flmap[param_name]
+            if param_name
+            else node.widget
+        )
+
+    except (ValueError, KeyError, AttributeError):
+
+        raise ValueError(
+            f"column '{key}' doesn't refer to the widget of a data node"
+            " or of a parameter of a node"
+        )
+
+    ### set value
+
+    try:
+        widget.set(value)
+
+    except Exception as err:
+
+        raise ValueError(
+            f"value {value!r} couldn't be set in the widget referred to"
+            f" by column '{key}' ({err!r})"
+        )
+
+
+def _evaluate_value(value_text):
+    """Return value text evaluated as a Python literal or as-is."""
+    try:
+        return literal_eval(value_text)
+
+    except Exception:
+        return value_text
+
+
+def _write_table(stream, fieldnames, rows):
+    """Write rows as .csv table in text stream."""
+    writer = DictWriter(stream, fieldnames=fieldnames, restval='')
+
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _apply_override(data, override):
+    """Override widget value in the graph data.
+
+    Raises ValueError if the override isn't valid.
+    """
+    node_key, separator, value_text = override.partition('=')
+
+    if not separator:
+
+        raise ValueError(
+            f"override '{override}' must have the form NODE_ID=VALUE"
+            " or NODE_ID.PARAM=VALUE"
+        )
+
+    node_id_text, _, param_name = node_key.partition('.')
+
+    ### retrieve node data
+
+    try:
+        node_data = data['nodes'][int(node_id_text)]
+
+    except (ValueError, KeyError):
+
+        raise ValueError(
+            f"override '{override}' doesn't refer to an existing node"
+        )
+
+    ### evaluate value
+    value = _evaluate_value(value_text)
+
+    ### override the value of the widget of a parameter
+
+    if param_name:
+
+        value_map = node_data.get('param_widget_value_map', {})
+
+        if param_name not in value_map:
+
+            raise ValueError(
+                f"override '{override}' doesn't refer to a parameter"
+                " with a widget"
+            )
+
+        value_map[param_name] = value
+
+    ### override the value of the widget of a data node
+
+    else:
+
+        try:
+            node_data['widget_data']['widget_kwargs']['value'] = value
+
+        except KeyError:
+
+            raise ValueError(
+                f"override '{override}' doesn't refer to a data node"
+                " with a widget"
+            )
+
+
+def _save_output(node, output, output_dir):
+    """Save output of node in directory.
+
+    Surfaces are saved as .png images. Other outputs are saved as
+    .pyl files when their representation can be evaluated back into
+    them and as .txt files otherwise.
+    """
+    if not output_dir.exists():
+        output_dir.mkdir(parents=True)
+
+    title = ''.join(
+        char if char in FILENAME_CHARS else '_'
+        for char in node.title_text
+    )
+
+    stem = f"{node.id}_{title}"
+
+    if isinstance(output, Surface):
+
+        filepath = output_dir / (stem + '.png')
+        save_image(output, str(filepath))
+
+    else:
+
+        text = pformat(output)
+
+        try:
+            is_literal = literal_eval(text) == output
+
+        except Exception:
+            is_literal = False
+
+        filepath = output_dir / (stem + ('.pyl' if is_literal else '.txt'))
+        filepath.write_text(text, encoding='utf-8')
+
+    _report(f"saved output of node #{node.id} in {filepath}", 'info')
+
+
+def _report(message, level_name='error'):
+    """Print message on stderr."""
+    print(f"{level_name}: {message}", file=stderr)
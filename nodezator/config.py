@@ -61,6 +61,9 @@
     ## flag to check need to save system testing settings
     ## at end of testing session
     system_testing_set=False,
+    ## flag indicating whether the app is running without a
+    ## window (when executing graphs from the command line)
+    headless=False,
 )
 
 
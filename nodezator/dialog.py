@@ -6,6 +6,8 @@
 
 from collections import deque
 
+from sys import stderr
+
 
 ### third-party imports
 
@@ -32,6 +34,8 @@
 
 ### local imports
 
+from .config import APP_REFS
+
 from .translation import DIALOGS_MAP
 
 from .pygamesetup import (
@@ -279,7 +283,18 @@ def create_and_show_dialog(
         unhighlighter_obj (obj with draw method or None)
             object used to unhighlight what's behind the
             dialog box.
+
+        When the app runs without a window, the message is printed
+        on stderr instead and None is returned, as though the dialog
+        was dismissed.
         """
+        ### if running without a window, just print the message
+
+        if APP_REFS.headless:
+
+            print(f"{level_name}: {message}", file=stderr)
+            return
+
         ### store dismissable flag
         self.dismissable = dismissable
 
@@ -76,6 +76,16 @@ def __init__(self):
         ### set a control to keep track of scrolling amount
         self.scrolling_amount = Vector2()
 
+        ### set controls to keep track of scrolling not yet applied
+        ### to the objects in the graph (see the scroll() method):
+        ###
+        ### - scrolling not applied to any object yet;
+        ### - map associating objects to which part of that scrolling
+        ###   was already applied with the respective amount
+
+        self.pending_scrolling = [0, 0]
+        self.partially_aligned_map = {}
+
         ### generate grid objects and also store the
         ### grid generation method as a window resize
         ### setup
@@ -148,46 +158,150 @@ def scroll_to_origin(self):
         self.scroll(dx, dy)
 
     def scroll(self, dx, dy):
-        """Scroll grid and objects."""
+        """Scroll grid and objects.
+
+        Only the grids and origin rect are moved right away. Moving
+        all objects in the graph every time would make scrolling
+        slower the bigger the graph is, so the scrolling is instead
+        accumulated and applied lazily:
+
+        - to objects on the screen, whenever they are retrieved by
+          get_on_screen() in order to be drawn or checked for
+          collision with the mouse;
+        - to all remaining objects whenever align_objects() is
+          called, which must be done before any operation which
+          needs the position of objects outside the screen.
+        """
         ### scroll grids
         self.scroll_grids(dx, dy)
 
-        gm = APP_REFS.gm
+        ### scroll origin rect
+        APP_REFS.gm.origin_rect.move_ip(dx, dy)
+
+        ### accumulate scrolling to be applied to the other objects;
+        ###
+        ### the deltas are truncated just like they'd be if we
+        ### moved the rects right away
+
+        pending_scrolling = self.pending_scrolling
+
+        pending_scrolling[0] += int(dx)
+        pending_scrolling[1] += int(dy)
+
+    def is_scrolling_pending(self):
+        """Return whether there's scrolling not applied to objects."""
+        return bool(
+            self.partially_aligned_map
+            or self.pending_scrolling != [0, 0]
+        )
+
+    def get_unaligned_scrolling(self, obj):
+        """Return scrolling amount not yet applied to given object."""
+        dx, dy = self.pending_scrolling
+
+        try:
+            applied_dx, applied_dy = self.partially_aligned_map[obj]
+        except KeyError:
+            return dx, dy
+
+        return dx - applied_dx, dy - applied_dy
+
+    def align_obj(self, obj):
+        """Apply pending scrolling to given object."""
+        dx, dy = self.get_unaligned_scrolling(obj)
 
-        ### scroll objects
+        if dx or dy:
 
-        ## origin rect
-        gm.origin_rect.move_ip(dx, dy)
+            (
+                obj.rectsman if hasattr(obj, "rectsman") else obj.rect
+            ).move_ip(dx, dy)
 
-        ## XXX
-        ##
-        ## check whether calling
-        ##
-        ## with suppress(RuntimeError):
-        ##     gm.rectsman.move_ip(dx, dy)
-        ##
-        ## ...instead of the for-loops below
-        ## would be much slower.
-        ##
-        ## If the difference in speed is negligible, it may be worth
-        ## to replace the code by the lines mentioned above (maybe
-        ## optimizing the solution so we don't need to suppress
-        ## the error, just replace the operation when there are no
-        ## objects in the graph)
+            self.partially_aligned_map[obj] = tuple(self.pending_scrolling)
 
-        ## nodes
+    def align_objects(self):
+        """Apply pending scrolling to all objects in the graph."""
+        ### if there's no scrolling pending, there's nothing to do
+        if not self.is_scrolling_pending(): return
 
-        for node in gm.nodes:
-            node.rectsman.move_ip(dx, dy)
+        ### otherwise, align each object
 
-        ## other objects
+        gm = APP_REFS.gm
+        align_obj = self.align_obj
 
         for obj in chain(
+            gm.nodes,
             gm.preview_toolbars,
             gm.preview_panels,
             gm.text_blocks,
         ):
-            obj.rect.move_ip(dx, dy)
+            align_obj(obj)
+
+        ### now that all objects are aligned, reset controls
+
+        self.pending_scrolling[:] = 0, 0
+        self.partially_aligned_map.clear()
+
+    def get_on_screen(self, objs):
+        """Return list with given objects which are on the screen.
+
+        See get_colliding() for more info.
+        """
+        return self.get_colliding(objs, SCREEN_RECT)
+
+    def get_colliding(self, objs, rect):
+        """Return list with given objects colliding with given rect.
+
+        Only objects which may collide according to the spatial
+        index are checked (see the spatialindex.py module).
+
+        The objects returned are aligned beforehand (see the scroll()
+        method), so they can be drawn and checked for collision
+        right away.
+
+        Parameters
+        ==========
+        objs (iterable)
+            objects from the graph (nodes, text blocks, preview
+            toolbars and panels).
+        rect (pygame.Rect)
+            area on the screen.
+        """
+        candidates = self.get_candidates(objs, rect)
+
+        ### if there's no scrolling pending, just check the
+        ### objects against the rect
+
+        if not self.is_scrolling_pending():
+            return [obj for obj in candidates if rect.colliderect(obj.rect)]
+
+        ### otherwise, check the objects against the area the rect
+        ### would occupy if the pending scrolling was applied to them,
+        ### aligning them in case they collide
+
+        dx, dy = self.pending_scrolling
+        unaligned_rect = rect.move(-dx, -dy)
+
+        partially_aligned_map = self.partially_aligned_map
+        align_obj = self.align_obj
+
+        colliding_objs = []
+
+        for obj in candidates:
+
+            applied_scrolling = partially_aligned_map.get(obj)
+
+            area = (
+                unaligned_rect
+                if applied_scrolling is None
+                else unaligned_rect.move(applied_scrolling)
+            )
+
+            if area.colliderect(obj.rect):
+
+                align_obj(obj)
+                colliding_objs.append(obj)
+
+        return colliding_objs
 
     def scroll_on_direction(self, x_direction, y_direction):
         """Scroll according to given directions.
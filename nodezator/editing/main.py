@@ -14,13 +14,24 @@
 from .reposition import Repositioning
 from .data import DataHandling
 from .birdseyeview import BirdsEyeViewHandling
+from .spatialindex import SpatialIndexing
+from .nodesurfcache import NodeSurfaceCaching
 
 ## more operations
 
 from .imageexport.main import export_as_image
 from .imageexport.form import reset_image_filename
 
-from .pythonexporting import export_as_python, view_as_python
+from .pythonexporting import (
+    export_as_python,
+    export_as_concurrent_python,
+    view_as_python,
+)
+
+from .profilingreport import (
+    view_profiling_report,
+    export_profiling_report,
+)
 
 from .categorycolors import (
     rebuild_category_color_form,
@@ -70,6 +81,8 @@ class EditingAssistant(
     Repositioning,
     DataHandling,
     BirdsEyeViewHandling,
+    SpatialIndexing,
+    NodeSurfaceCaching,
 ):
     """Assist objects operations like selection/positioning.
 
@@ -100,8 +113,12 @@ def __init__(self):
 
         self.export_as_image = export_as_image
         self.export_as_python = export_as_python
+        self.export_as_concurrent_python = export_as_concurrent_python
         self.view_as_python = view_as_python
 
+        self.view_profiling_report = view_profiling_report
+        self.export_profiling_report = export_profiling_report
+
         ### store calls to present forms
 
         self.present_rename_node_packs_form = present_rename_node_packs_form
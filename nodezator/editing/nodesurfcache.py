@@ -0,0 +1,124 @@
+"""Facility for reusing composited surfaces of nodes.
+
+Callable nodes are drawn by blitting each of their elements (background
+pieces, text, widgets, buttons, icons and sockets) on the screen. In
+frames in which objects can't change other than by scrolling (the same
+frames in which the spatial index is used, see the spatialindex.py
+module), such elements look the same from one frame to the next, so
+they are composited in a single surface which is reused, drawing each
+node with a single blit.
+"""
+
+### third-party imports
+
+from pygame import Surface
+
+from pygame.locals import SRCALPHA
+
+
+### local imports
+
+from ..pygamesetup import blit_on_screen
+
+from ..pygamesetup.constants import GENERAL_NS
+
+
+
+class NodeSurfaceCaching:
+    """Keeps composited surfaces of nodes drawn recently.
+
+    Surfaces are discarded along with the spatial index (check the
+    SpatialIndexing class). Additionally, to keep memory usage low,
+    only the surfaces of nodes drawn in the current or previous frame
+    are kept.
+    """
+
+    def __init__(self):
+        """Define controls for caching node surfaces."""
+        ### maps associating nodes to their composited surfaces and
+        ### the offsets of the surfaces from the topleft of the nodes,
+        ### for nodes drawn in the current and previous frames
+
+        self.node_surf_map = {}
+        self.previous_node_surf_map = {}
+
+        ### index of frame in which the surfaces in the map above
+        ### were drawn
+        self.node_surf_frame_index = None
+
+    def discard_node_surfaces(self):
+        """Discard all composited surfaces of nodes."""
+        self.node_surf_map.clear()
+        self.previous_node_surf_map.clear()
+
+    def draw_node_surface(self, node):
+        """Draw node from composited surface, if possible.
+
+        Returns whether the node was drawn. If the current frame
+        doesn't allow surfaces to be reused, nothing is drawn and
+        the node must draw its elements by itself.
+
+        Parameters
+        ==========
+        node (graphman.callablenode.main.CallableNode instance)
+            node to be drawn.
+        """
+        frame_index = GENERAL_NS.frame_index
+
+        if self.indexable_frame_index != frame_index:
+            return False
+
+        ### if this is the first node drawn in the frame, keep only
+        ### the surfaces of nodes drawn in the previous frame
+
+        if self.node_surf_frame_index != frame_index:
+
+            self.previous_node_surf_map = self.node_surf_map
+            self.node_surf_map = {}
+
+            self.node_surf_frame_index = frame_index
+
+        ### retrieve surface of node, compositing it if needed
+
+        try:
+            surf, (dx, dy) = self.node_surf_map[node]
+
+        except KeyError:
+
+            surf_data = self.previous_node_surf_map.get(node)
+
+            if surf_data is None:
+                surf_data = get_composited_surface(node)
+
+            self.node_surf_map[node] = surf_data
+
+            surf, (dx, dy) = surf_data
+
+        ### draw it
+
+        x, y = node.rect.topleft
+        blit_on_screen(surf, (x + dx, y + dy))
+
+        return True
+
+
+def get_composited_surface(node):
+    """Return surface with visible elements of node and its offset.
+
+    The offset is the position of the surface relative to the topleft
+    of the node.
+    """
+    objs = tuple(node.yield_visible_objects())
+
+    union = objs[0].rect.unionall([obj.rect for obj in objs])
+
+    surf = Surface(union.size, SRCALPHA)
+
+    left, top = union.topleft
+
+    for obj in objs:
+        surf.blit(obj.image, obj.rect.move(-left, -top))
+
+    x, y = node.rect.topleft
+
+    return surf, (left - x, top - y)
@@ -0,0 +1,112 @@
+"""Functions for visualizing and saving graph execution profiling reports."""
+
+### local imports
+
+from ..config import APP_REFS
+
+from ..dialog import create_and_show_dialog
+
+from ..fileman.main import select_paths
+
+from ..our3rdlibs.behaviour import set_status_message
+
+from ..textman.viewer.main import view_text
+
+from ..graphman.profiling import (
+    get_report_rows,
+    get_report_text,
+    save_report,
+)
+
+
+
+### constants
+
+NEW_REPORT_FILEPATH_CAPTION = (
+    "Pick a new path for the profiling report (.pyl or .csv)"
+)
+
+NO_PROFILING_DATA = (
+    "There's no profiling data. Enable profiling in the"
+    " \"Graph > Profiling\" submenu of the menubar and execute"
+    " the graph."
+)
+
+
+### main functions
+
+def view_profiling_report():
+    """Display report of last profiled execution in text viewer."""
+
+    rows = get_profiling_report_rows()
+
+    if rows:
+
+        view_text(
+            get_report_text(rows),
+            header_text="Profiling report (slowest nodes first)",
+        )
+
+
+def export_profiling_report():
+    """Save report of last profiled execution as .pyl or .csv file."""
+
+    rows = get_profiling_report_rows()
+
+    if not rows:
+        return
+
+    ### define a default name for the report based on the name of the
+    ### loaded .ndz file
+    filename = APP_REFS.source_path.stem + '_profiling_report.csv'
+
+    ### grab filepath
+
+    paths = select_paths(
+        caption=NEW_REPORT_FILEPATH_CAPTION,
+        path_name=filename,
+        expecting_files_only=True,
+    )
+
+    ### if no path is given, we return earlier, since it means the
+    ### user cancelled the operation
+
+    if paths:
+        filepath = paths[0]
+
+    else:
+        return
+
+    ### if the extension is not allowed, notify the user and cancel
+    ### the operation by returning
+
+    if filepath.suffix.lower() not in ('.pyl', '.csv'):
+
+        create_and_show_dialog(
+            "File extension must be '.pyl' or '.csv'",
+            level_name='info',
+        )
+
+        return
+
+    ### otherwise, save the report in the given path and set status
+    ### message informing user
+
+    save_report(rows, filepath)
+
+    set_status_message(f"Profiling report succesfully saved in {filepath}")
+
+
+### assisting function
+
+def get_profiling_report_rows():
+    """Return rows of report or notify user there's no profiling data."""
+
+    gm = APP_REFS.gm
+
+    rows = get_report_rows(gm.node_profile_map, gm.node_map)
+
+    if not rows:
+        create_and_show_dialog(NO_PROFILING_DATA, level_name='info')
+
+    return rows
@@ -30,10 +30,11 @@
 
 ### main functions
 
-def export_as_python():
+def export_as_python(concurrent=False):
 
-    ### get the plain Python version of the graph
-    exported_python_code = get_exported_python_code()
+    ### get the plain Python version of the graph (or its concurrent
+    ### version, if requested)
+    exported_python_code = get_exported_python_code(concurrent)
 
     ### if such version is empty, exit function by returning earlier
 
@@ -90,6 +91,11 @@ def export_as_python():
     set_status_message(message)
 
 
+def export_as_concurrent_python():
+    """Export graph as script which runs independent nodes concurrently."""
+    export_as_python(concurrent=True)
+
+
 def view_as_python():
 
     exported_python_code = get_exported_python_code()
@@ -105,12 +111,12 @@ def view_as_python():
 
 ### assisting function
 
-def get_exported_python_code():
+def get_exported_python_code(concurrent=False):
 
     ### try returning exported python code
 
     try:
-        return APP_REFS.gm.python_repr()
+        return APP_REFS.gm.python_repr(concurrent)
 
     ### if it fails, notify the user and return False
 
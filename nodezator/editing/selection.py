@@ -50,8 +50,12 @@ def __init__(self):
 
     def draw_selected(self):
         """Draw outline of selected objects."""
+        align_obj = self.align_obj
+
         for obj in self.selected_objs:
 
+            align_obj(obj)
+
             obj.draw_selection_outline(
                 ACTIVE_SELECTION if obj is self.active_obj else NORMAL_SELECTION
             )
@@ -260,20 +264,18 @@ def confirm_box_selection(self):
 
     def get_box_colliding(self):
         """Return set of objs colliding w/ selection box."""
-        ### reference collision operation locally
-        collides = self.selection_box.colliderect
-
-        ### return set with each colliding object
-
-        return {
-            ## store an object...
-            obj
-            ## for each obj among the function nodes and
-            ## text blocks...
-            for obj in chain(APP_REFS.gm.nodes, APP_REFS.gm.text_blocks)
-            ## if that object collides with the selection box
-            if collides(obj.rect)
-        }
+        ### reference operation to get colliding objects locally
+        get_colliding = self.get_colliding
+
+        ### return set with each colliding object among the
+        ### nodes and text blocks
+
+        return set(
+            chain(
+                get_colliding(APP_REFS.gm.nodes, self.selection_box),
+                get_colliding(APP_REFS.gm.text_blocks, self.selection_box),
+            )
+        )
 
     def box_select_extend_colliding(self):
         """Add objs colliding w/ box to selection."""
@@ -0,0 +1,194 @@
+"""Facility for spatial indexing of objects in the graph.
+
+Looking for the objects on the screen (or colliding with any other
+area) by checking every object in the graph makes the cost of drawing
+and hit-testing grow with the size of the graph. Here we define a
+uniform grid which indexes objects by the cells they occupy, so only
+objects in the cells around an area need to be checked.
+
+The grid stores the position each object would have if the canvas
+wasn't scrolled, so scrolling doesn't invalidate it. Objects are
+moved, resized, created and deleted in many different places, though,
+so rather than updating the grid in each of them, the grids are
+discarded whenever such changes may happen and rebuilt when needed
+(see the SpatialIndexing class below).
+"""
+
+### standard library import
+from math import floor
+
+
+### local import
+from ..pygamesetup.constants import GENERAL_NS
+
+
+
+### length in pixels of the sides of each cell in the grid
+CELL_SIZE = 512
+
+### amount in pixels by which areas are inflated when looking for
+### objects, to account for the truncation of fractional scrolling
+### amounts when moving rects
+SEARCH_MARGIN = 2
+
+
+
+class SpatialGrid:
+    """Uniform grid associating cells to the objects within them."""
+
+    def __init__(self, objs, get_offset):
+        """Index given objects.
+
+        Parameters
+        ==========
+        objs (iterable)
+            objects with a 'rect' attribute.
+        get_offset (callable)
+            returns the offset which must be added to the rect of a
+            given object to obtain its position in the grid.
+        """
+        self.cell_map = cell_map = {}
+        get_items = cell_map.get
+
+        for index, obj in enumerate(objs):
+
+            dx, dy = get_offset(obj)
+            left, top, width, height = obj.rect
+
+            left += dx
+            top += dy
+
+            item = (index, obj)
+
+            first_row = floor(top / CELL_SIZE)
+            last_row = floor((top + height) / CELL_SIZE)
+
+            for column in range(
+                floor(left / CELL_SIZE),
+                floor((left + width) / CELL_SIZE) + 1,
+            ):
+
+                for row in range(first_row, last_row + 1):
+
+                    items = get_items((column, row))
+
+                    if items is None:
+                        cell_map[column, row] = [item]
+                    else:
+                        items.append(item)
+
+    def get_candidates(self, left, top, width, height):
+        """Return list of objects which may collide with given area.
+
+        Objects are returned in the order they were indexed, so
+        the order in which they are drawn is preserved.
+        """
+        index_to_obj = {}
+        get_items = self.cell_map.get
+
+        for column in range(
+            floor(left / CELL_SIZE),
+            floor((left + width) / CELL_SIZE) + 1,
+        ):
+
+            for row in range(
+                floor(top / CELL_SIZE),
+                floor((top + height) / CELL_SIZE) + 1,
+            ):
+
+                items = get_items((column, row))
+
+                if items:
+                    index_to_obj.update(items)
+
+        return [index_to_obj[index] for index in sorted(index_to_obj)]
+
+
+class SpatialIndexing:
+    """Keeps spatial grids with the objects in the graph.
+
+    A grid for a collection of objects is created the first time the
+    collection is searched and kept until discarded.
+
+    Grids are only used in frames in which objects can't change other
+    than by scrolling, which must be signaled by calling
+    keep_spatial_index() at the beginning of such frames. If the
+    previous frame wasn't signaled as well, objects may have changed
+    in the meantime, so the grids are discarded. Changes must also be
+    signaled within such frames by calling discard_spatial_index().
+
+    In all other frames objects are searched one by one, like before.
+
+    Composited surfaces of nodes rely on the same frames, so they are
+    discarded along with the grids (check the NodeSurfaceCaching
+    class).
+    """
+
+    def __init__(self):
+        """Define controls for spatial indexing."""
+        ### map associating the id of collections to their grids
+        self.spatial_grid_map = {}
+
+        ### index of frame in which grids can be used
+        self.indexable_frame_index = None
+
+    def keep_spatial_index(self):
+        """Allow spatial grids to be used in the current frame."""
+        frame_index = GENERAL_NS.frame_index
+
+        if self.indexable_frame_index != frame_index - 1:
+            self.spatial_grid_map.clear()
+            self.discard_node_surfaces()
+
+        self.indexable_frame_index = frame_index
+
+    def discard_spatial_index(self):
+        """Discard grids and prevent their use in the current frame."""
+        self.spatial_grid_map.clear()
+        self.discard_node_surfaces()
+        self.indexable_frame_index = None
+
+    def get_offset_from_origin(self, obj):
+        """Return offset from rect of obj to its unscrolled position."""
+        dx, dy = self.get_unaligned_scrolling(obj)
+        x, y = self.scrolling_amount
+
+        return dx - x, dy - y
+
+    def get_candidates(self, objs, rect):
+        """Return objects which may collide with given area.
+
+        If grids can't be used in the current frame, the objects
+        are returned as-is.
+
+        Parameters
+        ==========
+        objs (iterable)
+            objects from the graph (nodes, text blocks, preview
+            toolbars and panels).
+        rect (pygame.Rect)
+            area on the screen.
+        """
+        if self.indexable_frame_index != GENERAL_NS.frame_index:
+            return objs
+
+        spatial_grid_map = self.spatial_grid_map
+
+        try:
+            grid = spatial_grid_map[id(objs)]
+
+        except KeyError:
+
+            grid = spatial_grid_map[id(objs)] = (
+                SpatialGrid(objs, self.get_offset_from_origin)
+            )
+
+        x, y = self.scrolling_amount
+        left, top, width, height = rect
+
+        return grid.get_candidates(
+            left - x - SEARCH_MARGIN,
+            top - y - SEARCH_MARGIN,
+            width + SEARCH_MARGIN * 2,
+            height + SEARCH_MARGIN * 2,
+        )
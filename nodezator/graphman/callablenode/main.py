@@ -4,6 +4,13 @@
 
 from ...config import APP_REFS
 
+from ...appinfo import (
+    USE_PROCESS_POOL_VAR_NAME,
+    DETERMINISTIC_VAR_NAME,
+    ITEM_WISE_VAR_NAME,
+    EXECUTION_TIMEOUT_VAR_NAME,
+)
+
 from ...ourstdlibs.behaviour import empty_function
 from ...our3rdlibs.behaviour import indicate_unsaved
 
@@ -130,11 +137,17 @@ def __init__(
             self.title_text = call_format
 
         ### store import statements from node defining
-        ### object, if present
+        ### object, if present (as well as the variables defining
+        ### how the main callable must be executed, like whether it
+        ### must be executed in a separate process)
 
         for key in (
             "stlib_import_text",
             "third_party_import_text",
+            USE_PROCESS_POOL_VAR_NAME,
+            DETERMINISTIC_VAR_NAME,
+            ITEM_WISE_VAR_NAME,
+            EXECUTION_TIMEOUT_VAR_NAME,
         ):
 
             try:
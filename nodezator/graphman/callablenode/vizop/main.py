@@ -158,9 +158,15 @@ def yield_mouse_aware_objects_in_calmode(self):
         yield from self.output_sockets
 
     def draw(self):
-        """Draw node elements on screen."""
-        for obj in self.yield_visible_objects():
-            obj.draw()
+        """Draw node elements on screen.
+
+        Whenever possible, the elements are drawn at once, from a
+        composited surface kept by the editing assistant.
+        """
+        if not APP_REFS.ea.draw_node_surface(self):
+
+            for obj in self.yield_visible_objects():
+                obj.draw()
 
     def yield_visible_objects_in_expmode(self):
 
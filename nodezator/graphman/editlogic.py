@@ -62,6 +62,11 @@ def remove_node(self, node):
         ### using its id
         self.nodes_data.pop(node.id)
 
+        ### discard the node's cached output and profiling data, if any
+
+        self.node_output_cache.pop(node.id, None)
+        self.node_profile_map.pop(node.id, None)
+
         ### if the node has preview objects, remove them as well
 
         for attr_name, collection in zip(
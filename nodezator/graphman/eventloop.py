@@ -0,0 +1,113 @@
+"""Facility for awaiting async main callables of nodes.
+
+Node scripts can define their main callables as coroutine functions
+(with "async def"). The coroutines are awaited on a shared asyncio event
+loop, which runs in a dedicated thread for as long as the app runs.
+
+Since the loop doesn't run in the main thread, coroutines can be
+submitted from the main thread and waited for just like the callables
+executed in worker threads/processes. Coroutines submitted before any
+of them is waited for are awaited concurrently, so their IO waits
+overlap.
+"""
+
+### standard library imports
+
+from asyncio import (
+    new_event_loop,
+    set_event_loop,
+    run_coroutine_threadsafe,
+    ensure_future,
+    wait,
+    CancelledError,
+)
+
+from threading import Thread
+
+
+### local import
+from .exception import ExecutionTimeoutError
+
+
+
+class EventLoop:
+    """Runs event loop in a dedicated thread.
+
+    This class is instantiated only once in the end of the module
+    and its methods are aliased to be used wherever needed.
+    """
+
+    def __init__(self):
+        """Create attribute to hold the loop."""
+        ### the loop (and its thread) is only created when first needed
+        self.loop = None
+
+    def submit_coroutine(self, coroutine):
+        """Schedule coroutine on the event loop.
+
+        Returns a concurrent.futures.Future representing its result.
+        """
+        if self.loop is None:
+
+            self.loop = new_event_loop()
+
+            Thread(
+                target=self.run_loop,
+                name='nodezator-event-loop',
+                daemon=True,
+            ).start()
+
+        return run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run_loop(self):
+        """Run event loop forever (executed in the loop's thread)."""
+        set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+async def await_within(awaitable, timeout=None):
+    """Return result of awaitable, raising error if it takes too long.
+
+    Parameters
+    ==========
+
+    awaitable (awaitable object)
+        object to be awaited, like a coroutine.
+    timeout (int, float or None)
+        maximum number of seconds to wait for the result; if None,
+        waits for as long as needed.
+    """
+    task = ensure_future(awaitable)
+
+    ### wait for the task, making sure it is cancelled if the
+    ### waiting itself is cancelled
+
+    try:
+        done, _ = await wait((task,), timeout=timeout)
+
+    except CancelledError:
+
+        task.cancel()
+        raise
+
+    ### if the task didn't finish in time, cancel it and raise
+    ### an error
+
+    if not done:
+
+        task.cancel()
+
+        raise ExecutionTimeoutError(
+            f"callable didn't finish within {timeout} seconds,"
+            " so it was cancelled"
+        )
+
+    return task.result()
+
+
+### instantiate event loop runner and reference its relevant method in
+### the module level, so it can be easily imported
+
+_ = EventLoop()
+
+submit_coroutine = _.submit_coroutine
@@ -183,6 +183,36 @@ def __init__(
 
 
 
+class CyclicGraphError(Exception):
+    """Raised when nodes to be executed can't be sorted due to cycles.
+
+    That is, when the connections between nodes form one or more cycles,
+    so some nodes depend, directly or not, on their own outputs.
+    """
+
+    def __init__(self, unsorted_nodes):
+        """Execute superclass __init__ w/ custom message."""
+        ### store reference to nodes which couldn't be sorted
+        self.unsorted_nodes = unsorted_nodes
+
+        ### create a string representing a message with
+        ### information about the nodes
+
+        report_message = (
+            "the graph can't be executed because the following nodes"
+            " are part of cycles or depend on nodes which are (that is,"
+            " they depend on their own outputs): {}"
+        ).format(
+            ", ".join(
+                f"'{node.title_text}'() (id {node.id})"
+                for node in sorted(unsorted_nodes, key=lambda node: node.id)
+            )
+        )
+
+        ### initialize superclass with custom message
+        super().__init__(report_message)
+
+
 class UnexpectedOutputError(Exception):
     """Raised whenever expected mapping output misses one or more keys.
 
@@ -308,6 +338,54 @@ def __init__(self, node):
         super().__init__(report_message)
 
 
+class ProcessPoolPicklingError(Exception):
+    """Raised when data can't be sent to/from a separate process.
+
+    That is, when the arguments of a node whose callable is executed
+    in a separate process or the value returned by such callable
+    can't be pickled.
+    """
+
+    def __init__(self, node, data_description, error_text):
+        """Execute superclass __init__ w/ custom message."""
+        ### create a string representing a message with
+        ### information about the node and the data which
+        ### couldn't be pickled
+
+        report_message = (
+            "the {} of the '{}'() node (id {}) couldn't be pickled"
+            " in order to be sent {} a separate process ({}); remove"
+            " the node script's request for execution in a separate"
+            " process (or the timeout, if any) or make sure the data"
+            " can be pickled"
+        ).format(
+            data_description,
+            node.title_text,
+            node.id,
+            'to' if data_description == 'arguments' else 'from',
+            error_text,
+        )
+
+        ### initialize superclass with custom message
+        super().__init__(report_message)
+
+
+class ExecutionCancelledError(Exception):
+    """Raised when the user cancels the graph execution.
+
+    That is, when the user cancels the execution while waiting for
+    node callables executed in the background to finish.
+    """
+
+
+class ExecutionTimeoutError(TimeoutError):
+    """Raised when a node callable exceeds its timeout.
+
+    The callable is stopped beforehand (its worker process is
+    killed or, if it is async, it is cancelled).
+    """
+
+
 ### proxy node error
 
 
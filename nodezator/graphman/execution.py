@@ -2,7 +2,9 @@
 
 ### standard library imports
 
-from time import time
+from time import time, thread_time
+
+from itertools import chain
 
 from io import StringIO
 
@@ -12,7 +14,17 @@
 
 from os import linesep
 
-from itertools import chain
+from os import cpu_count
+
+from inspect import iscoroutinefunction
+
+from pickle import dumps, loads
+
+from multiprocessing import get_context
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from concurrent.futures.process import BrokenProcessPool
 
 
 ### local imports
@@ -20,6 +32,10 @@
 from ..config import APP_REFS
 
 from ..appinfo import (
+    USE_PROCESS_POOL_VAR_NAME,
+    DETERMINISTIC_VAR_NAME,
+    ITEM_WISE_VAR_NAME,
+    EXECUTION_TIMEOUT_VAR_NAME,
     BACKDOOR_INDICATIVE_VAR_NAMES,
     SIDEVIZ_FROM_OUTPUT_VAR_NAME,
     LOOPVIZ_FROM_OUTPUT_VAR_NAME,
@@ -46,9 +62,54 @@
     PositionalSubparameterUnpackingError,
     KeywordSubparameterUnpackingError,
     ProxyNodesLackingDataError,
+    ProcessPoolPicklingError,
+    ExecutionCancelledError,
+    ExecutionTimeoutError,
+    CyclicGraphError,
+)
+
+from .utils import (
+    lay_arguments_and_execute,
+    lay_arguments,
+    yield_upstream_nodes,
+)
+
+from .processpool import (
+    call_main_callable,
+    load_node_script,
+    ReturnValuePicklingError,
+)
+
+from .executionmonitor import wait_for_future
+
+from .eventloop import submit_coroutine, await_within
+
+from .watchdog import submit_to_watchdog, shutdown_watchdog
+
+from .streaming import (
+    Stream,
+    yield_item_outputs,
+    yield_output_items,
+    drain,
+)
+
+from .socket.proxy import ProxySocket
+
+from .resultcache import (
+    get_result_cache_key,
+    load_cached_output,
+    store_output_in_cache,
+    purge_result_cache,
+    clear_node_pack_hashes,
 )
 
-from .utils import lay_arguments_and_execute, yield_upstream_nodes
+from .profiling import (
+    profile_call,
+    estimate_size,
+    get_report_rows,
+    get_report_text,
+    format_bytes,
+)
 
 
 
@@ -75,6 +136,21 @@
     " commented out."
 )
 
+## types whose values are compared by equality rather than identity
+## when checking whether the inputs of a node changed
+
+LITERAL_TYPES = frozenset((
+    int,
+    float,
+    complex,
+    bool,
+    str,
+    bytes,
+    type(None),
+))
+
+EMPTY_DICT = {}
+
 
 ### main class
 
@@ -131,13 +207,61 @@ def __init__(self):
         self.clear_node_generations = node_generations.clear
         self.append_node_generation = node_generations.append
 
-        ### create list of executed nodes
+        ### create set of nodes to be executed and list of executed nodes
+
+        self.nodes_to_execute = set()
         self.executed_nodes = []
 
+        ### create maps used to release outputs as soon as all nodes
+        ### consuming them are finished: one associating each node
+        ### to be executed with the ids of the nodes providing inputs
+        ### to it and another associating the id of each node with the
+        ### number of nodes consuming its output which weren't finished
+        ### yet
+
+        self.source_ids_map = {}
+        self.pending_consumers_map = {}
+
         ### create map to track node execution time
         self.node_exec_time_map = {}
 
-    def execute_graph(self, requested_nodes=None):
+        ### create map to store the last output of each node along with
+        ### a fingerprint of the inputs used to produce it, so nodes whose
+        ### inputs didn't change can have their execution skipped when
+        ### using incremental execution
+        self.node_output_cache = {}
+
+        ### create set to store ids of nodes whose last outputs were
+        ### reused
+        self.reused_node_ids = set()
+
+        ### create map to store profiling data of each node, when
+        ### profiling is enabled
+        self.node_profile_map = {}
+
+        ### create map to store the CPU time taken by async callables
+        ### when profiling, since they are awaited on the event loop's
+        ### thread rather than in the thread where they are profiled
+        self.event_loop_cpu_time_map = {}
+
+        ### create attribute to hold map where outputs of executed
+        ### nodes are stored when requested (for instance, when
+        ### executing graphs from the command line); outputs aren't
+        ### stored when it is None
+        self.output_map = None
+
+        ### create attribute to hold ids of nodes whose outputs must be
+        ### kept in the output map above; the outputs of other nodes are
+        ### removed from it as soon as the nodes consuming them finish
+        ### (outputs which aren't consumed by other nodes are kept)
+        self.output_ids_to_keep = ()
+
+        ### create attribute to hold process pool used to execute
+        ### callables of nodes whose scripts request so (the pool
+        ### is only created when needed)
+        self.process_pool = None
+
+    def execute_graph(self, requested_nodes=None, incremental=None):
         """Travel the graph, executing each node.
 
         Works by executing node by node until all of them
@@ -145,6 +269,17 @@ def execute_graph(self, requested_nodes=None):
 
         Once a node is finished, it's outputs are sent to
         the inputs of other linked nodes, if any.
+
+        Returns True if the execution finished successfully.
+
+        Parameters
+        ==========
+
+        requested_nodes (iterable of nodes or None)
+            nodes to be executed; if None, all nodes are executed.
+        incremental (bool or None)
+            whether to reuse the last outputs of nodes whose inputs
+            didn't change; if None, the user preference is used.
         """
         ### if there's no nodes in the graph, notify user
         ### via dialog and cancel operation by returning
@@ -267,12 +402,63 @@ def execute_graph(self, requested_nodes=None):
         ### reference callables from the corresponding set of nodes
         _reference_callables(self.callable_mode_nodes)
 
+        ### retrieve the number of worker threads to use and check whether
+        ### callables must be executed in the background, that is, outside
+        ### the main thread, so the window remains responsive
+        ###
+        ### if profiling is enabled, though, all callables are executed
+        ### sequentially in the main thread, so the measurements of a node
+        ### aren't affected by other nodes being executed concurrently
+
+        self.profiling = USER_PREFS['PROFILE_EXECUTION']
+
+        max_workers = USER_PREFS['EXECUTION_WORKERS']
+        self.background = (
+            USER_PREFS['BACKGROUND_EXECUTION']
+            and not self.profiling
+            and not APP_REFS.headless
+        )
+
+        use_threads = (
+            (max_workers > 1 or self.background)
+            and not self.profiling
+        )
+
         ### at this point, all the nodes, except the ones for sorting,
         ### were visited and dealt with already;
         ###
         ### now it is time to sort the remaining nodes so we can execute
-        ### them
-        self._sort_nodes()
+        ### them;
+        ###
+        ### if callables are to be called one at a time (no worker
+        ### threads nor separate processes are used and there are no
+        ### async callables to be awaited concurrently), the nodes are
+        ### sorted depth-first, so outputs are released as early as
+        ### possible;
+        ###
+        ### if the nodes form cycles, they can't be sorted, so we notify
+        ### the user via dialog and cancel the operation by returning
+        ### earlier
+
+        depth_first = not use_threads and not any(
+            getattr(node, USE_PROCESS_POOL_VAR_NAME, False)
+            or iscoroutinefunction(node.main_callable)
+            for node in self.nodes_to_sort
+        )
+
+        try:
+            self._sort_nodes(depth_first)
+
+        except CyclicGraphError as err:
+
+            _clear_arguments(self.nodes)
+            create_and_show_dialog(str(err), level_name='error')
+            return
+
+        ### store the nodes to be executed and their number
+
+        self.nodes_to_execute = set(chain.from_iterable(self.node_generations))
+        self.nodes_to_execute_count = len(self.nodes_to_execute)
 
         ### make preparations to execute the sorted nodes
 
@@ -287,6 +473,46 @@ def execute_graph(self, requested_nodes=None):
         node_exec_time_map = self.node_exec_time_map
         node_exec_time_map.clear()
 
+        ## clear set to store ids of nodes whose outputs were reused
+        self.reused_node_ids.clear()
+
+        ## node packs may have been edited since the last execution,
+        ## so their hashes (used in the keys of the persistent result
+        ## cache) must be computed again
+        clear_node_pack_hashes()
+
+        ## check whether incremental execution is enabled and, if so,
+        ## discard cached outputs from nodes that don't exist anymore
+
+        self.incremental = (
+            USER_PREFS['INCREMENTAL_EXECUTION']
+            if incremental is None
+            else incremental
+        )
+
+        node_output_cache = self.node_output_cache
+
+        if self.incremental:
+
+            for node_id in node_output_cache.keys() - self.node_map.keys():
+                del node_output_cache[node_id]
+
+        else:
+            node_output_cache.clear()
+
+        ## clear maps to store profiling data
+        self.node_profile_map.clear()
+        self.event_loop_cpu_time_map.clear()
+
+        ## if callables are to be executed in worker threads, create
+        ## the corresponding executor
+
+        executor = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if use_threads
+            else None
+        )
+
         ## mark the beginning of the node layout execution
         layout_exec_start = time()
 
@@ -296,252 +522,1022 @@ def execute_graph(self, requested_nodes=None):
         ### the nodes were sorted and divided in different groups
         ### called generations;
         ###
-        ### iterate over the sorted nodes one by one, executing them and
-        ### performing several other related tasks as needed, like sending
-        ### output to the next nodes, etc.
+        ### the nodes of each generation are executed concurrently when
+        ### possible, since they don't depend on each other (if more than
+        ### one worker thread is to be used or if node scripts requested
+        ### execution in a separate process); executing a node also
+        ### involves other related tasks as needed, like sending output
+        ### to the next nodes, etc.
 
-        for node in chain.from_iterable(self.node_generations):
+        try:
 
-            ### try executing the node
+            for node_generation in self.node_generations:
 
-            try:
+                self._execute_node_generation(
+                    node_generation,
+                    executor,
+                )
 
-                ## first, perform pre-execution setups
-                node.perform_pre_execution_setups()
+        ### if an error is thrown, act according to its
+        ### class
 
-                ## check whether node has a callable used as a
-                ## backdoor to retrieve visuals from it, storing
-                ## such backdoor if so
+        except Exception as err:
 
-                for var_name in BACKDOOR_INDICATIVE_VAR_NAMES:
+            ## shut down the executor without waiting for callables
+            ## still running in its worker threads, since their outputs
+            ## won't be used anyway (callables not started yet were
+            ## already cancelled)
 
-                    if hasattr(node, var_name):
-                        backdoor = getattr(node, var_name)
-                        break
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-                else:
-                    backdoor = None
+            ## clear all stored arguments
+            ##
+            ## this is safe even if callables are still running in
+            ## worker threads, because the arguments are laid out
+            ## in the main thread before being passed to them
+            _clear_arguments(self.nodes)
 
-                ## pick appropriate callable object depending on
-                ## whether the backdoor exists
-                callable_obj = backdoor if backdoor else node.main_callable
+            ## if the execution was cancelled by the user, just
+            ## notify the user via the status message
 
-                ### try executing the callable by passing the needed
-                ### arguments to a function that will execute it and
-                ### return the callable's return value
+            if isinstance(err, ExecutionCancelledError):
 
-                try:
+                set_status_message(
+                    "Graph execution was cancelled"
+                    f" ({len(executed_nodes)} of"
+                    f" {self.nodes_to_execute_count}"
+                    " nodes were executed)"
+                )
 
-                    ## execute
+            ## if the error is among the ones listed
+            ## below, just notify the user via dialog,
+            ## using the error converted to a string
+            ## as the error message
+
+            elif isinstance(
+                err,
+                (
+                    UnexpectedOutputError,
+                    PositionalSubparameterUnpackingError,
+                    KeywordSubparameterUnpackingError,
+                    ProcessPoolPicklingError,
+                ),
+            ):
 
-                    node_exec_start = time()
+                create_and_show_dialog(str(err), level_name="error")
 
-                    return_value = lay_arguments_and_execute(
-                        callable_obj, node.argument_map, node.signature_obj
-                    )
+            ## any other kind of error is either within the node being
+            ## executed or completely unexpected, so we take further
+            ## measures
 
-                    node_exec_time_map[node.id] = time() - node_exec_start
+            else:
 
-                    output_to_send = return_value
 
-                ### if an unexpected error occurs,
-                ### raise a custom error from the
-                ### original one
+                ## build a custom log message to be logged
+                ## depending on whether the error was caused
+                ## during call/execution of a node's callable
+                ## or not
 
-                except Exception as err:
-                    raise NodeCallableError(node) from err
+                if isinstance(err, NodeCallableError):
 
-                ### if needed:
-                ###   - redefine output to be sent to downstream nodes
-                ###   - set visuals/looping
+                    # if the error happened while consuming a stream
+                    # from an item-wise node, the error is related to
+                    # the item-wise node instead, so we grab it
 
-                try:
+                    while isinstance(err.__cause__, NodeCallableError):
+                        err = err.__cause__
 
-                    if backdoor:
+                    # grab the node wherein the
+                    # error bubbled up
+                    error_node = err.node
 
-                        node.set_visual(return_value['in_graph_visual'])
+                    # grab the original error
+                    original_error = err.__cause__
 
-                        if hasattr(node, 'loop_entering_command'):
+                    log_message = (
 
-                            node.loop_data = return_value['loop_data']
+                        f"'{error_node.title_text}'() callable from node"
+                        f" #{error_node.id} exceeded its timeout and was"
+                        " stopped."
 
-                            if node.preview_toolbar.check_button.get():
-                                node.loop_entering_command()
+                        if isinstance(original_error, ExecutionTimeoutError)
 
-                        output_to_send = return_value.get('output')
+                        else (
+                            f"'{error_node.title_text}'() callable from node"
+                            f" #{error_node.id} produced an unexpected"
+                            f" output for one of its items ({original_error})."
+                        )
 
-                    elif hasattr(node, SIDEVIZ_FROM_OUTPUT_VAR_NAME):
+                        if isinstance(original_error, UnexpectedOutputError)
 
-                        node.set_visual(
-                            node.get_sideviz_from_output(return_value)
+                        else (
+                            f"'{error_node.title_text}'() callable from node"
+                            f" #{error_node.id} raised an error."
                         )
 
-                        ###
+                    )
 
-                        loop_data_retrieval_op = (
-                            getattr(node, LOOPVIZ_FROM_OUTPUT_VAR_NAME, None)
-                        )
 
-                        if loop_data_retrieval_op:
+                ## otherwise we just notify the user
+                ## with a custom error message
 
-                            node.loop_data = loop_data_retrieval_op(return_value)
+                else:
 
-                            if node.preview_toolbar.check_button.get():
-                                node.loop_entering_command()
+                    log_message = (
+                        "An unexpected error occurred during graph"
+                        " execution."
+                    )
 
-                except Exception as err:
 
-                    raise RuntimeError(
-                        "Error while setting visual/looping/output."
-                    ) from err
+                ## log traceback
 
+                logger.exception(log_message)
+                USER_LOGGER.exception(log_message)
 
-                ###
+                ## notify user via dialog
+
+                dialog_message = log_message + (
+                    " Check the user log for more info (on"
+                    " graph/canvas, press <Ctrl+Shift+j> or access"
+                    " the \"Help > Show user log\" option on menubar)."
+                )
+
+                create_and_show_dialog(dialog_message, level_name='error')
+
+        ### provided everything went ok, we now enter this corresponding
+        ### else clause
+
+        else:
+
+            ### shut down the executor, if any
+            if executor is not None:
+                executor.shutdown()
+
+            ### clear all stored arguments on all nodes
+            _clear_arguments(self.nodes)
+
+            ### report the time taken to execute the layout in the
+            ### status label
+
+            ## XXX both layout execution time and indivual
+            ## node time (as well as their sum) should also
+            ## be logged in the user logger (for now, this
+            ## is only done when profiling is enabled, in
+            ## the form of the profiling report)
+
+            layout_exec_time = time() - layout_exec_start
+
+            tracked_nodes_total = sum(
+
+                ## item
+                node_exec_time_map[node.id]
+
+                ## source
+                for node in executed_nodes
+
+                ## filter
+                if not getattr(
+                    node.signature_callable, 'dismiss_exec_time_tracking', False
+                )
+            )
+
+            time_for_humans = friendly_delta_from_secs(tracked_nodes_total)
+
+            status_message = f'Total execution time was {time_for_humans}'
+
+            reused_nodes_count = len(self.reused_node_ids)
+
+            if reused_nodes_count:
+
+                status_message += (
+                    f' ({reused_nodes_count} of {len(executed_nodes)} nodes'
+                    ' had their outputs reused)'
+                )
 
-                # send its return value to
-                # other nodes as needed
+            set_status_message(status_message)
 
-                _send_output_to_connected_nodes(
+            ### if profiling is enabled, log profiling report
+
+            if self.profiling:
+
+                USER_LOGGER.info(
+                    "Graph execution profiling report:\n"
+                    + get_report_text(
+                        get_report_rows(self.node_profile_map, self.node_map)
+                    )
+                )
+
+            return True
+
+    def _execute_node_generation(self, node_generation, executor):
+        """Execute nodes from generation.
+
+        Since the nodes of a generation don't depend on each other,
+        their callables can be called concurrently:
+
+        - callables from nodes with a timeout (defined in their scripts
+          or in the user preferences) are called in worker processes
+          supervised by the watchdog, which kills the ones taking too
+          long (async callables are cancelled on the event loop
+          instead);
+        - callables from nodes whose scripts requested execution in a
+          separate process are called in the process pool;
+        - async callables (coroutine functions) are awaited
+          concurrently on the shared event loop, regardless of the
+          executor;
+        - if an executor is given, other callables are called in its
+          worker threads;
+        - otherwise, they are called in the main thread.
+
+        All other tasks (pre-execution setups, laying out arguments,
+        setting visuals, sending outputs to downstream nodes, etc.) are
+        performed in the main thread.
+
+        Nodes with backdoors are always executed in the main thread,
+        since their callables produce visuals.
+
+        If background execution is enabled, the window is kept
+        responsive while waiting for the callables to finish and the
+        user may cancel the execution.
+
+        Parameters
+        ==========
+
+        node_generation (list)
+            nodes which don't depend on each other.
+        executor (concurrent.futures.ThreadPoolExecutor or None)
+            executor used to call the callables of the nodes.
+        """
+        ### prepare the nodes and submit their callables for execution
+        ### where appropriate
+
+        submitted = []
+
+        for node in node_generation:
+
+            execution_data = self._prepare_node_execution(node)
+
+            if execution_data is None:
+                continue
+
+            callable_obj, backdoor, _, _ = execution_data
+
+            in_separate_process = False
+
+            ## nodes with backdoors, item-wise nodes and nodes receiving
+            ## streams from item-wise nodes are executed in the main
+            ## thread, as well as all nodes when profiling
+
+            if (
+                backdoor
+                or self.profiling
+                or getattr(node, ITEM_WISE_VAR_NAME, False)
+                or _receives_stream(node)
+            ):
+                future = None
+
+            elif (
+                not iscoroutinefunction(callable_obj)
+                and self._get_timeout(node)
+            ):
+
+                ## if the node can't be executed under the watchdog,
+                ## no future is returned and it is executed in the main
+                ## thread instead (check _submit_to_watchdog())
+
+                future = self._submit_to_watchdog(node)
+                in_separate_process = future is not None
+
+            elif getattr(node, USE_PROCESS_POOL_VAR_NAME, False):
+
+                future = self._submit_to_process_pool(node)
+                in_separate_process = True
+
+            elif iscoroutinefunction(callable_obj):
+
+                future = self._submit_to_event_loop(
                     node,
-                    output_to_send,
+                    callable_obj,
+                    lay_arguments(node.argument_map, node.signature_obj),
                 )
 
-                # perform its execution setup
-                node.perform_execution_setup()
+            elif executor is not None:
 
-                # append node to list of executed ones
-                executed_nodes.append(node)
+                future = executor.submit(
+                    self._call_node,
+                    node,
+                    callable_obj,
+                    lay_arguments(node.argument_map, node.signature_obj),
+                )
+
+            else:
+                future = None
 
+            submitted.append(
+                (node, execution_data, future, in_separate_process)
+            )
+
+        ### finish the execution of the nodes in the order they were
+        ### submitted, so the outputs are handled as in the sequential
+        ### execution
+        ###
+        ### each node is removed from the list of submitted ones (which
+        ### is reversed, so they can be popped) as soon as it is finished,
+        ### so its future doesn't keep referencing the output until the
+        ### whole generation is finished
 
-            ### if an error is thrown, act according to its
-            ### class
+        running_nodes = [node for node, _, future, _ in submitted if future]
 
-            except Exception as err:
+        submitted.reverse()
 
-                ## clear all stored arguments
-                _clear_arguments(self.nodes)
+        try:
 
-                ## if the error is among the ones listed
-                ## below, just notify the user via dialog,
-                ## using the error converted to a string
-                ## as the error message
+            while submitted:
 
-                if isinstance(
-                    err,
-                    (
-                        UnexpectedOutputError,
-                        PositionalSubparameterUnpackingError,
-                        KeywordSubparameterUnpackingError,
-                    ),
-                ):
+                (
+                    node,
+                    execution_data,
+                    future,
+                    in_separate_process,
+                ) = submitted[-1]
 
-                    create_and_show_dialog(str(err), level_name="error")
+                callable_obj, backdoor, fingerprint, cache_key = execution_data
 
-                ## any other kind of error is either within the node being
-                ## executed or completely unexpected, so we take further
-                ## measures
+                if future is None:
+                    return_value = self._call_node(node, callable_obj)
 
                 else:
 
+                    if self.background:
 
-                    ## build a custom log message to be logged
-                    ## depending on whether the error was caused
-                    ## during call/execution of a node's callable
-                    ## or not
+                        wait_for_future(
+                            future,
+                            running_nodes,
+                            self.executed_nodes,
+                            self.nodes_to_execute_count,
+                        )
 
-                    if isinstance(err, NodeCallableError):
+                    if in_separate_process:
+                        return_value = self._get_process_pool_result(node, future)
 
-                        # grab the node wherein the
-                        # error bubbled up
-                        error_node = err.node
+                    else:
+                        return_value = future.result()
 
-                        # grab the original error
-                        original_error = err.__cause__
+                    running_nodes.remove(node)
 
-                        log_message = (
-                            f"'{error_node.title_text}'() callable from node"
-                            f" #{error_node.id} raised an error."
-                        )
+                self._finish_node_execution(
+                    node,
+                    backdoor,
+                    fingerprint,
+                    cache_key,
+                    return_value,
+                )
 
+                submitted.pop()
 
-                    ## otherwise we just notify the user
-                    ## with a custom error message
+        ### if anything goes wrong (including the user cancelling the
+        ### execution), cancel the callables that didn't start yet, so
+        ### no further nodes are executed
 
-                    else:
+        except Exception:
 
-                        log_message = (
-                            "An unexpected error occurred during graph"
-                            " execution."
-                        )
+            for _, _, future, _ in submitted:
+
+                if future is not None:
+                    future.cancel()
+
+            raise
+
+    def _prepare_node_execution(self, node):
+        """Perform setups before calling node's callable.
+
+        Returns a tuple containing the callable to be used, the backdoor
+        (or None), the input fingerprint (or None) and the key used to
+        store the output in the persistent result cache (or None). If
+        the node's last output or a cached output is reused instead,
+        None is returned.
+        """
+        ### first, perform pre-execution setups
+        node.perform_pre_execution_setups()
+
+        ### check whether node has a callable used as a
+        ### backdoor to retrieve visuals from it, storing
+        ### such backdoor if so
 
+        for var_name in BACKDOOR_INDICATIVE_VAR_NAMES:
 
-                    ## log traceback
+            if hasattr(node, var_name):
+                backdoor = getattr(node, var_name)
+                break
+
+        else:
+            backdoor = None
+
+        ### pick appropriate callable object depending on
+        ### whether the backdoor exists
+        callable_obj = backdoor if backdoor else node.main_callable
+
+        ### if incremental execution is enabled, check whether
+        ### the inputs of the node are the same ones used in its
+        ### last execution; if so, reuse its last output instead
+        ### of executing it again
+
+        fingerprint = None
+
+        if self.incremental:
+
+            fingerprint = _get_input_fingerprint(node, callable_obj)
 
-                    logger.exception(log_message)
-                    USER_LOGGER.exception(log_message)
+            try:
+                cached_fingerprint, _, cached_output = (
+                    self.node_output_cache[node.id]
+                )
+
+            except KeyError:
+                pass
 
-                    ## notify user via dialog
+            else:
+
+                if cached_fingerprint == fingerprint:
 
-                    dialog_message = log_message + (
-                        " Check the user log for more info (on"
-                        " graph/canvas, press <Ctrl+Shift+j> or access"
-                        " the \"Help > Show user log\" option on menubar)."
+                    _send_output_to_connected_nodes(
+                        node,
+                        cached_output,
+                        self.nodes_to_execute,
                     )
 
-                    create_and_show_dialog(dialog_message, level_name='error')
+                    if self.output_map is not None:
+                        self.output_map[node.id] = cached_output
 
+                    node.perform_execution_setup()
+                    self._release_inputs(node)
 
-                ## break out of the for-loop (stop iterating over sorted
-                ## nodes for execution)
-                break
+                    self.node_exec_time_map[node.id] = 0.0
+                    self.executed_nodes.append(node)
+                    self.reused_node_ids.add(node.id)
 
-        ### provided everything went ok, we didn't have to break out of the
-        ### for-loop, which means we now enter this corresponding else clause
+                    return
 
-        else:
+        ### if the node script declared its main callable deterministic,
+        ### check whether an output for the same inputs is stored in the
+        ### persistent result cache; if so, use it instead of executing
+        ### the node again
 
-            ### clear all stored arguments on all nodes
-            _clear_arguments(self.nodes)
+        cache_key = None
 
-            ### report the time taken to execute the layout in the
-            ### status label
+        if (
+            not backdoor
+            and getattr(node, DETERMINISTIC_VAR_NAME, False)
+            and 'script_id' in node.data
+        ):
 
-            ## XXX both layout execution time and indivual
-            ## node time (as well as their sum) should also
-            ## be logged in the user logger
+            script_id = node.data['script_id']
 
-            layout_exec_time = time() - layout_exec_start
+            cache_key = get_result_cache_key(
+                script_id,
+                APP_REFS.script_path_map[script_id],
+                *lay_arguments(node.argument_map, node.signature_obj),
+            )
 
-            tracked_nodes_total = sum(
+            if cache_key is not None:
 
-                ## item
-                node_exec_time_map[node.id]
+                was_found, cached_output = load_cached_output(cache_key)
 
-                ## source
-                for node in executed_nodes
+                if was_found:
 
-                ## filter
-                if not getattr(
-                    node.signature_callable, 'dismiss_exec_time_tracking', False
+                    self.node_exec_time_map[node.id] = 0.0
+                    self.reused_node_ids.add(node.id)
+
+                    self._finish_node_execution(
+                        node,
+                        None,
+                        fingerprint,
+                        None,
+                        cached_output,
+                    )
+
+                    return
+
+        return callable_obj, backdoor, fingerprint, cache_key
+
+    def _call_node(self, node, callable_obj, laid_arguments=None):
+        """Call callable with node's arguments, returning its return value.
+
+        Since it may be called from worker threads, it doesn't perform
+        any other task besides calling and timing the callable.
+
+        When called from worker threads, the arguments must be given
+        already laid out (a list of positional arguments and a dict of
+        keyword arguments), so the node's argument map isn't accessed
+        outside the main thread.
+        """
+        ### if the callable is a coroutine function, replace it by a
+        ### callable which awaits it on the shared event loop and waits
+        ### for the result (also done when the node is item-wise, so
+        ### the callable is awaited for each item)
+
+        if iscoroutinefunction(callable_obj):
+            callable_obj = self._get_event_loop_caller(node, callable_obj)
+
+        ### if the node is item-wise, instead of calling the callable,
+        ### return a stream which calls it for each item received
+
+        if getattr(node, ITEM_WISE_VAR_NAME, False):
+
+            self.node_exec_time_map[node.id] = 0.0
+
+            return Stream(
+                yield_item_outputs(
+                    node,
+                    callable_obj,
+                    *lay_arguments(node.argument_map, node.signature_obj),
                 )
             )
 
-            time_for_humans = friendly_delta_from_secs(tracked_nodes_total)
+        ### if profiling is enabled, profile the call
+
+        if self.profiling:
+            return self._profile_node_call(node, callable_obj)
+
+        ### try executing the callable by passing the needed
+        ### arguments to a function that will execute it and
+        ### return the callable's return value
+
+        try:
+
+            node_exec_start = time()
+
+            if laid_arguments is None:
+
+                return_value = lay_arguments_and_execute(
+                    callable_obj, node.argument_map, node.signature_obj
+                )
+
+            else:
+
+                args, kwargs = laid_arguments
+                return_value = callable_obj(*args, **kwargs)
+
+            self.node_exec_time_map[node.id] = time() - node_exec_start
+
+        ### if an unexpected error occurs,
+        ### raise a custom error from the
+        ### original one
+
+        except Exception as err:
+            raise NodeCallableError(node) from err
+
+        return return_value
+
+    def _profile_node_call(self, node, callable_obj):
+        """Call callable with node's arguments, storing profiling data.
+
+        Returns the callable's return value.
+        """
+        try:
+
+            return_value, profiling_data = profile_call(
+                callable_obj,
+                *lay_arguments(node.argument_map, node.signature_obj),
+            )
+
+        except Exception as err:
+            raise NodeCallableError(node) from err
+
+        ### async callables are awaited on the event loop's thread, so
+        ### the CPU time measured there is used instead (check
+        ### _await_node_callable())
+
+        if node.id in self.event_loop_cpu_time_map:
+
+            profiling_data['cpu_time'] = (
+                self.event_loop_cpu_time_map.pop(node.id)
+            )
+
+        ### the size of the output is only estimated once the node
+        ### finishes executing, so until then it is marked as unknown
+        ### (it stays that way if the node fails to finish)
+
+        profiling_data['output_size'] = None
+
+        self.node_profile_map[node.id] = profiling_data
+        self.node_exec_time_map[node.id] = profiling_data['wall_time']
 
-            set_status_message(f'Total execution time was {time_for_humans}')
+        return return_value
 
-    def _sort_nodes(self):
+    def _submit_to_event_loop(self, node, callable_obj, laid_arguments):
+        """Submit node's async callable to be awaited on the event loop.
+
+        Returns the corresponding future.
+        """
+        return submit_coroutine(
+            self._await_node_callable(node, callable_obj, laid_arguments)
+        )
+
+    async def _await_node_callable(self, node, callable_obj, laid_arguments):
+        """Await node's async callable, returning its return value.
+
+        Awaited on the event loop's thread, so, just like _call_node()
+        when called from worker threads, it doesn't perform any other
+        task besides awaiting and timing the callable.
+
+        If the node has a timeout and the callable doesn't finish in
+        time, it is cancelled and an error is raised.
+
+        When profiling, the CPU time of the event loop's thread is
+        measured as well. Since nodes are executed one at a time when
+        profiling, it is all spent on the callable.
+        """
+        args, kwargs = laid_arguments
+
+        try:
+
+            node_exec_start = time()
+            cpu_start = thread_time()
+
+            return_value = await await_within(
+                callable_obj(*args, **kwargs),
+                self._get_timeout(node),
+            )
+
+            self.node_exec_time_map[node.id] = time() - node_exec_start
+
+            if self.profiling:
+
+                self.event_loop_cpu_time_map[node.id] = (
+                    thread_time() - cpu_start
+                )
+
+        except Exception as err:
+            raise NodeCallableError(node) from err
+
+        return return_value
+
+    def _get_event_loop_caller(self, node, callable_obj):
+        """Return callable which awaits async callable and waits for it.
+
+        Used when the async callable of a node must be called like a
+        regular one, that is, when the node is executed in the main
+        thread.
+        """
+        def call_on_event_loop(*args, **kwargs):
+
+            return self._submit_to_event_loop(
+                node,
+                callable_obj,
+                (args, kwargs),
+            ).result()
+
+        return call_on_event_loop
+
+    def _get_timeout(self, node):
+        """Return maximum number of seconds node's callable may take.
+
+        The timeout defined in the node script takes precedence over
+        the one in the user preferences. None is returned if there's
+        no timeout or the node doesn't come from a node script (only
+        callables from node scripts can be executed under the watchdog).
+
+        Note that, since callables with a timeout (except async ones)
+        are executed in separate processes, their return values must
+        be picklable and changes they make to their arguments aren't
+        seen by other nodes. Their arguments must be picklable as well,
+        except when the timeout comes from the user preferences, in
+        which case nodes whose arguments can't be pickled are executed
+        in the app's process without a timeout (check
+        _submit_to_watchdog()).
+        """
+        if 'script_id' not in node.data:
+            return None
+
+        return getattr(
+            node,
+            EXECUTION_TIMEOUT_VAR_NAME,
+            USER_PREFS['EXECUTION_TIMEOUT'],
+        ) or None
+
+    def _pickle_arguments(self, node):
+        """Return pickled arguments of node, to be sent to another process.
+
+        Raises a custom error if the arguments can't be pickled.
+        """
+        try:
+            return dumps(lay_arguments(node.argument_map, node.signature_obj))
+
+        except Exception as err:
+            raise ProcessPoolPicklingError(node, 'arguments', repr(err)) from err
+
+    def _submit_to_watchdog(self, node):
+        """Submit node's main callable to be called under the watchdog.
+
+        Returns the corresponding future.
+
+        If the timeout comes from the user preferences rather than
+        from the node script and the arguments of the node can't be
+        pickled, None is returned instead, meaning the node must be
+        executed in the app's process, without a timeout. That is,
+        only nodes whose scripts define a timeout are required to have
+        picklable arguments.
+        """
+        try:
+            pickled_arguments = self._pickle_arguments(node)
+
+        except ProcessPoolPicklingError:
+
+            if (
+                hasattr(node, EXECUTION_TIMEOUT_VAR_NAME)
+                or getattr(node, USE_PROCESS_POOL_VAR_NAME, False)
+            ):
+                raise
+
+            USER_LOGGER.info(
+                f"Arguments of '{node.title_text}'() node (id {node.id})"
+                " couldn't be pickled to be sent to a separate process, so"
+                " the node was executed without the timeout from the user"
+                " preferences."
+            )
+
+            return None
+
+        ### the node script is imported in the setup of the call,
+        ### so the call itself doesn't need to do it (the setup counts
+        ### towards the timeout as well, though)
+
+        script_filepath = APP_REFS.script_path_map[node.data['script_id']]
+
+        return submit_to_watchdog(
+            call_main_callable,
+            (script_filepath, pickled_arguments),
+            self._get_timeout(node),
+            (load_node_script, (script_filepath,)),
+        )
+
+    def _submit_to_process_pool(self, node):
+        """Submit node's main callable to be called in process pool.
+
+        Returns the corresponding future.
+        """
+        ### pickle the arguments
+        pickled_arguments = self._pickle_arguments(node)
+
+        ### create the process pool if needed
+        ###
+        ### the 'spawn' start method is used because it is available in
+        ### all operating systems and doesn't copy the app's state (like
+        ### the pygame window) into the worker processes
+
+        if self.process_pool is None:
+
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=cpu_count(),
+                mp_context=get_context('spawn'),
+            )
+
+        ### submit the call to the process pool
+
+        script_filepath = APP_REFS.script_path_map[node.data['script_id']]
+
+        return self.process_pool.submit(
+            call_main_callable,
+            script_filepath,
+            pickled_arguments,
+        )
+
+    def _get_process_pool_result(self, node, future):
+        """Return value returned by callable called in separate process.
+
+        That is, called in the process pool or under the watchdog.
+        """
+
+        try:
+            exec_time, pickled_return_value = future.result()
+
+        except ReturnValuePicklingError as err:
+            raise ProcessPoolPicklingError(node, 'return value', str(err)) from err
+
+        except Exception as err:
+
+            ## if a worker process died abruptly, the pool can't be
+            ## used anymore, so we discard it
+
+            if isinstance(err, BrokenProcessPool):
+                self.shutdown_process_pool()
+
+            raise NodeCallableError(node) from err
+
+        self.node_exec_time_map[node.id] = exec_time
+
+        return loads(pickled_return_value)
+
+    def shutdown_process_pool(self):
+        """Shut down process pool, if it exists, and watchdog workers.
+
+        Worker processes keep the node scripts they imported, so this
+        must be done whenever node scripts may have changed, like when
+        loading/reloading a file.
+        """
+        if self.process_pool is not None:
+
+            self.process_pool.shutdown(wait=False)
+            self.process_pool = None
+
+        shutdown_watchdog()
+
+    def _finish_node_execution(
+        self,
+        node,
+        backdoor,
+        fingerprint,
+        cache_key,
+        return_value,
+    ):
+        """Handle return value of node's callable."""
+        output_to_send = return_value
+
+        ### if needed:
+        ###   - redefine output to be sent to downstream nodes
+        ###   - set visuals/looping
+
+        try:
+
+            if backdoor:
+
+                node.set_visual(return_value['in_graph_visual'])
+
+                if hasattr(node, 'loop_entering_command'):
+
+                    node.loop_data = return_value['loop_data']
+
+                    if node.preview_toolbar.check_button.get():
+                        node.loop_entering_command()
+
+                output_to_send = return_value.get('output')
+
+            elif hasattr(node, SIDEVIZ_FROM_OUTPUT_VAR_NAME):
+
+                node.set_visual(
+                    node.get_sideviz_from_output(return_value)
+                )
+
+                ###
+
+                loop_data_retrieval_op = (
+                    getattr(node, LOOPVIZ_FROM_OUTPUT_VAR_NAME, None)
+                )
+
+                if loop_data_retrieval_op:
+
+                    node.loop_data = loop_data_retrieval_op(return_value)
+
+                    if node.preview_toolbar.check_button.get():
+                        node.loop_entering_command()
+
+        except Exception as err:
+
+            raise RuntimeError(
+                "Error while setting visual/looping/output."
+            ) from err
+
+        ###
+
+        # if incremental execution is enabled, store the output
+        # along with the fingerprint of the inputs used to produce
+        # it (a shallow copy of the arguments is stored as well,
+        # to keep alive the objects whose ids are part of the
+        # fingerprint);
+        #
+        # iterators are single-use, so they aren't cached
+
+        if self.incremental:
+
+            if _is_iterator(output_to_send):
+                self.node_output_cache.pop(node.id, None)
+
+            else:
+
+                self.node_output_cache[node.id] = (
+                    fingerprint,
+                    dict(node.argument_map),
+                    output_to_send,
+                )
+
+        # if a key for the persistent result cache was provided,
+        # store the output under it
+
+        if cache_key is not None:
+            store_output_in_cache(cache_key, output_to_send)
+
+        # if profiling is enabled, store an estimate of the size
+        # of the output
+
+        if self.profiling and node.id in self.node_profile_map:
+
+            self.node_profile_map[node.id]['output_size'] = (
+                estimate_size(output_to_send)
+            )
+
+        # send its return value to
+        # other nodes as needed
+
+        _send_output_to_connected_nodes(
+            node,
+            output_to_send,
+            self.nodes_to_execute,
+        )
+
+        # if the output is a stream which wasn't sent to any node,
+        # drain it, so the item-wise callable is still called for
+        # each item (if outputs are being stored, the items are
+        # collected in a list instead)
+
+        if isinstance(output_to_send, Stream) and not output_to_send.was_shared:
+
+            if self.output_map is None:
+                drain(output_to_send)
+
+            else:
+                output_to_send = list(output_to_send)
+
+        # if requested, store the output
+
+        if self.output_map is not None:
+            self.output_map[node.id] = output_to_send
+
+        # perform its execution setup (which clears its arguments) and
+        # release the outputs it consumed, if no other node needs them
+        node.perform_execution_setup()
+        self._release_inputs(node)
+
+        # append node to list of executed ones
+        self.executed_nodes.append(node)
+
+    def _release_inputs(self, node):
+        """Release outputs consumed by finished node if not needed anymore.
+
+        That is, for each node which provided inputs to the given one,
+        decrement the number of its consumers which weren't finished
+        yet. Once it reaches 0, the output isn't needed anymore, so the
+        references to it kept during the execution are removed.
+
+        Since outputs are only sent to nodes which will be executed,
+        the other references to the output (the argument maps of the
+        nodes consuming it) were already cleared when each consumer
+        was finished. References kept by the user's choice aren't
+        removed, though, like the ones in the cache used by incremental
+        execution and the outputs of nodes whose outputs are requested.
+        """
+        pending_consumers_map = self.pending_consumers_map
+        output_map = self.output_map
+
+        for source_id in self.source_ids_map.pop(node, ()):
+
+            pending_consumers_map[source_id] -= 1
+
+            if pending_consumers_map[source_id]:
+                continue
+
+            del pending_consumers_map[source_id]
+
+            if (
+                output_map is not None
+                and source_id not in self.output_ids_to_keep
+            ):
+                output_map.pop(source_id, None)
+
+    def _sort_nodes(self, depth_first=False):
         """Sort nodes.
 
         Nodes are sorted so that the ones which depend on the input of other
         nodes appear after them.
 
-        Uses a breadth-first topological sort algorithm, gathering nodes in
-        different groups called generations.
+        Uses a breadth-first topological sort algorithm (Kahn's algorithm),
+        gathering nodes in different groups called generations.
 
         The first generation is formed by nodes that don't have incoming
         edges. Each subsequent generation is formed by nodes which expect
         inputs solely from the nodes on the previous generation(s) and so on.
+
+        The sorting takes linear time on the number of nodes and edges,
+        since it relies on a map of direct children and on the indegree of
+        each node, instead of checking all remaining nodes for each new
+        generation.
+
+        If the nodes can't be completely sorted because they form cycles,
+        a CyclicGraphError is raised.
+
+        Parameters
+        ==========
+
+        depth_first (bool)
+            if True, nodes are sorted depth-first instead, each one in
+            its own generation: whenever all inputs of a node become
+            available, that node is the next one in line. Since the
+            outputs of a node are only referenced by the nodes consuming
+            them until they are executed, each output is released soon
+            after it is produced, instead of being kept while the rest
+            of its generation is executed. This reduces peak memory
+            usage when callables are called one at a time.
         """
         ### clear list where generations will be stored in order
         self.clear_node_generations()
@@ -555,49 +1551,130 @@ def _sort_nodes(self):
         nodes_to_sort = self.nodes_to_sort
 
         ### send ids of the nodes to their direct children, so the
-        ### children can keep track of their indegree
+        ### children can keep track of the nodes providing them with
+        ### inputs
+        ###
+        ### note that the ids are only sent to nodes which are
+        ### connected directly or via redirect nodes
 
         for node in nodes_to_sort:
             node.send_id_to_direct_children()
 
-        ### while there's nodes to sort, keep creating and appending
-        ### new node generations from the nodes with indegree == 0, always
-        ### decrementing the indegree of their direct children
+        ### build the index used to sort the nodes, that is, a map
+        ### associating each node id with a list of its direct children
+        ### and a map associating each node with its indegree (the number
+        ### of distinct nodes providing inputs to it); the ids received
+        ### are cleared afterwards, since they aren't needed anymore
+        ###
+        ### also create the first generation from nodes whose indegree
+        ### is 0, that is, nodes with no incoming edges
 
-        while nodes_to_sort:
+        children_map = {node.id: [] for node in nodes_to_sort}
+        indegree_map = {}
 
-            ## create generation from nodes whose indegree == 0, that is,
-            ## nodes with no incoming edges;
-            ##
-            ## however, the meaning of indegree == 0 was extended here to
-            ## also mean nodes whose incoming edges come from nodes in
-            ## previous generation(s)
-
-            node_generation = [
-                node
-                for node in nodes_to_sort
-                if len(node.input_source_ids) == 0
-            ]
+        source_ids_map = self.source_ids_map
+        source_ids_map.clear()
 
-            ## now that we defined a new generation, append it to the
-            ## dedicated list
-            append_node_generation(node_generation)
+        node_generation = []
 
-            ## and remove them from the set of nodes to sort
-            nodes_to_sort.difference_update(node_generation)
+        for node in nodes_to_sort:
 
-            ## create a set of ids from the nodes in this generation
-            ## and use it to remove such ids from the remaining nodes
-            ## to be sorted
-            ##
-            ## this is a way to signal the remaining nodes that the
-            ## nodes with those ids are already stored in previous
-            ## generation(s)
+            source_ids = node.input_source_ids
+
+            if source_ids:
+
+                indegree_map[node] = len(source_ids)
+                source_ids_map[node] = tuple(source_ids)
 
-            ids_to_remove = {node.id for node in node_generation}
+                for source_id in source_ids:
+                    children_map[source_id].append(node)
 
-            for node in nodes_to_sort:
-                node.remove_source_ids(ids_to_remove)
+                node.clear_source_ids()
+
+            else:
+                node_generation.append(node)
+
+        ### if requested, sort nodes depth-first by using a stack of nodes
+        ### ready to be executed; each node popped from the stack forms a
+        ### generation on its own and its children whose indegree reach 0
+        ### are pushed onto the stack, so they are the next ones in line
+
+        if depth_first:
+
+            ready_nodes = node_generation
+
+            while ready_nodes:
+
+                node = ready_nodes.pop()
+
+                append_node_generation([node])
+
+                for child in children_map[node.id]:
+
+                    indegree_map[child] -= 1
+
+                    if not indegree_map[child]:
+
+                        del indegree_map[child]
+                        ready_nodes.append(child)
+
+        else:
+
+            ### otherwise, while the last generation created has nodes,
+            ### append it to the dedicated list and create the next
+            ### generation by decrementing the indegree of the children
+            ### of its nodes;
+            ###
+            ### the children whose indegree reach 0 form the next
+            ### generation, since all nodes providing inputs to them
+            ### are in previous generations
+
+            while node_generation:
+
+                append_node_generation(node_generation)
+
+                next_generation = []
+
+                for node in node_generation:
+
+                    for child in children_map[node.id]:
+
+                        indegree_map[child] -= 1
+
+                        if not indegree_map[child]:
+
+                            del indegree_map[child]
+                            next_generation.append(child)
+
+                node_generation = next_generation
+
+        ### store the number of nodes consuming the output of each node,
+        ### so the output can be released as soon as all of them are
+        ### finished (check _release_inputs())
+
+        self.pending_consumers_map = {
+            node_id: len(children)
+            for node_id, children in children_map.items()
+        }
+
+        ### all nodes were sorted
+        nodes_to_sort.clear()
+
+        ### if there are nodes left with indegree > 0, it means they are
+        ### part of a cycle or depend on nodes that are, so they can't be
+        ### sorted; report such nodes by raising a custom error
+
+        if indegree_map:
+            raise CyclicGraphError(indegree_map)
+
+    def purge_result_cache(self):
+        """Remove all outputs stored in the persistent result cache."""
+
+        freed_bytes = purge_result_cache()
+
+        set_status_message(
+            f"Result cache was purged ({format_bytes(freed_bytes)} freed)"
+        )
 
     def execute_with_custom_stdout(self):
 
@@ -635,7 +1712,40 @@ def execute_with_custom_stdout(self):
             )
 
     def execute_node_after_upstream_ones(self, node):
-        self.execute_graph(set(yield_upstream_nodes(node)))
+        """Execute node, pulling inputs from its upstream nodes.
+
+        Used to refresh the visuals of a viewer node. The upstream
+        nodes are executed incrementally regardless of the user
+        preference, that is, the last outputs of upstream nodes
+        whose inputs didn't change are reused and only the stale
+        ones are executed again, so refreshing a viewer doesn't
+        require executing all its upstream nodes each time.
+
+        The given node itself is always executed.
+
+        If incremental execution is disabled in the user preferences,
+        only the outputs needed to refresh this node are kept, that
+        is, the ones cached for other nodes are discarded, so the
+        outputs cached by refreshing viewer nodes don't pile up.
+        Either way, they are discarded when executing the graph
+        normally.
+        """
+        node_output_cache = self.node_output_cache
+        node_output_cache.pop(node.id, None)
+
+        upstream_nodes = set(yield_upstream_nodes(node))
+
+        if not USER_PREFS['INCREMENTAL_EXECUTION']:
+
+            upstream_ids = {
+                upstream_node.id
+                for upstream_node in upstream_nodes
+            }
+
+            for node_id in node_output_cache.keys() - upstream_ids:
+                del node_output_cache[node_id]
+
+        self.execute_graph(upstream_nodes, incremental=True)
 
 
 
@@ -685,7 +1795,7 @@ def _reference_callables(callable_mode_nodes):
             for child in children:
                 child.receive_input(callable_reference)
 
-def _send_output_to_connected_nodes(node, output):
+def _send_output_to_connected_nodes(node, output, nodes_to_execute):
     """Send output to nodes connected to the given one.
 
     If the given one has connections to other nodes.
@@ -697,6 +1807,9 @@ def _send_output_to_connected_nodes(node, output):
         node from which the output was produced.
     output (any Python value)
         output produced by the given node.
+    nodes_to_execute (container of nodes)
+        nodes which will be executed; outputs are only sent to
+        them (check _get_consumers()).
     """
     ### retrieve iterable with all output sockets from the given node
     ###
@@ -734,19 +1847,55 @@ def _send_output_to_connected_nodes(node, output):
 
     if len(output_sockets) > 1:
 
+        ## if the output is a stream, each item is expected to be a
+        ## mapping, so we send a stream for each output socket
+        ## with consumers, yielding the corresponding value of each
+        ## item (the stream produced by the node is shared among
+        ## the streams created)
+
+        if isinstance(output, Stream):
+
+            output_names = [
+                socket.output_name
+                for socket in output_sockets
+            ]
+
+            for socket in output_sockets:
+
+                consumers = _get_consumers(
+                    getattr(socket, 'children', ()),
+                    nodes_to_execute,
+                )
+
+                if not consumers:
+                    continue
+
+                output_stream = Stream(
+                    yield_output_items(
+                        node,
+                        output.share(),
+                        socket.output_name,
+                        output_names,
+                    )
+                )
+
+                for child in consumers:
+                    child.receive_input(output_stream)
+
+            return
+
         ## iterate over each socket, checking whether
-        ## it has children and, if so, retrieving its
+        ## it has consumers and, if so, retrieving its
         ## specific value to be sent to them
 
         for socket in output_sockets:
 
-            try:
-                children = socket.children
-
-            except AttributeError:
-                pass
+            consumers = _get_consumers(
+                getattr(socket, 'children', ()),
+                nodes_to_execute,
+            )
 
-            else:
+            if consumers:
 
                 ## try retrieving value to be sent
 
@@ -776,11 +1925,11 @@ def _send_output_to_connected_nodes(node, output):
                         node, expected_outputs
                     ) from err
 
-                ## send value to each child
+                ## send value to each consumer
 
                 else:
 
-                    for child in children:
+                    for child in consumers:
                         child.receive_input(value_to_be_sent)
 
     ### otherwise, if we have only one output socket, the output received
@@ -791,16 +1940,143 @@ def _send_output_to_connected_nodes(node, output):
 
         for socket in output_sockets:
 
+            for child in _get_consumers(
+                getattr(socket, 'children', ()),
+                nodes_to_execute,
+            ):
+                child.receive_input(output)
+
+def _get_consumers(children, nodes_to_execute):
+    """Return input sockets of nodes which will consume an output.
+
+    Outputs are only sent to nodes which will be executed. Otherwise,
+    if a node receiving an output was commented out or isn't part of
+    the nodes being executed, it would keep the output in its argument
+    map until the end of the execution (or indefinitely, if commented
+    out), even though it would never use it. Streams would be even
+    worse, since their items would be buffered for such node.
+
+    Redirect nodes between the output socket and the consumers are
+    skipped, so their children are checked instead.
+
+    Parameters
+    ==========
+
+    children (iterable of sockets)
+        children of an output socket.
+    nodes_to_execute (container of nodes)
+        nodes which will be executed.
+    """
+    consumers = []
+
+    for child in children:
+
+        if isinstance(child, ProxySocket):
+
             try:
-                children = socket.children
+                grandchildren = child.node.output_socket.children
 
             except AttributeError:
                 pass
 
             else:
 
-                for child in children:
-                    child.receive_input(output)
+                consumers.extend(
+                    _get_consumers(grandchildren, nodes_to_execute)
+                )
+
+        elif child.node in nodes_to_execute:
+            consumers.append(child)
+
+    return consumers
+
+def _get_input_fingerprint(node, callable_obj):
+    """Return tuple representing the inputs of the node.
+
+    The tuple is used to check whether the inputs of the node changed
+    since its last execution. Literal values (numbers, strings, etc.)
+    are represented by themselves, while other values (outputs from
+    other nodes, for instance) are represented by their identity.
+
+    The containers created for variable parameters in the pre-execution
+    setups are always new, so their items are represented individually.
+
+    Parameters
+    ==========
+
+    node (graphman.callablenode.main.CallableNode or subclass)
+        node whose inputs will be represented; its pre-execution setups
+        must have already been performed.
+    callable_obj (callable)
+        callable that will be used to execute the node.
+    """
+    var_kind_map = getattr(node, 'var_kind_map', EMPTY_DICT)
+
+    items = [id(callable_obj)]
+
+    for param_name, value in node.argument_map.items():
+
+        kind = var_kind_map.get(param_name)
+
+        if kind == 'var_pos':
+            token = tuple(map(_get_value_token, value))
+
+        elif kind == 'var_key':
+
+            token = tuple(
+                (key, _get_value_token(item))
+                for key, item in value.items()
+            )
+
+        else:
+            token = _get_value_token(value)
+
+        items.append((param_name, token))
+
+    return tuple(items)
+
+def _get_value_token(value):
+    """Return literal value or id of value otherwise."""
+    value_type = type(value)
+
+    return (
+        (value_type, value)
+        if value_type in LITERAL_TYPES
+        else id(value)
+    )
+
+def _receives_stream(node):
+    """Return whether node received a stream as an argument."""
+    var_kind_map = getattr(node, 'var_kind_map', EMPTY_DICT)
+
+    for param_name, value in node.argument_map.items():
+
+        kind = var_kind_map.get(param_name)
+
+        if kind == 'var_pos':
+            values = value
+
+        elif kind == 'var_key':
+            values = value.values()
+
+        else:
+            values = (value,)
+
+        for item in values:
+
+            if isinstance(item, Stream):
+                return True
+
+    return False
+
+def _is_iterator(obj):
+    """Return whether object is an iterator."""
+
+    try:
+        return iter(obj) is obj
+
+    except TypeError:
+        return False
 
 def _clear_arguments(nodes):
     """Clear arguments from nodes.
@@ -816,13 +2092,11 @@ def _clear_arguments(nodes):
     nodes which didn't get to be called have the arguments received
     cleared.
 
-    Additionally, if we are only executing a portion of the
-    existing nodes, for instance, when we use the
-    execute_node_after_upstream_ones() method, the connected
-    nodes downstream will receive the arguments as well, even
-    though they won't be executed. Rather than set complex checks
-    to prevent such nodes to receive the arguments it is simpler
-    to just clear everything anyway.
+    Nodes which aren't executed (because they are commented out or
+    we are only executing a portion of the existing nodes, like when
+    we use the execute_node_after_upstream_ones() method) don't
+    receive outputs from other nodes (check _get_consumers()), so
+    they don't need to be cleared.
 
     The cleared data doesn't affect viewer nodes as well, because
     the outputs sent away as arguments to other nodes is also
@@ -0,0 +1,228 @@
+"""Facility for monitoring graph execution performed in the background.
+
+While node callables are executed in worker threads/processes, the
+monitor keeps the window responsive by running its own loop in the
+main thread, drawing the graph along with the progress of the
+execution and allowing the user to cancel it.
+"""
+
+### standard library import
+from concurrent.futures import wait
+
+
+### third-party imports
+
+from pygame.locals import (
+    QUIT,
+    KEYUP,
+    K_ESCAPE,
+    MOUSEBUTTONUP,
+)
+
+from pygame.event import post as post_event
+
+from pygame.draw import rect as draw_rect
+
+
+### local imports
+
+from ..config import APP_REFS
+
+from ..pygamesetup import SERVICES_NS, SCREEN, SCREEN_RECT
+
+from ..loopman.main import LoopHolder
+
+from ..classes2d.single import Object2D
+
+from ..textman.render import render_text
+
+from ..fontsman.constants import ENC_SANS_BOLD_FONT_HEIGHT
+
+from .exception import ExecutionCancelledError
+
+from ..colorsman.colors import (
+    RUNNING_NODE_OUTLINE,
+    EXECUTED_NODE_OUTLINE,
+    EXECUTION_PROGRESS_FG,
+    EXECUTION_PROGRESS_BG,
+)
+
+
+
+### constants
+
+## time in seconds to wait for a callable to finish before entering
+## the monitoring loop, so quick callables don't cost a whole frame
+INITIAL_WAIT = 0.04
+
+PROGRESS_TEXT_SETTINGS = {
+    "font_height": ENC_SANS_BOLD_FONT_HEIGHT,
+    "foreground_color": EXECUTION_PROGRESS_FG,
+    "background_color": EXECUTION_PROGRESS_BG,
+    "padding": 5,
+    "depth_finish_thickness": 1,
+}
+
+
+### class definition
+
+class ExecutionMonitor(LoopHolder):
+    """Keeps the window responsive while waiting for callables.
+
+    This class is instantiated only once in the end of the module
+    and its main method is aliased to be used wherever needed.
+    """
+
+    def __init__(self):
+        """Create progress label."""
+        self.progress_label = Object2D()
+
+    def wait_for_future(
+        self,
+        future,
+        running_nodes,
+        executed_nodes,
+        total_nodes,
+    ):
+        """Wait for future to be done, keeping the window responsive.
+
+        Raises ExecutionCancelledError if the user cancels the
+        execution meanwhile. Trying to quit the app also cancels it,
+        but the quit event is posted again, so the app still handles
+        it afterwards.
+
+        Parameters
+        ==========
+
+        future (concurrent.futures.Future)
+            future representing the execution of a node's callable.
+        running_nodes (list)
+            nodes whose callables were submitted for execution but
+            which didn't finish executing yet.
+        executed_nodes (list)
+            nodes which finished executing.
+        total_nodes (int)
+            number of nodes to be executed.
+        """
+        ### if the future finishes quickly, there's no need to enter
+        ### the loop
+
+        wait((future,), timeout=INITIAL_WAIT)
+
+        if future.done():
+            return
+
+        ### store data and enter the loop
+
+        self.future = future
+        self.running_nodes = running_nodes
+        self.executed_nodes = executed_nodes
+        self.total_nodes = total_nodes
+
+        self.cancelled = False
+        self.quit_requested = False
+        self.executed_count = None
+
+        self.loop()
+
+        ### release references
+
+        del self.future
+        del self.running_nodes
+        del self.executed_nodes
+
+        ### if the user cancelled the execution, raise custom error
+
+        if self.cancelled:
+            raise ExecutionCancelledError("Graph execution was cancelled.")
+
+    def handle_input(self):
+        """Cancel execution on escape key, mouse click or quit."""
+
+        for event in SERVICES_NS.get_events():
+
+            ### on quit, besides cancelling the execution, post the
+            ### event again (only once), so it is handled as usual by
+            ### the app once the execution is finished, instead of
+            ### being lost
+
+            if event.type == QUIT:
+
+                self.cancelled = True
+
+                if not self.quit_requested:
+
+                    self.quit_requested = True
+                    post_event(event)
+
+            elif (
+                (event.type == KEYUP and event.key == K_ESCAPE)
+                or (
+                    event.type == MOUSEBUTTONUP
+                    and event.button == 1
+                    and self.progress_label.rect.collidepoint(event.pos)
+                )
+            ):
+                self.cancelled = True
+
+    def update(self):
+        """Exit loop if future is done or execution was cancelled."""
+
+        if self.cancelled or self.future.done():
+            self.exit_loop()
+
+        ### update progress label if needed
+
+        executed_count = len(self.executed_nodes)
+
+        if executed_count != self.executed_count:
+
+            self.executed_count = executed_count
+
+            label = self.progress_label
+
+            label.image = render_text(
+                text=(
+                    f"Executing graph: {executed_count}/{self.total_nodes}"
+                    " nodes (press <Esc> or click here to cancel)"
+                ),
+                **PROGRESS_TEXT_SETTINGS,
+            )
+
+            label.rect = label.image.get_rect()
+            label.rect.midbottom = SCREEN_RECT.move(0, -10).midbottom
+
+    def draw(self):
+        """Draw graph and execution progress."""
+        APP_REFS.wm.background.draw()
+
+        APP_REFS.ea.grid_drawing_behaviour()
+        APP_REFS.gm.draw()
+
+        ### outline nodes according to their execution status
+
+        for nodes, color in (
+            (self.executed_nodes, EXECUTED_NODE_OUTLINE),
+            (self.running_nodes, RUNNING_NODE_OUTLINE),
+        ):
+
+            for node in nodes:
+
+                rect = node.rect.inflate(8, 8)
+
+                if SCREEN_RECT.colliderect(rect):
+                    draw_rect(SCREEN, color, rect, 2)
+
+        ###
+
+        self.progress_label.draw()
+
+        SERVICES_NS.update_screen()
+
+
+### instantiate execution monitor and reference its main method in the
+### module level, so it can be easily imported
+
+_ = ExecutionMonitor()
+
+wait_for_future = _.wait_for_future
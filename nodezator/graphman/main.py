@@ -14,6 +14,8 @@
     TEXT_BLOCKS_KEY,
 )
 
+from ..userprefsman.main import USER_PREFS
+
 from ..logman.main import get_new_logger
 
 from ..ourstdlibs.meta import initialize_bases
@@ -29,6 +31,8 @@
 ## function
 from .scriptloading import load_scripts
 
+from .profiling import draw_profiling_heatmap
+
 ## classes for composition
 
 from .callablenode.main import CallableNode
@@ -155,6 +159,12 @@ def prepare_for_new_session(self):
         ### execute method to perform socket parenting setups
         self.setup_parent_sockets_data()
 
+        ### from now on, the data of the socket trees is kept in
+        ### the self.parent_data_map attribute, so we delete the
+        ### reference to the list from the native data, which
+        ### isn't updated anymore until the data is saved
+        del self.parent_sockets_data
+
         ### retrieve the value in the TEXT_BLOCKS_KEY key
         ### from the file data and store in an attribute
 
@@ -273,20 +283,40 @@ def instantiate_text_blocks(self):
 
     def draw(self):
         """Draw node layout elements."""
+        ### objects are retrieved with the editing assistant, which
+        ### also applies any pending scrolling to them
+        get_on_screen = APP_REFS.ea.get_on_screen
+
         ### preview panels
-        self.preview_panels.call_draw_on_screen()
+
+        for panel in get_on_screen(self.preview_panels):
+            panel.draw()
 
         ### preview toolbars
-        self.preview_toolbars.call_draw_on_screen()
+
+        for toolbar in get_on_screen(self.preview_toolbars):
+            toolbar.draw()
 
         ### lines
         self.draw_lines()
 
         ### nodes
-        self.nodes.call_draw_on_screen()
+
+        nodes_on_screen = get_on_screen(self.nodes)
+
+        for node in nodes_on_screen:
+            node.draw()
 
         ### text blocks
-        self.text_blocks.call_draw_on_screen()
+
+        for block in get_on_screen(self.text_blocks):
+            block.draw()
+
+        ### heatmap with execution time of nodes, if profiling is
+        ### enabled and there's profiling data
+
+        if self.node_profile_map and USER_PREFS['PROFILE_EXECUTION']:
+            draw_profiling_heatmap(nodes_on_screen, self.node_profile_map)
 
     def yield_all_rects(self):
         """Yield rects from all objects in the graph.
@@ -303,6 +333,10 @@ def yield_all_rects(self):
         A rectsman can be created by feeding this method to its
         constructor.
         """
+        ### make sure all objects are aligned, since their rects
+        ### may lack scrolling not yet applied to them
+        APP_REFS.ea.align_objects()
+
         ### rects (rectsmans) from nodes
         for node in self.nodes:
             yield node.rectsman
@@ -345,6 +379,8 @@ def free_up_memory(self):
             'text_blocks_data',
             'node_map',
             'text_blocks',
+            'node_output_cache',
+            'node_profile_map',
         ):
 
             try:
@@ -353,3 +389,8 @@ def free_up_memory(self):
                 pass
             else:
                 obj.clear()
+
+        ### shut down the process pool used to execute node callables,
+        ### since its worker processes hold the scripts of the previous
+        ### session
+        self.shutdown_process_pool()
@@ -0,0 +1,172 @@
+"""Facility for calling node callables in separate processes.
+
+The functions in this module are executed in worker processes, so
+this module must not import anything from the app that depends on
+pygame or on the app's state.
+"""
+
+### standard library imports
+
+from pickle import dumps, loads
+
+from time import time
+
+from importlib import import_module
+
+from inspect import iscoroutinefunction
+
+from asyncio import run
+
+
+### local imports
+
+from ..appinfo import MAIN_CALLABLE_VAR_NAME
+
+from ..ourstdlibs.importutils import temporary_sys_path_visibility
+
+
+
+### map to store namespaces of node scripts loaded in the worker process,
+### so each script is only imported once per worker
+_NAMESPACE_MAP = {}
+
+### message sent by worker processes supervised by the watchdog when
+### they receive a call
+CALL_RECEIVED = 'call_received'
+
+
+class ReturnValuePicklingError(Exception):
+    """Raised in worker process when return value can't be pickled."""
+
+
+def load_node_script(script_filepath):
+    """Import node script if needed, returning its namespace.
+
+    Meant to be executed in worker processes.
+
+    Parameters
+    ==========
+
+    script_filepath (pathlib.Path)
+        path to node script.
+    """
+    try:
+        namespace = _NAMESPACE_MAP[script_filepath]
+
+    except KeyError:
+
+        ## the script is imported using the same module name and the
+        ## same directory used when loading the node packs in the app
+        ## (that is, the parent of the node pack directory), so imports
+        ## relative to the node pack work as expected
+
+        module_name = ".".join(script_filepath.parts[-4:])[:-3]
+
+        with temporary_sys_path_visibility(script_filepath.parents[3]):
+            namespace = import_module(module_name).__dict__
+
+        _NAMESPACE_MAP[script_filepath] = namespace
+
+    return namespace
+
+
+def call_main_callable(script_filepath, pickled_arguments):
+    """Call main callable from node script with pickled arguments.
+
+    Meant to be executed in worker processes.
+
+    Returns a tuple containing the time taken to execute the callable
+    and its pickled return value.
+
+    Parameters
+    ==========
+
+    script_filepath (pathlib.Path)
+        path to node script wherein the main callable is defined.
+    pickled_arguments (bytes)
+        pickled tuple containing the list of positional arguments and
+        the dict of keyword arguments to be used in the call.
+    """
+    ### retrieve the namespace of the node script, importing the script
+    ### if needed
+    namespace = load_node_script(script_filepath)
+
+    main_callable = namespace[MAIN_CALLABLE_VAR_NAME]
+
+    ### execute the callable
+
+    args, kwargs = loads(pickled_arguments)
+
+    start = time()
+
+    ## async main callables (coroutine functions) are awaited on an event
+    ## loop of their own
+
+    return_value = (
+        run(main_callable(*args, **kwargs))
+        if iscoroutinefunction(main_callable)
+        else main_callable(*args, **kwargs)
+    )
+
+    exec_time = time() - start
+
+    ### pickle the return value, raising a custom error if it fails
+
+    try:
+        pickled_return_value = dumps(return_value)
+
+    except Exception as err:
+        raise ReturnValuePicklingError(repr(err)) from None
+
+    return exec_time, pickled_return_value
+
+
+def serve_calls(connection):
+    """Execute calls received through connection, sending back results.
+
+    Meant to be the target of worker processes supervised by the
+    watchdog. Each call is received as a tuple containing a setup (None
+    or a tuple with a function and its positional arguments, called
+    beforehand, like for importing modules), a function and its
+    positional arguments.
+
+    As soon as a call is received, CALL_RECEIVED is sent, so the watchdog
+    knows when the worker process started handling it (that is, once the
+    worker process itself finished starting). The result is sent as a tuple
+    containing a boolean indicating whether the call (or the setup)
+    succeeded and either the return value or the exception raised.
+
+    The worker process may be killed at any moment, so it doesn't hold
+    any resources besides the connection.
+    """
+    while True:
+
+        try:
+            setup, function, args = connection.recv()
+
+        ## the connection is closed when the app finishes
+        except EOFError:
+            break
+
+        connection.send(CALL_RECEIVED)
+
+        try:
+
+            if setup is not None:
+
+                setup_function, setup_args = setup
+                setup_function(*setup_args)
+
+            result = (True, function(*args))
+
+        except Exception as err:
+            result = (False, err)
+
+        ### send the result; if the exception can't be pickled, send
+        ### its representation instead
+
+        try:
+            connection.send(result)
+
+        except Exception:
+            connection.send((False, RuntimeError(repr(result[1]))))
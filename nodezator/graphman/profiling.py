@@ -0,0 +1,356 @@
+"""Facility for profiling the execution of nodes.
+
+When profiling is enabled, the following data is recorded for each
+executed node:
+
+- wall time and CPU time taken to execute its callable;
+- peak memory allocated during the execution (via tracemalloc);
+- estimated size of its output.
+
+The data can then be visualized as a heatmap over the nodes or as a
+report, which can also be exported.
+"""
+
+### standard library imports
+
+from sys import getsizeof
+
+from time import time, thread_time
+
+import tracemalloc
+
+from csv import DictWriter
+
+
+### third-party imports
+
+from pygame import Surface
+
+from pygame.draw import rect as draw_rect
+
+
+### local imports
+
+from ..pygamesetup import SCREEN, SCREEN_RECT, blit_on_screen
+
+from ..ourstdlibs.pyl import save_pyl
+
+from ..ourstdlibs.timeutils import friendly_delta_from_secs
+
+
+
+### constants
+
+## fields of the rows of the profiling report
+
+REPORT_FIELDS = (
+    'node_id',
+    'title',
+    'wall_time',
+    'cpu_time',
+    'peak_memory',
+    'output_size',
+)
+
+## maximum number of objects visited when estimating the size of
+## an output (so the estimation doesn't take too long for huge
+## collections)
+MAX_OBJECTS_TO_SIZE = 10000
+
+## colors used in the heatmap, from the coolest (nodes which took
+## less time to execute) to the hottest ones
+
+HEATMAP_COLORS = (
+    ( 30, 130, 220),
+    ( 30, 200, 100),
+    (255, 215,   0),
+    (255, 120,   0),
+    (220,  30,  30),
+)
+
+HEATMAP_ALPHA = 110
+
+## map to store heatmap surfaces, so they are reused
+_HEATMAP_SURF_MAP = {}
+
+
+### profiling functions
+
+def profile_call(callable_obj, args, kwargs):
+    """Call callable, returning its return value and profiling data.
+
+    The profiling data is a dict containing the wall time, CPU time
+    and peak memory allocated during the call.
+
+    The CPU time is measured for the current thread only, so the
+    callable must be called in the thread where it performs its
+    work.
+    """
+    ### start tracing memory allocations if they aren't being
+    ### traced already; otherwise just store the memory currently
+    ### allocated, so we can subtract it from the peak
+
+    was_tracing = tracemalloc.is_tracing()
+
+    if was_tracing:
+
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        baseline, _ = tracemalloc.get_traced_memory()
+
+    else:
+
+        tracemalloc.start()
+        baseline = 0
+
+    ### call the callable, measuring wall and CPU time
+
+    try:
+
+        wall_start = time()
+        cpu_start = thread_time()
+
+        return_value = callable_obj(*args, **kwargs)
+
+        cpu_time = thread_time() - cpu_start
+        wall_time = time() - wall_start
+
+        _, peak = tracemalloc.get_traced_memory()
+
+    ### stop tracing memory allocations if we started it
+
+    finally:
+
+        if not was_tracing:
+            tracemalloc.stop()
+
+    ###
+
+    return return_value, {
+        'wall_time': wall_time,
+        'cpu_time': cpu_time,
+        'peak_memory': max(peak - baseline, 0),
+    }
+
+
+def estimate_size(obj):
+    """Return estimated size of object in bytes.
+
+    Items of builtin collections are taken into account as well, but
+    each object is only counted once and the number of visited objects
+    is limited, so the result is a lower bound for huge collections.
+    """
+    visited_ids = set()
+    objects_to_visit = [obj]
+
+    size = 0
+
+    while objects_to_visit and len(visited_ids) < MAX_OBJECTS_TO_SIZE:
+
+        obj = objects_to_visit.pop()
+
+        if id(obj) in visited_ids:
+            continue
+
+        visited_ids.add(id(obj))
+
+        try:
+            size += getsizeof(obj)
+        except TypeError:
+            continue
+
+        if isinstance(obj, dict):
+
+            objects_to_visit.extend(obj.keys())
+            objects_to_visit.extend(obj.values())
+
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            objects_to_visit.extend(obj)
+
+    return size
+
+
+### report functions
+
+def get_report_rows(node_profile_map, node_map):
+    """Return rows of profiling report, slowest nodes first.
+
+    Parameters
+    ==========
+
+    node_profile_map (dict)
+        maps the id of each profiled node to its profiling data.
+    node_map (dict)
+        maps the id of each node to the node itself.
+    """
+    rows = [
+
+        {
+            'node_id': node_id,
+            'title': node_map[node_id].title_text,
+            **profiling_data,
+        }
+
+        for node_id, profiling_data in node_profile_map.items()
+        if node_id in node_map
+
+    ]
+
+    rows.sort(key=lambda row: row['wall_time'], reverse=True)
+
+    return rows
+
+
+def get_report_text(rows):
+    """Return report text from profiling rows, as an aligned table."""
+
+    header = (
+        f"{'node id':>8}  {'wall time':>22}  {'cpu time':>22}"
+        f"  {'peak memory':>14}  {'output size':>14}  title"
+    )
+
+    lines = [
+        header,
+        '-' * len(header),
+    ]
+
+    for row in rows:
+
+        ### the output size is unknown if the node didn't finish
+        ### executing
+
+        output_size = row.get('output_size')
+
+        output_size_text = (
+            'unknown'
+            if output_size is None
+            else format_bytes(output_size)
+        )
+
+        lines.append(
+            f"{row['node_id']:>8}"
+            f"  {friendly_delta_from_secs(row['wall_time']):>22}"
+            f"  {friendly_delta_from_secs(row['cpu_time']):>22}"
+            f"  {format_bytes(row['peak_memory']):>14}"
+            f"  {output_size_text:>14}"
+            f"  {row['title']}"
+        )
+
+    total_wall_time = sum(row['wall_time'] for row in rows)
+
+    lines.append('')
+    lines.append(
+        f"{len(rows)} nodes profiled; total wall time was"
+        f" {friendly_delta_from_secs(total_wall_time)}"
+    )
+
+    return '\n'.join(lines)
+
+
+def format_bytes(quantity):
+    """Return string representing quantity of bytes.
+
+    >>> format_bytes(512)
+    '512 B'
+    >>> format_bytes(2048)
+    '2.0 KiB'
+    >>> format_bytes(3 * 1024 ** 2)
+    '3.0 MiB'
+    """
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+
+        if quantity < 1024 or unit == 'GiB':
+            break
+
+        quantity /= 1024
+
+    return (
+        f"{quantity} {unit}"
+        if unit == 'B'
+        else f"{quantity:.1f} {unit}"
+    )
+
+
+def save_report(rows, filepath):
+    """Save report rows in given path as .pyl or .csv file.
+
+    The format is picked according to the extension of the file.
+    """
+    if filepath.suffix.lower() == '.csv':
+
+        with open(filepath, mode='w', encoding='utf-8', newline='') as f:
+
+            writer = DictWriter(f, fieldnames=REPORT_FIELDS)
+
+            writer.writeheader()
+            writer.writerows(rows)
+
+    else:
+        save_pyl(rows, filepath)
+
+
+### heatmap
+
+def draw_profiling_heatmap(nodes, node_profile_map):
+    """Draw heatmap over nodes according to their execution time.
+
+    Nodes are colored from the coolest color (fastest nodes) to the
+    hottest one (slowest nodes), relative to the slowest node.
+
+    Parameters
+    ==========
+
+    nodes (iterable)
+        nodes on the graph.
+    node_profile_map (dict)
+        maps the id of each profiled node to its profiling data.
+    """
+    max_wall_time = max(
+        profiling_data['wall_time']
+        for profiling_data in node_profile_map.values()
+    )
+
+    last_index = len(HEATMAP_COLORS) - 1
+
+    for node in nodes:
+
+        try:
+            wall_time = node_profile_map[node.id]['wall_time']
+        except KeyError:
+            continue
+
+        rect = node.rect
+
+        if not SCREEN_RECT.colliderect(rect):
+            continue
+
+        ### pick color
+
+        color_index = (
+            round(last_index * wall_time / max_wall_time)
+            if max_wall_time
+            else 0
+        )
+
+        color = HEATMAP_COLORS[color_index]
+
+        ### retrieve semitransparent surface with the color (creating
+        ### it if needed) and blit it over the node
+
+        key = (rect.size, color_index)
+
+        try:
+            surf = _HEATMAP_SURF_MAP[key]
+
+        except KeyError:
+
+            surf = _HEATMAP_SURF_MAP[key] = Surface(rect.size).convert()
+            surf.fill(color)
+            surf.set_alpha(HEATMAP_ALPHA)
+
+        blit_on_screen(surf, rect)
+
+        ### also outline the node with the color
+
+        draw_rect(SCREEN, color, rect.inflate(6, 6), 2)
@@ -31,6 +31,31 @@
 
 DEFAULT_DOCSTRING = '"""Execute script version of Python visual graph."""'
 
+CONCURRENCY_IMPORT_TEXT = (
+    "from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor"
+)
+
+CONCURRENT_DEF_STATEMENT = (
+    "def main(max_workers=None, use_processes=False, **overrides):"
+)
+
+OVERRIDES_CHECK_TEXT = """
+if overrides:
+
+    raise TypeError(
+        "main() got overrides for unknown data nodes: "
+        + ", ".join(overrides)
+    )
+"""
+
+EXECUTOR_CREATION_TEXT = """
+executor_class = (
+    ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+)
+
+with executor_class(max_workers) as executor:
+"""
+
 
 class WaitingParentException(Exception):
     pass
@@ -49,8 +74,17 @@ class WaitingParentException(Exception):
 
 ### main function
 
-def python_repr(self):
-    """Return python representation of graph."""
+def python_repr(self, concurrent=False):
+    """Return python representation of graph.
+
+    Parameters
+    ==========
+
+    concurrent (bool)
+        if True, the representation is a script whose main() function
+        runs independent nodes concurrently using the executors from
+        concurrent.futures; otherwise, nodes are run one at a time.
+    """
 
     ### if there are proxy nodes that don't have a parent (orphan)
     ### nor a widget (empty), cancel the operation altogether with
@@ -115,63 +149,59 @@ def python_repr(self):
 
     ## gather from encapsulations usage
 
-    from_encapsulations_stlib_usage = set(
-
-        ##
-        sum(
+    from_encapsulations_stlib_usage = {
 
-            (
-                ### item
-                node.stlib_import_texts
+        ### item
+        import_text
 
-                ### source
-                for node in self.nodes
+        ### source
+        for node in self.nodes
 
-                ### filtering
+        ### filtering
 
-                if hasattr(node, "stlib_import_texts")
-                if (
-                    not hasattr(node, 'substitution_callable')
-                    or node.data['mode'] == 'callable'
-                )
-            ),
-            [],
+        if hasattr(node, "stlib_import_texts")
+        if (
+            not hasattr(node, 'substitution_callable')
+            or node.data['mode'] == 'callable'
         )
 
-    )
+        ### source (import texts of each node)
+        for import_text in node.stlib_import_texts
 
-    ## gather from encapsulations annotations
+    }
 
-    from_encapsulations_stlib_annotations = set(
+    ## gather from encapsulations annotations
 
-        ##
-        sum(
+    from_encapsulations_stlib_annotations = {
 
-            (
-                ### item
-                node.stlib_annotation_import_texts
+        ### item
+        import_text
 
-                ### source
-                for node in self.nodes
+        ### source
+        for node in self.nodes
 
-                ### filtering
+        ### filtering
 
-                if hasattr(node, "stlib_annotation_import_texts")
-                if (
-                    not hasattr(node, 'substitution_callable')
-                    or node.data['mode'] == 'callable'
-                )
-            ),
-            [],
+        if hasattr(node, "stlib_annotation_import_texts")
+        if (
+            not hasattr(node, 'substitution_callable')
+            or node.data['mode'] == 'callable'
         )
 
-    )
+        ### source (import texts of each node)
+        for import_text in node.stlib_annotation_import_texts
+
+    }
+
+    ## gather imports needed by the concurrent version
+    from_concurrency_usage = {CONCURRENCY_IMPORT_TEXT} if concurrent else set()
 
     ##
     stlib_imports = sorted(
         from_user_defined_and_stlib_nodes 
         .union(from_encapsulations_stlib_usage)
         .union(from_encapsulations_stlib_annotations)
+        .union(from_concurrency_usage)
     )
 
     ### create list of third-party imports
@@ -212,53 +242,45 @@ def python_repr(self):
 
     # from encapsulation usage
 
-    from_encapsulations_third_usage = set(
-
-        ##
-        sum(
+    from_encapsulations_third_usage = {
 
-            (
-                ### item
-                node.third_party_import_texts
-                ### source
-                for node in self.nodes
-                ### filtering
-                if hasattr(node, "third_party_import_texts")
-                if (
-                    not hasattr(node, 'substitution_callable')
-                    or node.data['mode'] == 'callable'
-                )
-            ),
-            [],
+        ### item
+        import_text
 
+        ### source
+        for node in self.nodes
+        ### filtering
+        if hasattr(node, "third_party_import_texts")
+        if (
+            not hasattr(node, 'substitution_callable')
+            or node.data['mode'] == 'callable'
         )
 
-    )
+        ### source (import texts of each node)
+        for import_text in node.third_party_import_texts
 
-    # from encapsulation annotations
+    }
 
-    from_encapsulations_third_annotations = set(
+    # from encapsulation annotations
 
-        ##
-        sum(
+    from_encapsulations_third_annotations = {
 
-            (
-                ### item
-                node.third_party_annotation_import_texts
-                ### source
-                for node in self.nodes
-                ### filtering
-                if hasattr(node, "third_party_annotation_import_texts")
-                if (
-                    not hasattr(node, 'substitution_callable')
-                    or node.data['mode'] == 'callable'
-                )
-            ),
-            [],
+        ### item
+        import_text
 
+        ### source
+        for node in self.nodes
+        ### filtering
+        if hasattr(node, "third_party_annotation_import_texts")
+        if (
+            not hasattr(node, 'substitution_callable')
+            or node.data['mode'] == 'callable'
         )
 
-    )
+        ### source (import texts of each node)
+        for import_text in node.third_party_annotation_import_texts
+
+    }
 
     ## create sorted list from their union
 
@@ -339,6 +361,14 @@ def python_repr(self):
 
     def_statement = f"def {func_name}():"
 
+    ## the concurrent version uses a main() function accepting the
+    ## number of workers and overrides for the values of data nodes
+
+    if concurrent:
+
+        func_name = "main"
+        def_statement = CONCURRENT_DEF_STATEMENT
+
     ### text blocks
 
     text_blocks = list(self.text_blocks)
@@ -378,11 +408,6 @@ def python_repr(self):
     ### its body, that is, calls and snippets from nodes,
     ### comments from nodes and text blocks
 
-    ##
-    graph_function_body = ""
-
-    ##
-
     if self.nodes:
 
         node_clusters = [
@@ -396,15 +421,24 @@ def python_repr(self):
             text_blocks,
         )
 
+        ## map each node to its cluster, so the cluster of any node
+        ## can be retrieved without searching
 
-    ## for each subgraph, write each node as a call or reference to
-    ## a callable object with proper indentation
+        node_cluster_map = {
+            node: cluster
+            for cluster in node_clusters
+            for node in cluster
+        }
 
-    for subgraph in yield_subgraphs(self.nodes):
+    ## list subgraphs, filtering out redirect nodes and nodes in
+    ## callable mode
+    ##
+    ## subgraphs are sorted by the lowest id among their nodes, so
+    ## they are written in the same order every time
 
-        ## filter out redirect nodes and nodes in callable mode
+    subgraphs = [
 
-        subgraph = [
+        [
 
             ## item
             node
@@ -425,43 +459,71 @@ def python_repr(self):
             if node.data.get('mode', 'expanded_signature') != 'callable'
         ]
 
-        ##
-        graph_function_body += "\n" * 2
+        for subgraph in sorted(
+            yield_subgraphs(self.nodes),
+            key=lambda subgraph: min(node.id for node in subgraph),
+        )
 
-        ##
+    ]
 
-        nodes_to_visit = set(subgraph)
-        visited_nodes = set()
+    ## list to hold the pieces of the function body, which are
+    ## joined once all of them are created
+    body_texts = []
 
-        subgraph_calls_text = ""
+    ## text with definitions of functions wrapping the nodes, which
+    ## is only used in the concurrent version
+    node_functions_text = ''
 
-        while nodes_to_visit:
+    ## if the concurrent version was requested, nodes from all
+    ## subgraphs are written together, so independent nodes can
+    ## run concurrently regardless of their subgraph
 
-            for node in nodes_to_visit:
+    if concurrent and self.nodes:
 
-                try:
-                    node_source = node_to_python_source(
-                        node,
-                        nodes_to_visit,
-                        visited_nodes,
-                        node_clusters,
-                    )
+        body_text, node_functions_text = get_concurrent_texts(
+            [node for subgraph in subgraphs for node in subgraph],
+            node_cluster_map,
+        )
 
-                except WaitingParentException:
-                    pass
+        body_texts.append(body_text)
 
-                else:
+        subgraphs.clear()
 
-                    subgraph_calls_text += node_source
-                    visited_nodes.add(node)
+    ## for each subgraph, write each node as a call or reference to
+    ## a callable object with proper indentation
 
-            nodes_to_visit -= visited_nodes
+    for subgraph in subgraphs:
 
-        graph_function_body += indent(
-            subgraph_calls_text,
-            " " * 4,
+        ##
+        body_texts.append("\n" * 2)
+
+        ## write the nodes in an order where each node comes after
+        ## the nodes it depends on, so each one is visited only once
+
+        visited_nodes = set()
+        node_sources = []
+
+        for node in get_nodes_in_dependency_order(subgraph):
+
+            node_sources.append(
+                node_to_python_source(
+                    node,
+                    visited_nodes,
+                    node_cluster_map,
+                )
+            )
+
+            visited_nodes.add(node)
+
+        body_texts.append(
+            indent(
+                "".join(node_sources),
+                " " * 4,
+            )
         )
 
+    graph_function_body = "".join(body_texts)
+
     ###
 
     if (not self.nodes) and text_blocks:
@@ -580,6 +642,14 @@ def python_repr(self):
         + docstring
         + graph_function_body
         + "\n\n"
+        + (
+            (
+                "### node functions"
+                + "\n\n" + node_functions_text + "\n\n"
+            )
+            if node_functions_text
+            else ''
+        )
         + (
             (
                 "### encapsulations (utility functions)"
@@ -674,20 +744,335 @@ def set_text_block_refs(
         refs.append(text_block)
 
 
+def get_nodes_in_dependency_order(nodes):
+    """Return list with nodes, each one after the nodes it depends on.
+
+    Works by visiting the nodes depth-first, listing each node only
+    after all its parents were listed. A stack is used instead of
+    recursion, so long chains of nodes don't hit the recursion limit.
+
+    Nodes are visited in the order of their ids, so the resulting
+    order is the same every time the graph is exported.
+    """
+    nodes = sorted(nodes, key=lambda node: node.id)
+    node_set = set(nodes)
+
+    ordered_nodes = []
+    listed_nodes = set()
+
+    for node in nodes:
+
+        if node in listed_nodes:
+            continue
+
+        ## each item in the stack holds a node and an iterator over
+        ## its parents, so the visit can resume from where it stopped
+
+        stack = [(node, yield_parent_nodes(node, node_set))]
+
+        while stack:
+
+            current_node, parent_nodes = stack[-1]
+
+            for parent_node in parent_nodes:
+
+                if parent_node not in listed_nodes:
+
+                    stack.append(
+                        (parent_node, yield_parent_nodes(parent_node, node_set))
+                    )
+
+                    break
+
+            ## once all parents are listed, the node can be listed
+            ## as well
+
+            else:
+
+                stack.pop()
+
+                if current_node not in listed_nodes:
+
+                    listed_nodes.add(current_node)
+                    ordered_nodes.append(current_node)
+
+    return ordered_nodes
+
+
+def yield_parent_nodes(node, node_set):
+    """Yield nodes providing data to given node.
+
+    Only nodes within the given set are yielded.
+    """
+    for parent in yield_parent_sockets(node):
+
+        if parent.node in node_set:
+            yield parent.node
+
+
+def yield_parent_sockets(node):
+    """Yield output sockets providing data to given node.
+
+    Redirect nodes are skipped in favour of the sockets they get data
+    from, and sockets from nodes in callable mode aren't yielded, since
+    such nodes are referenced rather than executed.
+    """
+    for input_socket in node.input_sockets:
+
+        if not hasattr(input_socket, "parent"):
+            continue
+
+        parent = input_socket.parent
+        parent_node = parent.node
+
+        ### ensure the parent node is not a redirect node
+
+        while hasattr(parent_node, "proxy_socket") and hasattr(
+            parent_node.proxy_socket, "parent"
+        ):
+
+            parent = parent_node.proxy_socket.parent
+            parent_node = parent.node
+
+        ###
+
+        if parent_node.data.get('mode', 'expanded_signature') != 'callable':
+            yield parent
+
+
+def get_node_generations(nodes):
+    """Return list of node generations (lists of nodes).
+
+    Uses the same breadth-first topological sort (Kahn's algorithm)
+    used by the graph manager to sort nodes for execution: the first
+    generation is formed by nodes that don't depend on any of the
+    given nodes and each subsequent generation is formed by nodes
+    depending solely on nodes from previous generations.
+
+    Nodes within each generation are sorted by id.
+    """
+    node_set = set(nodes)
+
+    children_map = {node: [] for node in nodes}
+    indegree_map = {}
+
+    node_generation = []
+
+    for node in sorted(nodes, key=lambda node: node.id):
+
+        parent_nodes = set(yield_parent_nodes(node, node_set))
+
+        if parent_nodes:
+
+            indegree_map[node] = len(parent_nodes)
+
+            for parent_node in parent_nodes:
+                children_map[parent_node].append(node)
+
+        else:
+            node_generation.append(node)
+
+    generations = []
+
+    while node_generation:
+
+        generations.append(node_generation)
+
+        next_generation = []
+
+        for node in node_generation:
+
+            for child in children_map[node]:
+
+                indegree_map[child] -= 1
+
+                if not indegree_map[child]:
+
+                    del indegree_map[child]
+                    next_generation.append(child)
+
+        node_generation = sorted(next_generation, key=lambda node: node.id)
+
+    return generations
+
+
+def get_concurrent_texts(nodes, node_cluster_map):
+    """Return body of main function and node functions for concurrent version.
+
+    Data nodes are written as assignments whose values can be overridden
+    by keyword arguments of main().
+
+    Each of the other nodes is wrapped in a function of its own, which
+    receives the outputs of the nodes it depends on and returns its own
+    outputs. Such functions are submitted to an executor one generation
+    of nodes at a time, so nodes in the same generation run concurrently.
+    The outputs of nodes on which no other node depends are returned
+    from main() in a dict.
+    """
+    visited_nodes = set()
+
+    body_texts = ["\n" * 2]
+    function_texts = []
+
+    ### write data nodes first, since they don't depend on other nodes
+
+    data_nodes = []
+    other_nodes = []
+
+    for node in nodes:
+        (data_nodes if hasattr(node, 'widget') else other_nodes).append(node)
+
+    for node in sorted(data_nodes, key=lambda node: node.id):
+
+        body_texts.append(
+            indent(
+                data_node_to_variable_assignment(
+                    node,
+                    node_cluster_map[node],
+                    visited_nodes,
+                    overridable=True,
+                ),
+                " " * 4,
+            )
+        )
+
+        visited_nodes.add(node)
+
+    body_texts.append(indent(OVERRIDES_CHECK_TEXT, " " * 4))
+
+    ### write the other nodes, generation by generation
+
+    generations = get_node_generations(other_nodes)
+
+    if generations:
+        body_texts.append(indent(EXECUTOR_CREATION_TEXT, " " * 4))
+
+    for index, generation in enumerate(generations, 1):
+
+        submission_texts = []
+        result_texts = []
+
+        for node in generation:
+
+            node_text = node_to_python_source(
+                node,
+                visited_nodes,
+                node_cluster_map,
+            )
+
+            visited_nodes.add(node)
+
+            ## nodes commented out are written as they are
+
+            if node.data.get("commented_out", False):
+
+                submission_texts.append(node_text)
+                continue
+
+            ##
+
+            function_name = f"_node_{node.id}"
+            future_name = f"_future_{node.id}"
+
+            input_names = get_input_variable_names(node)
+            output_names = ", ".join(get_output_variable_names(node))
+
+            function_texts.append(
+                f"def {function_name}({', '.join(input_names)}):\n"
+                + indent(node_text.strip("\n"), " " * 4)
+                + f"\n    return {output_names}\n"
+            )
+
+            submission_texts.append(
+                f"{future_name} = executor.submit("
+                + ", ".join((function_name, *input_names))
+                + ")\n"
+            )
+
+            result_texts.append(f"{output_names} = {future_name}.result()\n")
+
+        body_texts.append(
+            indent(
+                f"\n## generation {index}\n\n"
+                + "".join(submission_texts)
+                + "\n"
+                + "".join(result_texts),
+                " " * 8,
+            )
+        )
+
+    ### return outputs of nodes on which no other node depends
+
+    node_set = set(other_nodes)
+
+    parent_nodes = {
+        parent_node
+        for node in other_nodes
+        for parent_node in yield_parent_nodes(node, node_set)
+    }
+
+    output_names = [
+
+        ## item
+        output_name
+
+        ## source
+        for generation in generations
+        for node in generation
+
+        ## filtering
+        if node not in parent_nodes
+        if not node.data.get("commented_out", False)
+
+        ## source
+        for output_name in get_output_variable_names(node)
+
+    ]
+
+    body_texts.append(
+        "\n    return {\n"
+        + "".join(
+            f"        {repr(output_name)}: {output_name},\n"
+            for output_name in output_names
+        )
+        + "    }\n"
+    )
+
+    return "".join(body_texts), "\n\n".join(function_texts)
+
+
+def get_input_variable_names(node):
+    """Return sorted names of variables holding inputs of node."""
+    return sorted(
+        {
+            "_" + "_".join(map(str, parent.get_id()))
+            for parent in yield_parent_sockets(node)
+        }
+    )
+
+
+def get_output_variable_names(node):
+    """Return names of variables holding outputs of node."""
+
+    try:
+        output_sockets = node.output_socket_live_map.values()
+
+    except AttributeError:
+        output_sockets = node.output_sockets
+
+    return [
+        "_" + "_".join(map(str, socket.get_id()))
+        for socket in output_sockets
+    ]
+
+
 def node_to_python_source(
     node,
-    nodes_to_visit,
     visited_nodes,
-    node_clusters,
+    node_cluster_map,
 ):
 
-    for cluster in node_clusters:
-
-        if node in cluster:
-            break
-
-    else:
-        raise RuntimeError("this else statement should never be" " reached")
+    cluster = node_cluster_map[node]
 
     ###
 
@@ -713,18 +1098,14 @@ def node_to_python_source(
     return node_text_yielding_function(
         node,
         cluster,
-        nodes_to_visit,
         visited_nodes,
-        node_clusters,
     )
 
 
 def callable_node_to_call_text(
     node,
     cluster,
-    nodes_to_visit,
     visited_nodes,
-    node_clusters,
 ):
 
     call_text = node.title_text + "("
@@ -1093,9 +1474,7 @@ def callable_node_to_call_text(
 def operator_node_to_call_text(
     node,
     cluster,
-    nodes_to_visit,
     visited_nodes,
-    node_clusters,
 ):
 
     substitution_map = {}
@@ -1261,9 +1640,7 @@ def operator_node_to_call_text(
 def node_to_code_snippet(
     node,
     cluster,
-    nodes_to_visit,
     visited_nodes,
-    node_clusters,
 ):
 
     substitution_map = {}
@@ -1570,26 +1947,30 @@ def node_to_code_snippet(
 def data_node_to_variable_assignment(
     node,
     cluster,
-    nodes_to_visit,
     visited_nodes,
-    node_clusters,
+    overridable=False,
 ):
 
     output_socket = node.output_socket
     widget = node.widget
 
-    var_def_text = (
-        "_"
-        + "_".join(
-            map(
-                str,
-                output_socket.get_id(),
-            )
+    var_name = "_" + "_".join(
+        map(
+            str,
+            output_socket.get_id(),
         )
-        + " = "
-        + repr(widget.get())
     )
 
+    value_text = repr(widget.get())
+
+    ### if requested, the value can be overridden by an item from
+    ### the 'overrides' dict, using the variable name as the key
+
+    if overridable:
+        value_text = f"overrides.pop({repr(var_name)}, {value_text})"
+
+    var_def_text = var_name + " = " + value_text
+
     ###
     comments_text = ""
 
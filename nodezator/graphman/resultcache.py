@@ -0,0 +1,364 @@
+"""Facility for persistent caching of outputs from deterministic nodes.
+
+Node scripts can declare their main callables deterministic (that is,
+always returning the same output for the same inputs). The outputs of
+such nodes are stored on disk, under a key derived from the script id,
+a hash of the sources of the node pack and the input values. Executing
+the same node with the same inputs in a later session loads the output
+from the disk instead of calling the callable again.
+
+All .py files in the node pack are hashed, so changing helper modules
+within the node pack also changes the key. However, changes in modules
+outside the node pack (like third-party libraries) aren't detected, so
+the cache must be purged manually in such case.
+
+The input values are pickled to compute the key. The items of sets and
+frozensets are sorted beforehand (including the ones within lists,
+tuples and dicts), because their order may change across sessions.
+Other objects whose pickled form varies across sessions even when
+they are equal produce different keys, so their outputs are computed
+again instead of loaded from the cache.
+
+The total size of the cache is kept under a budget defined in the user
+preferences by evicting the least recently used outputs.
+"""
+
+### standard library imports
+
+from hashlib import sha256
+
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+
+from os import utime
+
+
+### local imports
+
+from ..config import WRITEABLE_PATH
+
+from ..userprefsman.main import USER_PREFS
+
+from ..logman.main import get_new_logger
+
+
+
+### create logger for module
+logger = get_new_logger(__name__)
+
+
+### constants
+
+RESULT_CACHE_DIR = WRITEABLE_PATH / 'result_cache'
+
+CACHE_FILE_SUFFIX = '.pickle'
+
+BYTES_PER_MEGABYTE = 1024 ** 2
+
+
+### class definition
+
+class ResultCache:
+    """Stores and retrieves node outputs on disk.
+
+    This class is instantiated only once in the end of the module
+    and its methods are aliased to be used wherever needed.
+    """
+
+    def __init__(self):
+        """Create support objects."""
+
+        ### map associating each cache key with a list containing the
+        ### size of the corresponding file and the time it was last
+        ### accessed; it is only populated when first needed, by
+        ### scanning the cache directory
+        self.entry_map = None
+
+        ### map associating the path of each source file with its
+        ### modification time, size and source hash, so files are
+        ### only hashed again when they change
+        self.source_hash_map = {}
+
+        ### map associating the directory of each node pack with the
+        ### hash of its sources, so node packs are only scanned once
+        ### per execution of the graph (it is cleared whenever the
+        ### graph is executed)
+        self.node_pack_hash_map = {}
+
+    def get_key(self, script_id, script_filepath, args, kwargs):
+        """Return cache key for call or None if inputs can't be hashed.
+
+        Parameters
+        ==========
+
+        script_id (tuple)
+            id of the node script.
+        script_filepath (pathlib.Path)
+            path to the node script; the sources of the node pack
+            containing it are hashed.
+        args, kwargs (list and dict)
+            positional and keyword arguments of the call.
+        """
+        try:
+
+            pickled_data = dumps(
+                (
+                    script_id,
+                    self.get_node_pack_hash(script_filepath),
+                    canonicalize(args),
+                    canonicalize(kwargs),
+                ),
+                protocol=HIGHEST_PROTOCOL,
+            )
+
+        except Exception:
+            return None
+
+        return sha256(pickled_data).hexdigest()
+
+    def get_node_pack_hash(self, script_filepath):
+        """Return hash of sources of node pack containing node script.
+
+        That is, a hash of the relative paths and source hashes of all
+        .py files in the node pack, so changes in helper modules are
+        detected as well. The hash is only computed once per node pack
+        until clear_node_pack_hashes() is called.
+        """
+        ### the node script is in the script directory, which is inside
+        ### the category directory, which is inside the node pack
+        node_pack_dir = script_filepath.parents[2]
+
+        try:
+            return self.node_pack_hash_map[node_pack_dir]
+        except KeyError:
+            pass
+
+        node_pack_hash = self.node_pack_hash_map[node_pack_dir] = sha256(
+            dumps(
+                sorted(
+                    (
+                        path.relative_to(node_pack_dir).as_posix(),
+                        self.get_source_hash(path),
+                    )
+                    for path in node_pack_dir.rglob('*.py')
+                )
+            )
+        ).hexdigest()
+
+        return node_pack_hash
+
+    def clear_node_pack_hashes(self):
+        """Forget hashes of node packs, so they are computed again.
+
+        Must be done before each execution of the graph, since node
+        packs may be edited in between.
+        """
+        self.node_pack_hash_map.clear()
+
+    def get_source_hash(self, script_filepath):
+        """Return hash of source file."""
+        stat_result = script_filepath.stat()
+
+        stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        try:
+            stored_stamp, source_hash = self.source_hash_map[script_filepath]
+
+        except KeyError:
+            pass
+
+        else:
+
+            if stored_stamp == stamp:
+                return source_hash
+
+        source_hash = sha256(script_filepath.read_bytes()).hexdigest()
+        self.source_hash_map[script_filepath] = (stamp, source_hash)
+
+        return source_hash
+
+    def load_entry_map(self):
+        """Populate entry map from files in the cache directory."""
+
+        self.entry_map = {}
+
+        if not RESULT_CACHE_DIR.exists():
+            return
+
+        for path in RESULT_CACHE_DIR.glob('*' + CACHE_FILE_SUFFIX):
+
+            stat_result = path.stat()
+
+            self.entry_map[path.stem] = [
+                stat_result.st_size,
+                stat_result.st_mtime,
+            ]
+
+    def load_output(self, key):
+        """Return tuple indicating whether output was found and the output.
+
+        The file modification time is updated on each access, so the
+        access order is kept across sessions.
+        """
+        if self.entry_map is None:
+            self.load_entry_map()
+
+        if key not in self.entry_map:
+            return False, None
+
+        path = RESULT_CACHE_DIR / (key + CACHE_FILE_SUFFIX)
+
+        try:
+
+            output = loads(path.read_bytes())
+            utime(path)
+
+        except Exception:
+
+            logger.exception(f"Couldn't load cached output from {path}.")
+
+            self.remove_entry(key)
+            return False, None
+
+        self.entry_map[key][1] = path.stat().st_mtime
+
+        return True, output
+
+    def store_output(self, key, output):
+        """Store output in the cache under the given key.
+
+        Outputs that can't be pickled are ignored.
+        """
+        if self.entry_map is None:
+            self.load_entry_map()
+
+        try:
+            data = dumps(output, protocol=HIGHEST_PROTOCOL)
+
+        except Exception:
+            return
+
+        ### outputs larger than the whole budget aren't stored
+
+        max_size = USER_PREFS['RESULT_CACHE_MAX_SIZE'] * BYTES_PER_MEGABYTE
+
+        if len(data) > max_size:
+            return
+
+        ### store output
+
+        if not RESULT_CACHE_DIR.exists():
+            RESULT_CACHE_DIR.mkdir(parents=True)
+
+        path = RESULT_CACHE_DIR / (key + CACHE_FILE_SUFFIX)
+
+        try:
+            path.write_bytes(data)
+
+        except Exception:
+
+            logger.exception(f"Couldn't store output in {path}.")
+            return
+
+        self.entry_map[key] = [len(data), path.stat().st_mtime]
+
+        ### evict least recently used outputs if needed
+        self.enforce_size_budget(max_size)
+
+    def enforce_size_budget(self, max_size):
+        """Remove least recently used outputs until under the budget."""
+        entry_map = self.entry_map
+
+        total_size = sum(size for size, _ in entry_map.values())
+
+        if total_size <= max_size:
+            return
+
+        for key in sorted(entry_map, key=lambda key: entry_map[key][1]):
+
+            total_size -= entry_map[key][0]
+            self.remove_entry(key)
+
+            if total_size <= max_size:
+                break
+
+    def remove_entry(self, key):
+        """Remove output stored under key."""
+        self.entry_map.pop(key, None)
+
+        path = RESULT_CACHE_DIR / (key + CACHE_FILE_SUFFIX)
+
+        try:
+            path.unlink()
+
+        except FileNotFoundError:
+            pass
+
+    def purge(self):
+        """Remove all stored outputs, returning number of bytes freed."""
+
+        if self.entry_map is None:
+            self.load_entry_map()
+
+        freed_bytes = sum(size for size, _ in self.entry_map.values())
+
+        for key in list(self.entry_map):
+            self.remove_entry(key)
+
+        return freed_bytes
+
+
+### utility
+
+class SortedItems(tuple):
+    """Items of a set or frozenset, sorted.
+
+    Used in place of sets and frozensets when computing cache keys,
+    since their items are pickled in an order which may change across
+    sessions.
+    """
+
+    __slots__ = ()
+
+
+def canonicalize(obj):
+    """Return object with sets/frozensets replaced by sorted items.
+
+    Sets and frozensets within lists, tuples and dicts are replaced as
+    well. The items are sorted by their pickled form, since they may not
+    be comparable with each other.
+    """
+    obj_type = type(obj)
+
+    if obj_type in (set, frozenset):
+
+        return SortedItems(
+            sorted(
+                map(canonicalize, obj),
+                key=lambda item: dumps(item, protocol=HIGHEST_PROTOCOL),
+            )
+        )
+
+    elif obj_type in (list, tuple):
+        return obj_type(map(canonicalize, obj))
+
+    elif obj_type is dict:
+
+        return {
+            canonicalize(key): canonicalize(value)
+            for key, value in obj.items()
+        }
+
+    return obj
+
+
+### instantiate result cache and reference its relevant methods in the
+### module level, so they can be easily imported from anywhere else in
+### the package
+
+_ = ResultCache()
+
+get_result_cache_key = _.get_key
+load_cached_output = _.load_output
+store_output_in_cache = _.store_output
+purge_result_cache = _.purge
+clear_node_pack_hashes = _.clear_node_pack_hashes
@@ -44,6 +44,8 @@
 
 from ..exception import NodeScriptsError
 
+from ..utils import clear_call_plans
+
 from ...colorsman.colors import NODE_CATEGORY_COLORS
 
 
@@ -567,6 +569,10 @@ def load_scripts(
     APP_REFS.signature_map.update(signature_map)
     signature_map.clear()
 
+    ## the call plans of the signatures replaced aren't needed
+    ## anymore
+    clear_call_plans()
+
     APP_REFS.script_path_map.clear()
     APP_REFS.script_path_map.update(script_path_map)
     script_path_map.clear()
@@ -13,6 +13,8 @@
     set_status_message,
 )
 
+from ..streaming import Stream
+
 from .base import Socket
 
 from .surfs import CODENAME_TO_STYLE_MAP
@@ -212,6 +214,14 @@ def receive_input(self, data):
             data sent by the graph manager, retrieved from
             another node.
         """
+        ### streams must be shared, so that each consumer can
+        ### retrieve all items
+
+        if isinstance(data, Stream):
+            data = data.share()
+
+        ###
+
         self.node.receive_input(
             data,
             self.parameter_name,
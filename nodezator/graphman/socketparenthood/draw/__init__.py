@@ -1,11 +1,17 @@
 """Facility with class extension with drawing operations."""
 
+### standard library import
+from operator import attrgetter
+
+
 ### third-party import
 from pygame.draw import line as draw_line
 
 
 ### local imports
 
+from ....config import APP_REFS
+
 from ....pygamesetup import SERVICES_NS, SCREEN
 
 from ....colorsman.colors import CUTTING_SEGMENT
@@ -18,6 +24,45 @@
 
 
 
+get_rect_center = attrgetter('rect.center')
+
+
+def get_socket_center_getter():
+    """Return callable to get center of sockets on the screen.
+
+    Sockets may belong to nodes to which scrolling wasn't applied yet
+    (see the scroll() method of the editing assistant), in which case
+    the scrolling pending for the node must be added to the center.
+    """
+    ea = APP_REFS.ea
+
+    ### if there's no pending scrolling, the center of the rect can
+    ### be used as-is
+
+    if not ea.is_scrolling_pending():
+        return get_rect_center
+
+    ### otherwise add the pending scrolling, minus the part of it
+    ### already applied to the node, if any
+
+    dx, dy = ea.pending_scrolling
+    partially_aligned_map = ea.partially_aligned_map
+
+    def get_center(socket):
+
+        x, y = socket.rect.center
+        applied_scrolling = partially_aligned_map.get(socket.node)
+
+        if applied_scrolling is None:
+            return x + dx, y + dy
+
+        applied_dx, applied_dy = applied_scrolling
+
+        return x + dx - applied_dx, y + dy - applied_dy
+
+    return get_center
+
+
 class DrawingOperations:
     """Drawing operations for the socket trees."""
 
@@ -42,10 +87,11 @@ def reference_socket_detection_graphics(self):
 
     def draw_lines(self):
         """Draw lines which cross the screen."""
+        get_center = get_socket_center_getter()
 
         for parent in self.parents:
 
-            parent_center = parent.rect.center
+            parent_center = get_center(parent)
             segment_color = parent.line_color
 
             for child in parent.children:
@@ -53,7 +99,7 @@ def draw_lines(self):
                 try:
                     start, end = clip_segment(
                         parent_center,
-                        child.rect.center,
+                        get_center(child),
                     )
 
                 except ValueError:
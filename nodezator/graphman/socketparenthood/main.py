@@ -32,6 +32,16 @@ def setup_parent_sockets_data(self):
             We do so in order to be able to to easily
             retrieve data about socket trees whenever
             needed.
+
+        - Index the data of the socket trees by socket id
+            So segments can be added and removed in
+            constant time. The data is turned back into
+            a list in the format used in the native file
+            when saving (see get_parent_sockets_data()).
+
+        - Index the nodes upstream of each node
+            Used to quickly check whether new segments
+            would create cycles in the data flow.
         """
         ### iterate over the data for each tree in the
         ### parent sockets data attribute, grabbing references
@@ -39,12 +49,41 @@ def setup_parent_sockets_data(self):
         ### reference the children and vice-versa;
         ###
         ### the parent of each tree is returned in the process and
-        ### gathered in a list stored in the 'parents' attribute
+        ### gathered in a dict stored in the 'parents' attribute;
+        ### the dict is used as an ordered set (its values are
+        ### always None), so parents can be removed in constant time;
+        ###
+        ### the data of each tree is also stored in a map, where the id
+        ### of the parent is associated with a tuple containing its
+        ### class name and a map associating the ids of its children
+        ### with their class names
 
-        self.parents = [
-            self.reference_parent_children(parent_data)
-            for parent_data in self.parent_sockets_data
-        ]
+        parents = self.parents = {}
+        parent_data_map = self.parent_data_map = {}
+
+        for parent_data in self.parent_sockets_data:
+
+            parents[self.reference_parent_children(parent_data)] = None
+
+            parent_data_map[parent_data["id"]] = (
+                parent_data["class_name"],
+                {
+                    child_data["id"]: child_data["class_name"]
+                    for child_data in parent_data["children"]
+                },
+            )
+
+        ### create map associating each node with a map which, in turn,
+        ### associates each node directly upstream from it with the
+        ### number of segments connecting them; the map is updated
+        ### whenever segments are established or severed
+
+        self.upstream_node_map = {}
+
+        for parent in self.parents:
+
+            for child in parent.children:
+                self.index_segment(parent, child)
 
         ### create collections to temporarily store sockets and
         ### their nodes to be signaled after the sockets' segments are
@@ -56,6 +95,30 @@ def setup_parent_sockets_data(self):
 
         self.nodes_for_signaling = set()
 
+    def get_parent_sockets_data(self):
+        """Return list with data of socket trees, as stored in files."""
+        return [
+
+            {
+                "id": parent_id,
+                "class_name": class_name,
+                "children": [
+
+                    {
+                        "id": child_id,
+                        "class_name": child_class_name,
+                    }
+
+                    for child_id, child_class_name in children_data.items()
+
+                ],
+            }
+
+            for parent_id, (class_name, children_data)
+            in self.parent_data_map.items()
+
+        ]
+
     def reference_parent_children(
         self,
         parent_data,
@@ -94,45 +94,69 @@ def check_cyclic_flow(self, socket_a, socket_b):
         So, if such kind of connection is detected,
         we raise a ValueError to prevent the connection
         from existing and thereby causing a cycle.
+
+        The nodes upstream from the node of the output
+        socket are visited using the index of upstream
+        nodes, each of them only once, so the check takes
+        linear time on the number of nodes and connections
+        between them.
         """
-        ### retrieve the node from the socket a
+        ### retrieve the nodes from both sockets
         node = socket_a.node
+        input_node = socket_b.node
 
-        ### check whether socket_b has the same node of
-        ### socket_a, raising a ValueError if so, since
-        ### connecting the sockets in this circunstance
-        ### would create a cycle in the data flow
-
-        if socket_b.node is node:
+        ### keep checking the nodes further up in the node layout
+        ### branch until all existing "ancestors" are checked, raising
+        ### a ValueError if the node of socket_b is among them (or is
+        ### the node of socket_a itself), since connecting the sockets
+        ### in this circunstance would create a cycle in the data flow
 
-            raise ValueError(
-                "Connecting given sockets would create a" " cycle in the data flow"
-            )
+        upstream_node_map = self.upstream_node_map
 
-        ### keep checking the parents of the input sockets
-        ### further up in the node layout branch until all
-        ### existing "ancestors" are checked
+        visited_nodes = {node}
+        nodes_to_visit = [node]
 
-        for input_socket in node.input_sockets:
+        while nodes_to_visit:
 
-            ## check whether the input socket has a parent
-            try:
-                parent = input_socket.parent
+            node = nodes_to_visit.pop()
 
-            ## if not, that's ok, just pass
-            except AttributeError:
-                pass
+            if node is input_node:
 
-            ## otherwise keep checking the input
-            ## sockets embedded in the parent's node
-            ## recursively until no "ancestors" are
-            ## left
-            else:
-                self.check_cyclic_flow(
-                    parent,
-                    socket_b,
+                raise ValueError(
+                    "Connecting given sockets would create a"
+                    " cycle in the data flow"
                 )
 
+            for upstream_node in upstream_node_map.get(node, ()):
+
+                if upstream_node not in visited_nodes:
+
+                    visited_nodes.add(upstream_node)
+                    nodes_to_visit.append(upstream_node)
+
+    def index_segment(self, parent, child):
+        """Register segment between sockets in upstream node index."""
+        counter_map = self.upstream_node_map.setdefault(child.node, {})
+
+        parent_node = parent.node
+        counter_map[parent_node] = counter_map.get(parent_node, 0) + 1
+
+    def unindex_segment(self, parent, child):
+        """Remove segment between sockets from upstream node index."""
+        child_node = child.node
+        parent_node = parent.node
+
+        counter_map = self.upstream_node_map[child_node]
+
+        counter_map[parent_node] -= 1
+
+        if not counter_map[parent_node]:
+
+            del counter_map[parent_node]
+
+            if not counter_map:
+                del self.upstream_node_map[child_node]
+
     def sever_segment_between_sockets(
         self,
         parent,
@@ -172,48 +196,27 @@ def sever_segment_between_sockets(
         ### perform extra tasks depending on whether the
         ### parent still has children left or not
 
+        parent_id = parent.get_id()
+
         if parent.children:
 
             ## update the parent's tree data to take into
             ## accound the removal of the child socket
-
-            parent_id = parent.get_id()
-            child_id = child.get_id()
-
-            for parent_data in self.parent_sockets_data:
-
-                if not parent_data["id"] == parent_id:
-                    continue
-
-                for child_data in parent_data["children"]:
-                    if child_data["id"] == child_id:
-                        break
-
-                break
-
-            parent_data["children"].remove(child_data)
+            del self.parent_data_map[parent_id][1][child.get_id()]
 
         else:
 
             ## delete its children attribute
             del parent.children
 
-            ## remove it from the list of existing parents
-            self.parents.remove(parent)
+            ## remove it from the existing parents
+            del self.parents[parent]
 
             ## remove parent tree data, since it doesn't
             ## form a tree anymore (the socket alone isn't
             ## considered a valid tree, that is, the tree
             ## must have at least height 1)
-
-            parent_id = parent.get_id()
-
-            for parent_data in self.parent_sockets_data:
-
-                if parent_data["id"] == parent_id:
-                    break
-
-            self.parent_sockets_data.remove(parent_data)
+            del self.parent_data_map[parent_id]
 
             ## if requested, store reference to parent, so its node is
             ## notified of the severance
@@ -225,6 +228,9 @@ def sever_segment_between_sockets(
         ### attribute removed
         del child.parent
 
+        ### also remove the segment from the index of upstream nodes
+        self.unindex_segment(parent, child)
+
         ### finally, if requested, the child must be stored
         ### so that its node can later be signaled about the
         ### severance we just performed
@@ -246,42 +252,28 @@ def establish_segment(self, socket_a, socket_b):
         except AttributeError:
 
             # add it to self.parents
-            self.parents.append(socket_a)
-
-            # create and append a new tree data entry for
-            # the socket_a in the socket trees
+            self.parents[socket_a] = None
 
-            parent_data = {
-                "id": socket_a.get_id(),
-                "class_name": socket_a.__class__.__name__,
-                "children": [],
-            }
+            # create a new tree data entry for the socket_a,
+            # referencing the map for data of its children
 
-            self.parent_sockets_data.append(parent_data)
+            children_data = {}
 
-            # also reference the list in the 'children'
-            # field of the tree data
-            children_data = parent_data["children"]
+            self.parent_data_map[socket_a.get_id()] = (
+                socket_a.__class__.__name__,
+                children_data,
+            )
 
             # create a new 'children' attribute containing
             # a list
             children = socket_a.children = []
 
-        ## setups in case the socket_a already has children
+        ## setups in case the socket_a already has children,
+        ## in which case we just reference the map for data
+        ## of its children
 
         else:
-
-            ## reference the 'children' field of the
-            ## tree data for the socket_a
-
-            socket_a_id = socket_a.get_id()
-
-            for parent_data in self.parent_sockets_data:
-
-                if parent_data["id"] == socket_a_id:
-                    break
-
-            children_data = parent_data["children"]
+            children_data = self.parent_data_map[socket_a.get_id()][1]
 
         ### append the socket_b as a child of socket_a and
         ### reference socket_a as its parent in its 'parent'
@@ -290,6 +282,9 @@ def establish_segment(self, socket_a, socket_b):
         children.append(socket_b)
         socket_b.parent = socket_a
 
+        ### also register the segment in the index of upstream nodes
+        self.index_segment(socket_a, socket_b)
+
         ### check whether socket_b has a
         ### 'signal_connection' method
         try:
@@ -304,15 +299,9 @@ def establish_segment(self, socket_a, socket_b):
         else:
             signal_connection()
 
-        ### create and append the tree data for the socket_b
-        ### in the children data of the socket_a
-
-        child_data = {
-            "id": socket_b.get_id(),
-            "class_name": socket_b.__class__.__name__,
-        }
-
-        children_data.append(child_data)
+        ### store the tree data for the socket_b in the children
+        ### data of the socket_a
+        children_data[socket_b.get_id()] = socket_b.__class__.__name__
 
         ### finally, if any of the nodes (the node of the
         ### socket_a or the node of the socket_b) is
@@ -436,40 +425,22 @@ def signal_severance_of_removed_sockets(self):
 
     def fix_input_socket_id(self, input_socket, old_id):
         """Fix input socket id on socket tree."""
-        ### get the id of the parent
-        parent_id = input_socket.parent.get_id()
-
-        ### iterate over the tree data in the socket,
-        ### trees, looking for the one with the parent id
+        ### retrieve the children data from the tree data of
+        ### the parent
+        children_data = self.parent_data_map[input_socket.parent.get_id()][1]
 
-        for parent_data in self.parent_sockets_data:
-            if parent_data["id"] == parent_id:
-                break
-
-        ### now iterate over the children data, looking
-        ### for the data whose id matches the old id
-        ### received
-
-        for child_data in parent_data["children"]:
-            if child_data["id"] == old_id:
-                break
-
-        ### finally update the id of the child data with
-        ### the current id of the input socket
-        child_data["id"] = input_socket.get_id()
+        ### store the child data under the current id of the
+        ### input socket instead of the old id received
+        children_data[input_socket.get_id()] = children_data.pop(old_id)
 
     def fix_output_socket_id(self, output_socket, old_id):
         """Fix output socket id on socket tree."""
-        ### iterate over the tree data in the socket,
-        ### trees, looking for the one with the old id
+        ### store the tree data under the current id of the
+        ### output socket instead of the old id received
 
-        for parent_data in self.parent_sockets_data:
-            if parent_data["id"] == old_id:
-                break
-
-        ### update the id of the parent data with the
-        ### current id of the output socket
-        parent_data["id"] = output_socket.get_id()
+        self.parent_data_map[output_socket.get_id()] = (
+            self.parent_data_map.pop(old_id)
+        )
 
     def sever_all_connections(self, node):
         """Sever all existing connections on given node."""
@@ -0,0 +1,159 @@
+"""Facility for streaming items between item-wise nodes.
+
+Node scripts can mark their main callables as item-wise. Instead of
+being called once, the main callable of an item-wise node is called
+for each item of the iterable received in its first parameter, with
+the same values for the remaining parameters. The outputs are produced
+lazily, one at a time, in the form of a stream sent to downstream nodes.
+
+Chains of item-wise nodes thus process one item at a time, so memory
+stays bounded regardless of the number of items. Nodes which aren't
+item-wise receive the stream itself (an iterator) and are the points
+where the items are collected/aggregated.
+
+If an item-wise node has more than one output, each output produced
+must be a mapping, just like the return value of regular nodes with
+more than one output. Each output socket then sends a stream of the
+values stored under its output name.
+"""
+
+### standard library imports
+
+from itertools import tee
+
+from copy import copy
+
+
+### local import
+from .exception import NodeCallableError, UnexpectedOutputError
+
+
+
+class Stream:
+    """Iterator over items produced by an item-wise node.
+
+    A stream can be handed to more than one consumer. In such case,
+    items are buffered until all consumers retrieve them, so memory
+    is only bounded when each stream has a single consumer.
+    """
+
+    __slots__ = ('iterator', 'was_shared', 'is_teed')
+
+    def __init__(self, iterable):
+        """Store iterator from iterable."""
+        self.iterator = iter(iterable)
+
+        self.was_shared = False
+        self.is_teed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.iterator)
+
+    def share(self):
+        """Return stream to be handed to a new consumer.
+
+        The first consumer receives the stream itself, while the
+        next ones receive copies yielding the same items.
+
+        All consumers must receive the stream before any of them
+        starts retrieving items.
+        """
+        if not self.was_shared:
+
+            self.was_shared = True
+            return self
+
+        ### use a tee object as the iterator, so it can be copied
+
+        if not self.is_teed:
+
+            self.iterator, = tee(self.iterator, 1)
+            self.is_teed = True
+
+        ### return new stream using a copy of the iterator
+
+        stream = Stream(copy(self.iterator))
+        stream.was_shared = True
+
+        return stream
+
+
+def yield_item_outputs(node, callable_obj, args, kwargs):
+    """Yield outputs of item-wise callable for each item received.
+
+    The items come from the iterable in the first positional argument.
+
+    Errors raised while calling the callable are raised as a
+    NodeCallableError related to the item-wise node, so it can be
+    told apart from the node consuming the stream.
+    """
+    ### raise error if there's no positional argument to provide
+    ### the items
+
+    if not args:
+
+        raise NodeCallableError(node) from TypeError(
+            "item-wise callables must have at least one positional"
+            " parameter, whose argument provides the items"
+        )
+
+    ###
+
+    items, *other_args = args
+
+    for item in items:
+
+        try:
+            output = callable_obj(item, *other_args, **kwargs)
+
+        except Exception as err:
+            raise NodeCallableError(node) from err
+
+        yield output
+
+
+def yield_output_items(node, stream, output_name, output_names):
+    """Yield the given output from each item of the stream.
+
+    Used when the item-wise node has more than one output, in which
+    case each item is a mapping whose keys are the output names. The
+    stream of each output socket thus yields the values stored under
+    its output name.
+
+    Parameters
+    ==========
+    node (graphman.callablenode.main.CallableNode instance)
+        item-wise node producing the stream.
+    stream (Stream instance)
+        stream of mappings produced by the node.
+    output_name (string)
+        key of the value to be retrieved from each mapping.
+    output_names (iterable of strings)
+        names of all outputs of the node, used in the error message
+        in case an item isn't a mapping with the expected keys.
+    """
+    for item in stream:
+
+        try:
+            output = item[output_name]
+
+        except (TypeError, KeyError) as err:
+
+            raise NodeCallableError(node) from (
+                UnexpectedOutputError(node, output_names)
+            )
+
+        yield output
+
+
+def drain(stream):
+    """Retrieve all items from stream, discarding them.
+
+    Used when the stream produced by an item-wise node isn't consumed
+    by any other node, so the callable is still called for each item.
+    """
+    for _ in stream:
+        pass
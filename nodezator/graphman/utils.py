@@ -1,27 +1,166 @@
 """Node management utilities"""
 
+### standard library import
+from inspect import Parameter
 
-### function to perform call with custom syntaxes
+
+### class and functions to perform calls with custom syntaxes
 ### according to their parameters (or lack thereof)
 
-# obtain a string formatter callable which simulates
-# a call
-format_as_call = "callable_obj({})".format
+## codes representing how the argument of each kind of parameter
+## is laid out in a call
+
+POSITIONAL = 0
+VAR_POSITIONAL = 1
+KEYWORD = 2
+VAR_KEYWORD = 3
+
+LAYOUT_CODE_MAP = {
+    Parameter.POSITIONAL_ONLY: POSITIONAL,
+    Parameter.POSITIONAL_OR_KEYWORD: POSITIONAL,
+    Parameter.VAR_POSITIONAL: VAR_POSITIONAL,
+    Parameter.KEYWORD_ONLY: KEYWORD,
+    Parameter.VAR_KEYWORD: VAR_KEYWORD,
+}
+
+## map to store call plans, associating the id of each signature
+## object with the signature object itself and its call plan
+##
+## signature objects can't be used as keys themselves, because their
+## hashes are computed from their annotations, which aren't always
+## hashable; the signature objects are stored along with their call
+## plans so they are kept alive and their ids aren't reused; because
+## of that, the map must be cleared whenever the signature objects in
+## use are replaced, like when node scripts are (re)loaded (check
+## clear_call_plans())
+_CALL_PLAN_MAP = {}
+
+
+class CallPlan:
+    """Lays out arguments for a call according to a signature.
+
+    The layout of the arguments is computed only once, from the kinds
+    of the parameters in the signature, and reused in every call.
+    """
+
+    __slots__ = ('steps', 'only_positional')
+
+    def __init__(self, signature_obj):
+        """Store the layout of each parameter in order.
+
+        Parameters
+        ==========
+
+        signature_obj (obj returned from inspect.signature())
+            used to obtain information about the parameters
+            (or lack thereof) of the callable.
+        """
+        self.steps = tuple(
+            (param_name, LAYOUT_CODE_MAP[param_obj.kind])
+            for param_name, param_obj in signature_obj.parameters.items()
+        )
+
+        self.only_positional = all(
+            layout_code == POSITIONAL
+            for _, layout_code in self.steps
+        )
+
+    def lay_arguments(self, argument_map):
+        """Return list of positional args and dict of keyword args.
+
+        Arguments whose parameters aren't present in the argument map
+        are skipped.
+        """
+        ### if all parameters are positional, we can simply list the
+        ### arguments
+
+        if self.only_positional:
+
+            return [
+                argument_map[param_name]
+                for param_name, _ in self.steps
+                if param_name in argument_map
+            ], {}
+
+        ### otherwise lay each argument according to the kind of its
+        ### parameter
+
+        args = []
+        kwargs = {}
+
+        for param_name, layout_code in self.steps:
+
+            ## skip parameters whose arguments weren't provided
+            if param_name not in argument_map:
+                continue
+
+            value = argument_map[param_name]
+
+            if layout_code == POSITIONAL:
+                args.append(value)
+
+            elif layout_code == VAR_POSITIONAL:
+                args.extend(value)
+
+            elif layout_code == KEYWORD:
+                kwargs[param_name] = value
+
+            else:
 
-## main function
+                ## the keys are checked for repetition, so we behave
+                ## like the '**' syntax in a call (updating the dict
+                ## with '**' also ensures only mappings with string
+                ## keys are accepted, like in a call)
+
+                for key in kwargs.keys() & value.keys():
+
+                    raise TypeError(
+                        f"got multiple values for keyword argument '{key}'"
+                    )
+
+                kwargs.update(**value)
+
+        return args, kwargs
+
+    def execute(self, callable_obj, argument_map):
+        """Call callable with laid arguments, returning its return value."""
+        args, kwargs = self.lay_arguments(argument_map)
+        return callable_obj(*args, **kwargs)
+
+
+def get_call_plan(signature_obj):
+    """Return call plan for signature, creating it if needed."""
+
+    try:
+        return _CALL_PLAN_MAP[id(signature_obj)][1]
+
+    except KeyError:
+
+        call_plan = CallPlan(signature_obj)
+        _CALL_PLAN_MAP[id(signature_obj)] = (signature_obj, call_plan)
+
+        return call_plan
+
+
+def clear_call_plans():
+    """Discard all call plans, releasing their signature objects.
+
+    Call plans are created again as needed.
+    """
+    _CALL_PLAN_MAP.clear()
 
 
 def lay_arguments_and_execute(callable_obj, argument_map, signature_obj):
     """Lay arguments, execute callable and return result.
 
-    Works by building a string representing a call to the
-    received callable with all its arguments laid out
-    properly according to the kind of the corresponding
-    parameters.
+    Works by laying the arguments from the argument map in a
+    list of positional arguments and a dict of keyword arguments,
+    according to the kind of the corresponding parameters, and
+    then calling the callable with them, returning its return
+    value.
 
-    Such string is then, executed with the builtin function
-    eval() and its return value is returned from this
-    function.
+    The layout is computed only once per signature object, in
+    the form of a call plan which is reused in the next calls.
 
     Such kinds of parameters refer to whether a parameter
     is positional-only, keyword-only, both positional
@@ -36,8 +175,8 @@ def lay_arguments_and_execute(callable_obj, argument_map, signature_obj):
     '_VAR_KEYWORD'.
 
     If a parameter is of kind inspect._KEYWORD_ONLY, for
-    instance, the string will be built so that its
-    argument is passed as a keyword in the call.
+    instance, its argument is passed as a keyword in the
+    call.
 
     Note that instead of obtaining the signature from
     the callable itself we chose to receive it as an
@@ -132,61 +271,53 @@ def lay_arguments_and_execute(callable_obj, argument_map, signature_obj):
     'this'
 
     """
-    ### start a string to be built representing the
-    ### laid out arguments
-    layout_string = ""
-
-    ### iterate over each parameter filling the layout
-    ### string with more content representing each argument
-    ### being properly laid out in it according to the
-    ### kind of its corresponding parameter
-
-    for param_name, param_obj in signature_obj.parameters.items():
-
-        ## if the argument for the parameter wasn't provided,
-        ## that is, isn't present on the argument map, skip
-        ## this iteration by using the 'continue' statement
-        if param_name not in argument_map:
-            continue
-
-        ## create a base text from the parameter name,
-        ## representing the retrieval of the value for
-        ## the parameter from the argument map
-        param_value_retrieval = f"argument_map['{param_name}'],"
+    return get_call_plan(signature_obj).execute(callable_obj, argument_map)
 
-        ## alter the value retrieval text according to the
-        ## kind of the parameter
 
-        # parameters before '*'
+def lay_arguments(argument_map, signature_obj):
+    """Return positional and keyword arguments for a call.
 
-        if param_obj.kind in (
-            param_obj.POSITIONAL_ONLY,
-            param_obj.POSITIONAL_OR_KEYWORD,
-        ):
-            layout_string += param_value_retrieval
+    Works like lay_arguments_and_execute(), but instead of
+    executing a callable, the arguments are laid out in a
+    list of positional arguments and a dict of keyword
+    arguments, which are returned. This is useful when the
+    call must happen elsewhere, like in another process.
 
-        # a parameter with a single star: *args
+    Parameters
+    ==========
 
-        elif param_obj.kind == param_obj.VAR_POSITIONAL:
-            layout_string += "*" + param_value_retrieval
+    argument_map  (dict)
+        has values for the parameters, to use in the call.
 
-        # parameters after either bare '*' or '*args'
+    signature_obj (obj returned from inspect.signature())
+        used to obtain information about the parameters
+        (or lack thereof) of the callable.
 
-        elif param_obj.kind == param_obj.KEYWORD_ONLY:
 
-            layout_string += param_name + "=" + param_value_retrieval
+    Doctests
+    ========
 
-        # a parameter with double stars: **kwargs
+    >>> from inspect import signature
 
-        elif param_obj.kind == param_obj.VAR_KEYWORD:
-            layout_string += "**" + param_value_retrieval
+    >>> def hello(a, *b, c, **d):
+    ...     return a, b, c, d
+    >>> sig = signature(hello)
 
-    ### now format the layout string as a proper call
-    ### and, since the string is now complete and
-    ### represents a valid call using variables present
-    ### in this function's name space, perform the call
-    ### using eval(), returning the call's return value
-    return eval(f"callable_obj({layout_string})")
+    >>> kwargs = {
+    ...   'a': 11,
+    ...   'b': ['hello', 'world'],
+    ...   'c': 'the letter c',
+    ...   'd': {
+    ...     'food': 'pie'
+    ...   }
+    ... }
+    >>> args, kwargs = lay_arguments(kwargs, sig)
+    >>> args
+    [11, 'hello', 'world']
+    >>> kwargs == {'c': 'the letter c', 'food': 'pie'}
+    True
+    """
+    return get_call_plan(signature_obj).lay_arguments(argument_map)
 
 
 ### generator function to yield nodes in a subgraph and
@@ -196,8 +327,10 @@ def lay_arguments_and_execute(callable_obj, argument_map, signature_obj):
 def yield_subgraph_nodes(node, visited_nodes=None):
     """Yield all nodes in subgraph.
 
-    Works by recursively yielding nodes connected with
-    the given one.
+    Works by visiting the nodes connected with the given one,
+    then the nodes connected with them, and so on. A stack of
+    nodes to visit is used instead of recursion, so the size
+    of the subgraph isn't limited by the recursion limit.
 
     Parameters
     ==========
@@ -218,92 +351,71 @@ def yield_subgraph_nodes(node, visited_nodes=None):
     ### as visited by adding it to the corresponding set
     visited_nodes.add(node)
 
-    ### let's start the visit by yielding the node
-    yield node
+    ### create a stack of nodes to visit, starting with
+    ### the given one
+    nodes_to_visit = [node]
 
-    ### now let's visit each upstream node recursively,
-    ### that is, the ones we didn't visit yet
+    ### while there are nodes to visit, visit the last one
+    ### added to the stack
 
-    for input_socket in node.input_sockets:
+    while nodes_to_visit:
 
-        ## try retrieving the value of the socket's
-        ## 'parent' attribute, which, if exists,
-        ## should contain a reference to an output
-        ## socket which is the parent of the socket
-        ## (the output socket is from another node)
-        try:
-            parent_output_socket = input_socket.parent
+        node = nodes_to_visit.pop()
 
-        ## if such attribute doesn't exits, just pass
-        except AttributeError:
-            pass
+        ### let's start the visit by yielding the node
+        yield node
 
-        ## otherwise, reference the node of such
-        ## parent socket and visit it if not visited
-        ## already, by passing it to this same
-        ## function and yielding from it
-        ##
-        ## you must also pass along the set of visited
-        ## nodes, so that the function knows whether
-        ## a node has already been visited or not
-
-        else:
-
-            parent_node = parent_output_socket.node
-
-            if parent_node not in visited_nodes:
-
-                yield from yield_subgraph_nodes(parent_node, visited_nodes)
-
-    ### now let's visit each downstream node recursively,
-    ### that is, the ones we didn't visit yet
-    ###
-    ### note that some nodes also have a map where they store references
-    ### to their output sockets; however, we don't worry about output
-    ### sockets from such map (if it exists) here, because even the nodes
-    ### which have such map still store references to their output sockets
-    ### in the attribute used here; the difference is that nodes that have
-    ### such map, when in collapsed signature mode, only reference the
-    ### connected output sockets in this attribute (if any); this is fine,
-    ### because we are only interested in the connected output sockets
-    ### anyway, since we are traversing the graph
-
-    for output_socket in node.output_sockets:
-
-        ## try retrieving the value of the socket's
-        ## 'children' attribute, which, if exists, should
-        ## contain a reference to a list which contains
-        ## references to input sockets considered
-        ## children of this socket (the input sockets are
-        ## from other nodes)
-        try:
-            children = output_socket.children
-
-        ## if such attribute doesn't exits, just pass
-        except AttributeError:
-            pass
-
-        ## otherwise, iterate over each input socket
-        ## reference, referencing its node and visiting
-        ## such node, if not visited already, by passing
-        ## it to this same function and yielding from it
-        ##
-        ## you must also pass along the set of visited
-        ## nodes, so that the function knows whether a
-        ## node has already been visited or not
+        ### now let's gather the upstream nodes, that is,
+        ### the nodes of the parents of the input sockets
 
-        else:
+        connected_nodes = [
 
-            for child_input_socket in children:
+            ## item
+            input_socket.parent.node
 
-                child_node = child_input_socket.node
+            ## source
+            for input_socket in node.input_sockets
 
-                if child_node not in visited_nodes:
+            ## filtering
+            if hasattr(input_socket, 'parent')
 
-                    yield from yield_subgraph_nodes(
-                        child_node,
-                        visited_nodes,
-                    )
+        ]
+
+        ### and the downstream nodes, that is, the nodes of
+        ### the children of the output sockets
+        ###
+        ### note that some nodes also have a map where they store
+        ### references to their output sockets; however, we don't
+        ### worry about output sockets from such map (if it exists)
+        ### here, because even the nodes which have such map still
+        ### store references to their output sockets in the attribute
+        ### used here; the difference is that nodes that have such map,
+        ### when in collapsed signature mode, only reference the
+        ### connected output sockets in this attribute (if any); this
+        ### is fine, because we are only interested in the connected
+        ### output sockets anyway, since we are traversing the graph
+
+        connected_nodes.extend(
+
+            ## item
+            child_input_socket.node
+
+            ## source
+
+            for output_socket in node.output_sockets
+            for child_input_socket in getattr(output_socket, 'children', ())
+
+        )
+
+        ### mark the connected nodes we didn't visit yet as
+        ### visited and add them to the stack
+
+        for connected_node in connected_nodes:
+
+            if connected_node not in visited_nodes:
+
+                visited_nodes.add(connected_node)
+                nodes_to_visit.append(connected_node)
 
 
 def yield_subgraphs(nodes):
@@ -361,8 +473,11 @@ def yield_subgraphs(nodes):
 def yield_upstream_nodes(node, visited_nodes=None):
     """Yield all upstream nodes from given one.
 
-    Works by recursively yielding upstream nodes connected
-    with the given one.
+    Works by visiting the nodes connected to the inputs of
+    the given one, then the nodes connected to their inputs,
+    and so on. A stack of nodes to visit is used instead of
+    recursion, so the depth of the graph isn't limited by the
+    recursion limit.
 
     Parameters
     ==========
@@ -383,39 +498,46 @@ def yield_upstream_nodes(node, visited_nodes=None):
     ### as visited by adding it to the corresponding set
     visited_nodes.add(node)
 
-    ### let's start the visit by yielding the node
-    yield node
+    ### create a stack of nodes to visit, starting with
+    ### the given one
+    nodes_to_visit = [node]
 
-    ### now let's visit each upstream node recursively,
-    ### that is, the ones we didn't visit yet
+    ### while there are nodes to visit, visit the last one
+    ### added to the stack
 
-    for input_socket in node.input_sockets:
+    while nodes_to_visit:
 
-        ## try retrieving the value of the socket's
-        ## 'parent' attribute, which, if exists,
-        ## should contain a reference to an output
-        ## socket which is the parent of the socket
-        ## (the output socket is from another node)
-        try:
-            parent_output_socket = input_socket.parent
+        node = nodes_to_visit.pop()
 
-        ## if such attribute doesn't exits, just pass
-        except AttributeError:
-            pass
+        ### let's start the visit by yielding the node
+        yield node
 
-        ## otherwise, reference the node of such
-        ## parent socket and visit it if not visited
-        ## already, by passing it to this same
-        ## function and yielding from it
-        ##
-        ## you must also pass along the set of visited
-        ## nodes, so that the function knows whether
-        ## a node has already been visited or not
+        ### now let's add each upstream node to the stack,
+        ### that is, the ones we didn't visit yet
+
+        for input_socket in node.input_sockets:
+
+            ## try retrieving the value of the socket's
+            ## 'parent' attribute, which, if exists,
+            ## should contain a reference to an output
+            ## socket which is the parent of the socket
+            ## (the output socket is from another node)
+            try:
+                parent_output_socket = input_socket.parent
+
+            ## if such attribute doesn't exits, just pass
+            except AttributeError:
+                pass
+
+            ## otherwise, reference the node of such
+            ## parent socket and, if not visited already,
+            ## mark it as visited and add it to the stack
 
-        else:
+            else:
 
-            parent_node = parent_output_socket.node
+                parent_node = parent_output_socket.node
 
-            if parent_node not in visited_nodes:
+                if parent_node not in visited_nodes:
 
-                yield from yield_upstream_nodes(parent_node, visited_nodes)
+                    visited_nodes.add(parent_node)
+                    nodes_to_visit.append(parent_node)
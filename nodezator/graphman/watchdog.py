@@ -0,0 +1,219 @@
+"""Facility for executing callables under a watchdog.
+
+Callables of nodes which have a timeout are called in worker processes
+supervised by the watchdog. If a callable doesn't finish in time, its
+worker process is killed, so a node stuck in an infinite loop doesn't
+hang the app. Worker processes are reused while they behave.
+
+The time is counted once the worker process receives the call, so
+starting the process doesn't count towards the timeout, but performing
+the setup of the call (like importing the node script) does.
+
+Just like the process pool, the worker processes use the 'spawn' start
+method and the callables and their arguments must be picklable.
+"""
+
+### standard library imports
+
+from multiprocessing import get_context
+
+from concurrent.futures import Future
+
+from threading import Thread
+
+
+### local imports
+
+from .processpool import serve_calls, CALL_RECEIVED
+
+from .exception import ExecutionTimeoutError
+
+
+
+### class definition
+
+class Watchdog:
+    """Calls callables in worker processes, killing the ones taking too long.
+
+    This class is instantiated only once in the end of the module
+    and its methods are aliased to be used wherever needed.
+    """
+
+    def __init__(self):
+        """Create support objects."""
+        self.context = get_context('spawn')
+
+        ### list of tuples containing a worker process not executing
+        ### any call, the connection used to communicate with it and
+        ### the generation of the worker
+        self.idle_workers = []
+
+        ### current generation of worker processes; it is increased
+        ### whenever the workers are shut down, so the ones which were
+        ### busy at the moment can be told apart and discarded once
+        ### they finish
+        self.generation = 0
+
+    def submit(self, function, args, timeout, setup=None):
+        """Call function with arguments in a worker process.
+
+        Returns a concurrent.futures.Future representing the result.
+        If the call doesn't finish within the timeout (in seconds), its
+        worker process is killed and the future gets an
+        ExecutionTimeoutError.
+
+        The setup, if given, is a tuple containing a function and
+        its arguments, called in the worker process before the call;
+        it counts towards the timeout as well.
+
+        The future is only set as running once the worker process
+        receives the call, so it can be cancelled until then.
+        """
+        future = Future()
+
+        Thread(
+            target=self.watch_call,
+            args=(future, setup, function, args, timeout),
+            daemon=True,
+        ).start()
+
+        return future
+
+    def watch_call(self, future, setup, function, args, timeout):
+        """Send call to worker process and wait for the result.
+
+        Executed in a dedicated thread for each call.
+        """
+        ### if the call was cancelled already, don't bother grabbing a
+        ### worker process (the future must still be notified, though)
+
+        if future.cancelled():
+
+            future.set_running_or_notify_cancel()
+            return
+
+        ### grab an idle worker or start a new one
+
+        try:
+            process, connection, generation = self.idle_workers.pop()
+
+        except IndexError:
+
+            generation = self.generation
+
+            connection, worker_connection = self.context.Pipe()
+
+            process = self.context.Process(
+                target=serve_calls,
+                args=(worker_connection,),
+                daemon=True,
+            )
+
+            process.start()
+            worker_connection.close()
+
+        ### send the call and wait for the result
+
+        try:
+
+            connection.send((setup, function, args))
+
+            ## wait for the worker process to receive the call (a new
+            ## worker process only does so once it finished starting)
+
+            connection.recv()
+
+            ## only now the call is considered running; if it was
+            ## cancelled in the meantime, discard the worker process,
+            ## since it is already performing the call
+
+            if not future.set_running_or_notify_cancel():
+
+                process.kill()
+                process.join()
+                connection.close()
+
+                return
+
+            ## start counting the time, which includes the setup
+
+            if not connection.poll(timeout):
+
+                raise ExecutionTimeoutError(
+                    f"callable didn't finish within {timeout} seconds,"
+                    " so its process was killed"
+                )
+
+            succeeded, value = connection.recv()
+
+        ### if the call didn't finish in time or the worker process
+        ### died/couldn't receive the call, discard the worker process
+
+        except Exception as err:
+
+            process.kill()
+            process.join()
+            connection.close()
+
+            if isinstance(err, EOFError):
+                err = RuntimeError("the worker process died unexpectedly")
+
+            ## the call may have been cancelled before the worker process
+            ## received it
+
+            if future.cancelled():
+                future.set_running_or_notify_cancel()
+
+            else:
+                future.set_exception(err)
+
+        ### otherwise, make the worker available again (unless the
+        ### workers were shut down in the meantime, in which case it is
+        ### discarded, since it may hold outdated node scripts) and set
+        ### the result
+
+        else:
+
+            if generation == self.generation:
+                self.idle_workers.append((process, connection, generation))
+
+            else:
+
+                connection.close()
+                process.join()
+
+            if succeeded:
+                future.set_result(value)
+
+            else:
+                future.set_exception(value)
+
+    def shutdown(self):
+        """Terminate idle worker processes.
+
+        Worker processes keep the node scripts they imported, so this
+        must be done whenever node scripts may have changed, like when
+        loading/reloading a file.
+
+        Workers executing calls at the moment are terminated as soon
+        as they finish them.
+        """
+        self.generation += 1
+
+        idle_workers = self.idle_workers
+
+        while idle_workers:
+
+            process, connection, _ = idle_workers.pop()
+
+            connection.close()
+            process.join()
+
+
+### instantiate watchdog and reference its relevant methods in the
+### module level, so they can be easily imported
+
+_ = Watchdog()
+
+submit_to_watchdog = _.submit
+shutdown_watchdog = _.shutdown
@@ -20,9 +20,11 @@ def get_clusters(self, *inflation):
     ### a rect
     cluster = [rects.pop()]
 
-    ### create a rectsman representing a rect of the
-    ### whole cluster
-    cluster_rect = self.__class__(cluster.__iter__)
+    ### create a rect representing the whole cluster, that
+    ### is, the union of its rects; it is updated as rects
+    ### join the cluster, instead of being recalculated from
+    ### all of them, so growing a cluster is cheap
+    cluster_rect = cluster[0].copy()
 
     ### keep checking for collisions while there are still
     ### rects
@@ -35,7 +37,7 @@ def get_clusters(self, *inflation):
 
         inflated = cluster_rect.inflate(*inflation)
 
-        result = inflated.collidelist([rect for rect in rects])
+        result = inflated.collidelist(rects)
 
         ## no collision;
         ##
@@ -48,6 +50,7 @@ def get_clusters(self, *inflation):
             yield cluster[:]
 
             cluster[:] = [rects.pop()]
+            cluster_rect = cluster[0].copy()
 
         ## collision detected;
         ##
@@ -56,7 +59,11 @@ def get_clusters(self, *inflation):
         ## of the cluster, so we append it to the
         ## cluster
         else:
-            cluster.append(rects.pop(result))
+
+            rect = rects.pop(result)
+
+            cluster.append(rect)
+            cluster_rect.union_ip(rect)
 
     ### if there's still rects in the cluster, yield it
     if cluster:
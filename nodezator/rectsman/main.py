@@ -17,6 +17,8 @@
 
 from functools import partialmethod
 
+from weakref import ref
+
 
 ### third-party import
 from pygame import Rect
@@ -53,8 +55,18 @@ def rect_property(self, rect):
         coordinates for the new RectsManager instance.
     """
     ### copy the rects manager and store its copy in the
-    ### same attribute
-    self._rects_man = RectsManager(self._rects_man._get_all_rects)
+    ### same attribute; the copy keeps caching its union if
+    ### the original did and also keeps notifying the
+    ### rects managers which contain it
+
+    rects_man = self._rects_man
+
+    self._rects_man = RectsManager(
+        rects_man._get_all_rects,
+        rects_man._cache_union,
+    )
+
+    self._rects_man._dependents = rects_man._dependents
 
     ### transfer topleft and size values of the received
     ### rect to the copy
@@ -125,11 +137,43 @@ class RectsManager(
     ### inject function to work as a method
     get_clusters = get_clusters
 
-    def __init__(self, get_all_rects):
-        """Store callable used to get all rect instances."""
+    def __init__(self, get_all_rects, cache_union=False):
+        """Store callable used to get all rect instances.
+
+        Parameters
+        ==========
+
+        get_all_rects (callable)
+            returns an iterable with the rects to be managed
+            (pygame.Rect instances or other rects managers).
+        cache_union (bool)
+            whether to keep the union rect between accesses
+            instead of computing it every time; check the
+            'union_rect' property and the 'invalidate_union'
+            method.
+        """
         ### store the callable to get all rects
         self._get_all_rects = get_all_rects
 
+        ### store controls for caching the union rect;
+        ###
+        ### the version is increased every time the rects
+        ### change, so the cached union is only valid while
+        ### the version stored with it is the current one;
+        ###
+        ### note that all attributes must be defined here,
+        ### since missing attributes are looked up in the
+        ### union rect (check the __getattr__ method)
+
+        self._cache_union = cache_union
+        self._version = 0
+        self._cached_union_data = None
+
+        ### map with weak references to rects managers
+        ### which contain this one and cache their unions,
+        ### so they can be notified when this one changes
+        self._dependents = {}
+
     ### TODO refactor method below
     @classmethod
     def from_iterable(cls, iterable):
@@ -139,7 +183,22 @@ def from_iterable(cls, iterable):
 
     @property
     def union_rect(self):
-        """Return union of all rects."""
+        """Return union of all rects.
+
+        If caching is enabled and the rects didn't change
+        since the union was last computed, a copy of the
+        cached union is returned instead.
+        """
+        ### return copy of cached union if it is still valid
+
+        cached_union_data = self._cached_union_data
+
+        if (
+            cached_union_data is not None
+            and cached_union_data[0] == self._version
+        ):
+            return cached_union_data[1].copy()
+
         ### separate first rect and remaining rects
         try:
             first_rect, *remaining_rects = self._get_all_rects()
@@ -154,9 +213,58 @@ def union_rect(self):
 
             raise RuntimeError(msg) from err
 
-        ### if everything goes ok, though, just return
-        ### the union of all rects
-        return first_rect.unionall(remaining_rects)
+        ### if everything goes ok, though, obtain the union
+        ### of all rects
+        union = first_rect.unionall(remaining_rects)
+
+        ### if caching is enabled, store a copy of the union
+        ### along with the current version and ask rects
+        ### managers among our rects to notify us of their
+        ### changes
+
+        if self._cache_union:
+
+            self._cached_union_data = self._version, union.copy()
+
+            reference = ref(self)
+
+            for rect in (first_rect, *remaining_rects):
+
+                if isinstance(rect, RectsManager):
+                    rect._dependents[id(self)] = reference
+
+        ### finally return the union
+        return union
+
+    def invalidate_union(self):
+        """Signal that rects changed, invalidating cached unions.
+
+        Operations performed through the rects manager call
+        this method automatically. It must only be called
+        when the rects are changed directly (rather than
+        through the rects manager) or when the rects
+        returned by the '_get_all_rects' callable change,
+        and only if the union is cached by this rects
+        manager or by one containing it.
+        """
+        self._version += 1
+
+        ### notify rects managers containing this one,
+        ### forgetting the ones which don't exist anymore
+
+        dependents = self._dependents
+
+        if dependents:
+
+            for key, reference in tuple(dependents.items()):
+
+                dependent = reference()
+
+                if dependent is None:
+                    del dependents[key]
+
+                else:
+                    dependent.invalidate_union()
 
     ### special context manager
 
@@ -184,6 +292,8 @@ def keep_rects_attrs(self, *attr_names):
             for name, value in zip(attr_names, backup[id(rect)]):
                 setattr(rect, name, value)
 
+        self.invalidate_union()
+
     ### some pygame.Rect API methods
 
     def copy(self):
@@ -221,6 +331,8 @@ def normalize(self):
         for rect in self._get_all_rects():
             rect.normalize()
 
+        self.invalidate_union()
+
     ## conditional tests
 
     def contains(self, *args):
@@ -102,6 +102,8 @@ def snap_rects_ip(
                 retrieve_pos_from,
             )
 
+        self.invalidate_union()
+
     ### TODO docstring, comment and doctests functions below
 
     def snap_rects_intermittently_ip(
@@ -188,6 +190,7 @@ def snap_rects_intermittently_ip(
                 retrieve_pos_from,
             )
 
+        self.invalidate_union()
         self.topleft = backed_up_topleft
 
     def lay_rects_like_table_ip(
@@ -317,7 +320,10 @@ def lay_rects_like_table_ip(
 
             next_cell_pos = getattr(cell_rect, intercell_pos_from)
 
-        ### restore our topleft
+        ### signal the change in the rects and restore our
+        ### topleft
+
+        self.invalidate_union()
         self.topleft = backed_up_topleft
 
     def snap_rects_to_points_ip(
@@ -336,6 +342,7 @@ def snap_rects_to_points_ip(
         ):
             setattr(rect, attr_name, point)
 
+        self.invalidate_union()
         self.topleft = backed_up_topleft
 
 
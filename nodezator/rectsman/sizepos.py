@@ -33,10 +33,39 @@ def move_ip(self, *args):
         Such integers may be negative as well and they
         represent distances in pixels in 2d space, in
         x and y axes, respectively.
+
+        If the union rect is cached and still valid, it is
+        moved as well, instead of being invalidated.
         """
+        ### check whether union is cached and valid
+
+        cached_union_data = self._cached_union_data
+
+        is_cache_valid = (
+            cached_union_data is not None
+            and cached_union_data[0] == self._version
+        )
+
+        ### move rects
+
         for rect in self._get_all_rects():
             rect.move_ip(*args)
 
+        ### signal the change and, if the cached union was
+        ### valid, replace it by a moved copy
+        ###
+        ### (all rects are moved by the same amount, so the
+        ### union is moved by that amount as well)
+
+        self.invalidate_union()
+
+        if is_cache_valid:
+
+            self._cached_union_data = (
+                self._version,
+                cached_union_data[1].move(*args),
+            )
+
     def inflate(self, *args):
         """Return the inflated/deflated union rect.
 
@@ -153,6 +182,9 @@ def inflate_ip(self, *args):
                 rect.centerx = union.centerx + center_dx
                 rect.centery = union.centery + center_dy
 
+            ### signal the change in the rects
+            self.invalidate_union()
+
             ### break out of the loop earlier if the
             ### size difference is too small
 
@@ -68,6 +68,12 @@
     "SOCKET_DETECTION_GRAPHICS": "reaching_hands",
     "DETECTION_DISTANCE": 150,
     "GRASPING_DISTANCE": 75,
+    "INCREMENTAL_EXECUTION": False,
+    "BACKGROUND_EXECUTION": False,
+    "PROFILE_EXECUTION": False,
+    "RESULT_CACHE_MAX_SIZE": 1024,
+    "EXECUTION_WORKERS": 1,
+    "EXECUTION_TIMEOUT": 0,
 }
 
 
@@ -230,3 +236,16 @@ def update_socket_detection_graphics(graphics_string_key):
 
     else:
         APP_REFS.gm.reference_socket_detection_graphics()
+
+
+### function for updating execution-related preferences
+
+def update_execution_pref(key, value):
+
+    USER_PREFS[key] = value
+
+    try:
+        save_pyl(USER_PREFS, CONFIG_FILEPATH)
+
+    except Exception:
+        USER_LOGGER.exception("Error while saving user preferences.")
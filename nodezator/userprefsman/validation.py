@@ -30,6 +30,15 @@
     'baseball_elements_and_eyes': "Baseball elements and eyes",
 }
 
+ORDERED_EXECUTION_WORKERS = (1, 2, 4, 8, 16)
+
+## maximum sizes of the result cache, in megabytes
+ORDERED_RESULT_CACHE_MAX_SIZES = (256, 512, 1024, 2048, 4096, 8192)
+
+## maximum number of seconds node callables may take to execute (0 means
+## there's no timeout)
+ORDERED_EXECUTION_TIMEOUTS = (0, 10, 30, 60, 300, 600)
+
 KEY_ERROR_FORMATTER = ("{!r} key not present in user preferences").format
 
 
@@ -102,6 +111,42 @@ def validate_prefs_data(prefs_data):
             " 'GRASPING_DISTANCE' key"
         )
 
+    ### execution settings (optional, so configurations saved by previous
+    ### versions still validate)
+
+    ## booleans
+
+    for key in (
+        'INCREMENTAL_EXECUTION',
+        'BACKGROUND_EXECUTION',
+        'PROFILE_EXECUTION',
+    ):
+
+        if key in prefs_data and not isinstance(prefs_data[key], bool):
+            raise TypeError(f"{repr(key)} key must be 'bool'")
+
+    ## integers >= 1
+
+    for key in ('EXECUTION_WORKERS', 'RESULT_CACHE_MAX_SIZE'):
+
+        if key in prefs_data:
+
+            value = prefs_data[key]
+
+            if not isinstance(value, int) or not value >= 1:
+                raise TypeError(f"{repr(key)} key must be 'int' >= 1")
+
+    ## integers >= 0
+
+    key = 'EXECUTION_TIMEOUT'
+
+    if key in prefs_data:
+
+        value = prefs_data[key]
+
+        if not isinstance(value, int) or not value >= 0:
+            raise TypeError(f"{repr(key)} key must be 'int' >= 0")
+
     ### available languages
 
     lang_key = "LANGUAGE"
@@ -10,7 +10,7 @@
 
 from ..userprefsman.main import USER_PREFS, TEMP_FILE_SWAP
 
-from ..appinfo import NATIVE_FILE_EXTENSION
+from ..appinfo import NATIVE_FILE_EXTENSION, PARENT_SOCKETS_KEY
 
 from ..dialog import (
     create_and_show_dialog,
@@ -770,6 +770,14 @@ def save_data(self):
         Support method for the save methods self.save() and
         self.save_as().
         """
+        ### the data of the socket trees is kept indexed by the graph
+        ### manager while editing, so we turn it back into the format
+        ### used in the native file before saving
+
+        APP_REFS.data[PARENT_SOCKETS_KEY] = (
+            APP_REFS.gm.get_parent_sockets_data()
+        )
+
         save_pyl(APP_REFS.data, APP_REFS.source_path)
 
     def reload(self):
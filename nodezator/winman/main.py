@@ -177,6 +177,13 @@ def __init__(self):
         ### set flag indicating whether the mouse is clicked
         self.clicked_mouse = False
 
+        ### set controls to skip drawing in the 'loaded_file'
+        ### state when the screen doesn't change
+
+        self.loaded_file_redraw_needed = True
+        self.last_drawn_frame_index = None
+        self.last_screen_state = None
+
         ### create background obj
         self.background = Object2D(rect=Rect(0, 0, 0, 0))
 
@@ -31,13 +31,20 @@
 
 from ..recentfile import get_recent_files
 
-from ..userprefsman.main import USER_PREFS, update_socket_detection_graphics
+from ..userprefsman.main import (
+    USER_PREFS,
+    update_socket_detection_graphics,
+    update_execution_pref,
+)
 
 from ..userprefsman.generalform import edit_user_preferences
 
 from ..userprefsman.socketdetectionform import edit_socket_detection_settings
 
 from ..userprefsman.validation import (
+    ORDERED_EXECUTION_WORKERS,
+    ORDERED_RESULT_CACHE_MAX_SIZES,
+    ORDERED_EXECUTION_TIMEOUTS,
     ORDERED_SOCKET_DETECTION_GRAPHICS,
     SOCKET_DETECTION_GRAPHICS_KEY_TO_NAME_MAP,
 )
@@ -66,6 +73,23 @@
 
 
 
+### constant
+
+EXECUTION_TIMEOUT_HELP = (
+    "The execution timeout is the maximum number of seconds each node"
+    " from a node script may take to execute. Nodes taking longer are"
+    " stopped and the execution is cancelled. Node scripts may define"
+    " their own timeouts, which take precedence."
+    "\n\n"
+    "In order to be stopped, such nodes are executed in separate"
+    " processes (except async ones). Because of that, their outputs"
+    " must be picklable (pygame surfaces, for instance, aren't) and"
+    " changes they make to their inputs aren't seen by other nodes."
+    " Nodes whose inputs can't be pickled are executed without the"
+    " timeout."
+)
+
+
 ### class definition
 
 
@@ -322,8 +346,20 @@ def create_menubar(self):
 
                 file_children_data.insert(index, command_data)
 
+            # insert command to export concurrent version of the
+            # graph as python (it has no shortcut)
+
+            file_children_data.insert(
+                10,
+                {
+                    "label": "Export as concurrent python",
+                    "icon": "python",
+                    "command": APP_REFS.ea.export_as_concurrent_python,
+                },
+            )
+
             # also insert separator
-            file_children_data.insert(10, {"label": "----"})
+            file_children_data.insert(11, {"label": "----"})
 
             ## Add new "Edit" top menu with different
             ## commands related to edition
@@ -415,6 +451,168 @@ def create_menubar(self):
                         "command": (APP_REFS.gm.execute_with_custom_stdout),
                         "icon": "execute_with_text",
                     },
+                    {
+                        "label": "Profiling",
+                        "children": [
+                            {
+                                "widget": "checkbutton",
+                                "label": "Profile execution",
+                                "get_callable": (
+                                    partial(
+                                        USER_PREFS.__getitem__,
+                                        'PROFILE_EXECUTION',
+                                    )
+                                ),
+                                "set_callable": (
+                                    partial(
+                                        update_execution_pref,
+                                        'PROFILE_EXECUTION',
+                                    )
+                                ),
+                            },
+                            {"label": "------"},
+                            {
+                                "label": "View profiling report",
+                                "command": APP_REFS.ea.view_profiling_report,
+                            },
+                            {
+                                "label": "Export profiling report",
+                                "command": APP_REFS.ea.export_profiling_report,
+                            },
+                        ],
+                    },
+                    {
+                        "label": "Execution settings",
+                        "children": [
+                            {
+                                "widget": "checkbutton",
+                                "label": "Incremental execution",
+                                "get_callable": (
+                                    partial(
+                                        USER_PREFS.__getitem__,
+                                        'INCREMENTAL_EXECUTION',
+                                    )
+                                ),
+                                "set_callable": (
+                                    partial(
+                                        update_execution_pref,
+                                        'INCREMENTAL_EXECUTION',
+                                    )
+                                ),
+                            },
+                            {
+                                "widget": "checkbutton",
+                                "label": "Background execution",
+                                "get_callable": (
+                                    partial(
+                                        USER_PREFS.__getitem__,
+                                        'BACKGROUND_EXECUTION',
+                                    )
+                                ),
+                                "set_callable": (
+                                    partial(
+                                        update_execution_pref,
+                                        'BACKGROUND_EXECUTION',
+                                    )
+                                ),
+                            },
+                            {
+                                "label": "Worker threads",
+                                "children": [
+                                    {
+                                        'widget': 'radiobutton',
+                                        'label_value_pairs': [
+                                            (str(number), number)
+                                            for number
+                                            in ORDERED_EXECUTION_WORKERS
+                                        ],
+                                        'get_callable': (
+                                            partial(
+                                                USER_PREFS.__getitem__,
+                                                'EXECUTION_WORKERS',
+                                            )
+                                        ),
+                                        'set_callable': (
+                                            partial(
+                                                update_execution_pref,
+                                                'EXECUTION_WORKERS',
+                                            )
+                                        ),
+                                    },
+                                ],
+                            },
+                            {
+                                "label": "Execution timeout (separate processes)",
+                                "children": [
+                                    {
+                                        'widget': 'radiobutton',
+                                        'label_value_pairs': [
+                                            (
+                                                (
+                                                    f"{number} seconds"
+                                                    if number
+                                                    else "No timeout"
+                                                ),
+                                                number,
+                                            )
+                                            for number
+                                            in ORDERED_EXECUTION_TIMEOUTS
+                                        ],
+                                        'get_callable': (
+                                            partial(
+                                                USER_PREFS.__getitem__,
+                                                'EXECUTION_TIMEOUT',
+                                            )
+                                        ),
+                                        'set_callable': (
+                                            partial(
+                                                update_execution_pref,
+                                                'EXECUTION_TIMEOUT',
+                                            )
+                                        ),
+                                    },
+                                    {"label": "------"},
+                                    {
+                                        "label": "About execution timeouts",
+                                        "command": partial(
+                                            create_and_show_dialog,
+                                            EXECUTION_TIMEOUT_HELP,
+                                            level_name='info',
+                                        ),
+                                    },
+                                ],
+                            },
+                            {
+                                "label": "Result cache size",
+                                "children": [
+                                    {
+                                        'widget': 'radiobutton',
+                                        'label_value_pairs': [
+                                            (f"{number} MB", number)
+                                            for number
+                                            in ORDERED_RESULT_CACHE_MAX_SIZES
+                                        ],
+                                        'get_callable': (
+                                            partial(
+                                                USER_PREFS.__getitem__,
+                                                'RESULT_CACHE_MAX_SIZE',
+                                            )
+                                        ),
+                                        'set_callable': (
+                                            partial(
+                                                update_execution_pref,
+                                                'RESULT_CACHE_MAX_SIZE',
+                                            )
+                                        ),
+                                    },
+                                ],
+                            },
+                            {
+                                "label": "Purge result cache",
+                                "command": APP_REFS.gm.purge_result_cache,
+                            },
+                        ],
+                    },
                 ],
             }
 
@@ -32,6 +32,10 @@ class BoxSelectionState:
 
     def box_selection_event_handling(self):
         """Get and respond to events."""
+        ### objects don't change in this state, so the spatial
+        ### index can be used
+        APP_REFS.ea.keep_spatial_index()
+
         for event in SERVICES_NS.get_events():
 
             ### QUIT
@@ -97,8 +101,13 @@ def box_selection_keyboard_input_handling(self):
         ## scroll
 
         if x_direction or y_direction:
+
             APP_REFS.ea.scroll_on_direction(x_direction, y_direction)
 
+            ## apply the scrolling to all objects right away, since
+            ## objects outside the screen may be selected by the box
+            APP_REFS.ea.align_objects()
+
     ### update
 
     def box_selection_update(self):
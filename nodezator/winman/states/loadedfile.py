@@ -50,7 +50,9 @@
 
 ### local imports
 
-from ...pygamesetup import SERVICES_NS
+from ...pygamesetup import SERVICES_NS, SCREEN_RECT
+
+from ...pygamesetup.constants import GENERAL_NS
 
 from ...config import APP_REFS
 
@@ -70,8 +72,39 @@ class LoadedFileState:
 
     def loaded_file_event_handling(self):
         """Get and respond to events."""
+        ### objects only change in response to some of the events
+        ### below, so the spatial index can be used unless such
+        ### events are handled
+        APP_REFS.ea.keep_spatial_index()
+
         for event in SERVICES_NS.get_events():
 
+            ### events other than mouse motion may change what is
+            ### shown on the screen, so it must be drawn again
+            ### (check loaded_file_draw())
+
+            if event.type != MOUSEMOTION:
+                self.loaded_file_redraw_needed = True
+
+            ### apply any pending scrolling to all objects before
+            ### handling events which may require the position of
+            ### objects outside the screen (that is, all events
+            ### but scrolling with the mouse wheel and mouse
+            ### motion, which is handled further below);
+            ###
+            ### since these events may also change objects, the
+            ### spatial index is discarded as well
+
+            if (
+                event.type in (KEYDOWN, KEYUP)
+                or (
+                    event.type in (MOUSEBUTTONDOWN, MOUSEBUTTONUP)
+                    and event.button in (1, 3)
+                )
+            ):
+                APP_REFS.ea.align_objects()
+                APP_REFS.ea.discard_spatial_index()
+
             ### QUIT
 
             if event.type == QUIT:
@@ -390,13 +423,14 @@ def loaded_file_on_mouse_click(self, event):
         ### check objects on screen for collision
 
         gm = APP_REFS.gm
+        ea = APP_REFS.ea
 
         for obj in chain(
             self.switches,
-            gm.text_blocks.get_on_screen(),
-            gm.nodes.get_on_screen(),
-            gm.preview_toolbars.get_on_screen(),
-            gm.preview_panels.get_on_screen(),
+            ea.get_on_screen(gm.text_blocks),
+            ea.get_on_screen(gm.nodes),
+            ea.get_on_screen(gm.preview_toolbars),
+            ea.get_on_screen(gm.preview_panels),
         ):
 
             if obj.rect.collidepoint(mouse_pos):
@@ -456,6 +490,10 @@ def loaded_file_on_mouse_motion(self, event):
 
             self.clicked_mouse = False
 
+            ## commands from the menubar may need the position of
+            ## all objects, so apply any pending scrolling to them
+            APP_REFS.ea.align_objects()
+
             raise SwitchLoopException(self.menubar)
 
         ### iterate over objects to check whether any of
@@ -476,7 +514,7 @@ def loaded_file_on_mouse_motion(self, event):
         # grab and populate a list of nodes that are on the screen
 
         nodes_on_screen = APP_REFS.gm.nodes_on_screen
-        nodes_on_screen.extend(APP_REFS.gm.nodes.get_on_screen())
+        nodes_on_screen.extend(APP_REFS.ea.get_on_screen(APP_REFS.gm.nodes))
 
         # create a variable to hold the object if we find it
         obj_to_move = None
@@ -485,7 +523,7 @@ def loaded_file_on_mouse_motion(self, event):
 
         for obj in chain(
             nodes_on_screen,
-            APP_REFS.gm.text_blocks.get_on_screen(),
+            APP_REFS.ea.get_on_screen(APP_REFS.gm.text_blocks),
         ):
 
             if (
@@ -506,6 +544,10 @@ def loaded_file_on_mouse_motion(self, event):
             ## set the flag to False
             obj.mouse_click_target = False
 
+            ## apply any pending scrolling to all objects, since
+            ## selected objects outside the screen are moved as well
+            APP_REFS.ea.align_objects()
+
             ## move object considering it is an target of a
             ## click and drag action
             APP_REFS.ea.move_from_click_and_drag(obj)
@@ -534,6 +576,11 @@ def loaded_file_on_mouse_motion(self, event):
             ## we are dragging the mouse
             self.clicked_mouse = False
 
+            ## the operations below may need the position of objects
+            ## outside the screen, so apply any pending scrolling to
+            ## all objects
+            APP_REFS.ea.align_objects()
+
             ## obtain a bitmask which you'll use to check
             ## the state of modifier keys along the method
             bitmask = SERVICES_NS.get_pressed_mod_keys()
@@ -589,13 +636,14 @@ def loaded_file_on_mouse_release(self, event):
         ### check different groups of objects for collision
 
         gm = APP_REFS.gm
+        ea = APP_REFS.ea
 
         for obj in chain(
             self.switches,
-            gm.text_blocks.get_on_screen(),
-            gm.nodes.get_on_screen(),
-            gm.preview_toolbars.get_on_screen(),
-            gm.preview_panels.get_on_screen(),
+            ea.get_on_screen(gm.text_blocks),
+            ea.get_on_screen(gm.nodes),
+            ea.get_on_screen(gm.preview_toolbars),
+            ea.get_on_screen(gm.preview_panels),
         ):
 
             if obj.rect.collidepoint(mouse_pos):
@@ -642,8 +690,8 @@ def loaded_file_on_right_mouse_release(self, event):
         ### respective method if so and returning
 
         for obj in chain(
-            APP_REFS.gm.nodes.get_on_screen(),
-            APP_REFS.gm.text_blocks.get_on_screen(),
+            APP_REFS.ea.get_on_screen(APP_REFS.gm.nodes),
+            APP_REFS.ea.get_on_screen(APP_REFS.gm.text_blocks),
         ):
 
             if obj.rect.collidepoint(mouse_pos):
@@ -685,7 +733,53 @@ def loaded_file_update(self):
     ### draw
 
     def loaded_file_draw(self):
-        """Draw method for the 'loaded_file' state."""
+        """Draw method for the 'loaded_file' state.
+
+        Drawing is skipped if the screen would look just like in
+        the previous frame.
+        """
+        ### check whether drawing can be skipped
+
+        frame_index = GENERAL_NS.frame_index
+
+        screen_state = (
+            tuple(APP_REFS.ea.scrolling_amount),
+            SCREEN_RECT.size,
+            self.status_label.contents,
+        )
+
+        if (
+
+            ## when recording or playing sessions, the screen also
+            ## shows information which changes every frame
+            GENERAL_NS.mode_name == 'normal'
+
+            ## the screen was drawn (or its drawing skipped) by this
+            ## method in the previous frame, rather than by another
+            ## loop holder
+            and self.last_drawn_frame_index == frame_index - 1
+
+            ## no events which may change the screen were handled
+            ## and objects didn't change (check the SpatialIndexing
+            ## class in the editing/spatialindex.py module)
+
+            and not self.loaded_file_redraw_needed
+            and APP_REFS.ea.indexable_frame_index == frame_index
+
+            ## the canvas wasn't scrolled (for instance, with the
+            ## arrow keys), the window wasn't resized and the status
+            ## message didn't change
+            and self.last_screen_state == screen_state
+
+        ):
+            self.last_drawn_frame_index = frame_index
+            return
+
+        self.loaded_file_redraw_needed = False
+        self.last_drawn_frame_index = frame_index
+        self.last_screen_state = screen_state
+
+        ### draw
         self.background.draw()
 
         APP_REFS.ea.grid_drawing_behaviour()
@@ -146,8 +146,13 @@ def moving_object_keyboard_input_handling(self):
         ## scroll
 
         if x_direction or y_direction:
+
             APP_REFS.ea.scroll_on_direction(x_direction, y_direction)
 
+            ## apply the scrolling to all objects right away, since
+            ## the objects being moved may be outside the screen
+            APP_REFS.ea.align_objects()
+
     ### update
 
     def moving_object_update(self):
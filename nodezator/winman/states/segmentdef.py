@@ -91,8 +91,14 @@ def segment_definition_keyboard_input_handling(self):
         ## scroll
 
         if x_direction or y_direction:
+
             APP_REFS.ea.scroll_on_direction(x_direction, y_direction)
 
+            ## apply the scrolling to all objects right away, since
+            ## the socket from which the segment is being defined
+            ## may be outside the screen
+            APP_REFS.ea.align_objects()
+
         ## if nodes or mouse moved, look for nearby socket for connecting
 
         if x_direction or y_direction or any(get_relative_mouse_pos()):